@@ -0,0 +1,136 @@
+import argparse
+import datetime
+import json
+import threading
+import time
+
+import pandas as pd
+
+from stocks.fakeserver import FakePriceServer
+from stocks.fetch import FetchLayer
+from stocks.market import MarketData, period
+from stocks.providers import HttpProvider
+from stocks.store import PriceStore
+
+# --- 업스트림 요청 계층 벤치마크 ---
+# 사용 예:
+#   python -m benchmarks.bench_fetch
+#   python -m benchmarks.bench_fetch --sessions 64 --failure-rate 0.3 --latency 0.2
+# 로컬 가짜 시세 서버(stocks.fakeserver)를 띄우고, 여러 세션(스레드)이 동시에 같은 일괄 요청을 보내게 한 뒤
+# 요청 계층(합치기, 속도 제한, 재시도)이 있을 때와 없을 때 서버가 받은 요청 수와 실패한 세션 수를 비교함
+# 마지막으로 행이 오래된 상태에서 MarketData로 다시 요청해 기존 값을 바로 돌려주는지(stale-while-revalidate)도 잼
+# 저장 기간보다 완전히 앞선 기간을 요청했을 때 사이의 빈 구간까지 받아 저장 기간이 하나로 이어지는지도 확인함
+
+TICKERS = ["AAPL", "MSFT", "NVDA", "AMZN", "GOOGL", "META", "BRK-B", "TSM", "LLY", "JPM"]
+
+
+# sessions개 스레드가 동시에 fetch()를 한 번씩 부름 -> (걸린 시간, 실패한 세션 수)
+def _hammer(fetch, sessions):
+    failed = []
+    barrier = threading.Barrier(sessions)
+
+    def session():
+        barrier.wait()
+        try:
+            panel = fetch()
+        except Exception:
+            failed.append(1)
+            return
+        if panel.empty or panel.isna().all().any():
+            failed.append(1)
+
+    threads = [threading.Thread(target=session) for _ in range(sessions)]
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - began, len(failed)
+
+
+# 같은 일괄 요청을 세션들이 동시에 보냄 (요청 계층이 없으면 세션마다 업스트림 요청이 하나씩 나감)
+def bench_concurrent(args, layered):
+    server = FakePriceServer(latency=args.latency, failure_rate=args.failure_rate, seed=args.seed).start()
+    try:
+        provider = HttpProvider(server.url)
+        layer = FetchLayer(provider.fetch_panel, base_delay=0.05) if layered else None
+        fetch_panel = layer.fetch_panel if layer else provider.fetch_panel
+        start, end = period(args.years)
+        seconds, failed = _hammer(lambda: fetch_panel(TICKERS, start, end), args.sessions)
+        return {
+            "fetch_layer": layered,
+            "sessions": args.sessions,
+            "seconds": round(seconds, 3),
+            "failed_sessions": failed,
+            "server": server.stats(),
+            "client": layer.stats() if layer else None,
+        }
+    finally:
+        server.stop()
+
+
+def bench_stale(args):
+    server = FakePriceServer(latency=args.latency, seed=args.seed).start()
+    try:
+        market = MarketData(HttpProvider(server.url), store=PriceStore(":memory:", recheck_seconds=0), max_age=0)
+        start, end = period(args.years)
+        began = time.perf_counter()
+        market.load_panel(TICKERS, start, end)
+        cold = time.perf_counter() - began
+        time.sleep(0.01)
+        began = time.perf_counter()
+        market.load_panel(TICKERS, start, end)
+        stale = time.perf_counter() - began
+        return {"cold_seconds": round(cold, 4), "stale_seconds": round(stale, 4)}
+    finally:
+        server.stop()
+
+
+# 저장 기간(2024년 상반기)보다 완전히 앞선 2020년 상반기를 요청: 사이의 빈 구간까지 받아야 하고
+# 저장 기간이 한 번 이어진 뒤에는 같은 요청에 더 받을 구간이 없어야 함 (떨어진 구간을 합치면 빈 구간이 받은 것으로 잘못 기록됨)
+def check_disjoint_window():
+    def closes(tickers, start, end):
+        days = pd.bdate_range(start, end - datetime.timedelta(days=1), name="Date")
+        return pd.DataFrame({ticker: range(len(days)) for ticker in tickers}, index=days, dtype=float)
+
+    store = PriceStore(":memory:")
+    stored = (datetime.date(2024, 1, 1), datetime.date(2024, 7, 1))
+    requested = (datetime.date(2020, 1, 1), datetime.date(2020, 7, 1))
+    store.sync(TICKERS[:1], *stored, closes)
+    gaps = store.missing_ranges(TICKERS[0], *requested)
+    store.sync(TICKERS[:1], *requested, closes)
+    coverage = store.coverage(TICKERS[0])
+    return {
+        "gaps": [[a.isoformat(), b.isoformat()] for a, b in gaps],
+        "gaps_reach_coverage": gaps == [(requested[0], stored[0])],
+        "coverage": [coverage[0].isoformat(), coverage[1].isoformat()],
+        "gap_days_stored": len(store.read(TICKERS[0], requested[1], stored[0])) > 0,
+        "gaps_after_sync": len(store.missing_ranges(TICKERS[0], *requested)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="업스트림 요청 계층 벤치마크")
+    parser.add_argument("--sessions", type=int, default=32, help="동시에 요청하는 세션 수")
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.1, help="가짜 서버 응답 지연 (초)")
+    parser.add_argument("--failure-rate", type=float, default=0.3, help="가짜 서버가 503으로 실패할 확률")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    results = {
+        "without_layer": bench_concurrent(args, layered=False),
+        "with_layer": bench_concurrent(args, layered=True),
+        "stale_while_revalidate": bench_stale(args),
+        "disjoint_window": check_disjoint_window(),
+    }
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import argparse
+import json
+import statistics
+import time
+
+import folium
+import numpy as np
+
+from benchmarks.bench_map import BOUNDS, make_map_spots
+from travel.geo import GeoIndex
+from travel.maps import render_html, viewport_layer
+
+# --- 지도로 둘러보기 (공간 색인) 벤치마크 ---
+# 사용 예:
+#   python -m benchmarks.bench_geo
+#   python -m benchmarks.bench_geo --spots 10000 100000 1000000 -o geo.json
+# 가상 관광지(프랑스 안의 무작위 좌표)로 공간 색인(travel.geo)을 만들고, 확대 수준마다 무작위 화면(1000 x 500px) 범위로
+# 질의 시간, 돌려준 마커/클러스터 수, 그 레이어를 지도로 보낼 때의 HTML 크기를 잼
+# 카탈로그가 커져도 마커 수와 HTML 크기가 화면 크기 이상으로 늘지 않는지 확인하는 용도
+
+SEED = 0
+ZOOMS = [5, 7, 9, 11, 13, 15]
+WIDTH, HEIGHT = 1000, 500
+
+
+# 확대 수준 zoom에서 화면(WIDTH x HEIGHT px)에 보이는 무작위 범위 (남, 서, 북, 동)
+def random_view(zoom, rng):
+    degrees_per_px = 360.0 / (256 * 2**zoom)
+    half_lon, half_lat = WIDTH / 2 * degrees_per_px, HEIGHT / 2 * degrees_per_px * 0.7
+    lat = rng.uniform(*BOUNDS[0])
+    lon = rng.uniform(*BOUNDS[1])
+    return lat - half_lat, lon - half_lon, lat + half_lat, lon + half_lon
+
+
+def _html_bytes(m):
+    return len(render_html(m).encode("utf-8"))
+
+
+def _layer_bytes(layer):
+    m = folium.Map()
+    empty = _html_bytes(m)
+    layer.add_to(m)
+    return _html_bytes(m) - empty
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지도로 둘러보기 벤치마크")
+    parser.add_argument("--spots", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="가상 관광지 수")
+    parser.add_argument("--views", type=int, default=50, help="확대 수준별 무작위 화면 수")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(SEED)
+    results = []
+    for n in args.spots:
+        spots = make_map_spots(n, rng)
+        start = time.perf_counter()
+        index = GeoIndex.from_spots(spots)
+        for zoom in ZOOMS:
+            index.level(zoom)
+        row = {"spots": n, "build_seconds": round(time.perf_counter() - start, 3), "zooms": {}}
+        for zoom in ZOOMS:
+            times, markers = [], []
+            for _ in range(args.views):
+                view = random_view(zoom, rng)
+                began = time.perf_counter()
+                points, clusters = index.query(view, zoom)
+                times.append(time.perf_counter() - began)
+                markers.append(len(points) + len(clusters))
+            # 레이어 HTML은 만드는 데 오래 걸리므로 마지막 화면 하나만 잼 (빈 지도와의 차이)
+            layer_bytes = _layer_bytes(viewport_layer(spots, points, clusters))
+            row["zooms"][zoom] = {
+                "query_ms_median": round(statistics.median(times) * 1e3, 4),
+                "markers_median": int(statistics.median(markers)),
+                "markers_max": int(max(markers)),
+                "layer_kb_last": round(layer_bytes / 1e3, 1),
+            }
+        results.append(row)
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
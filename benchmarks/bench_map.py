@@ -0,0 +1,81 @@
+import argparse
+import json
+import time
+
+import folium
+import numpy as np
+
+from benchmarks.bench_search import make_spots
+from travel.maps import REGION_COLORS, cached_html, render_html, spot_map
+
+# --- 관광지 지도 렌더링 벤치마크 ---
+# 사용 예:
+#   python -m benchmarks.bench_map
+#   python -m benchmarks.bench_map --spots 1000 10000 50000 --legacy-max 10000 -o map.json
+# 가상 관광지(프랑스 안의 무작위 좌표)로 지도 HTML을 만들어
+# 예전 방식(관광지마다 folium.Marker)과 마커 클러스터 레이어(travel.maps)의 생성 시간과 HTML 크기를 비교하고
+# 캐시된 지도를 다시 가져오는 시간(지도와 무관한 재실행에 드는 비용)도 잼
+
+SEED = 0
+# 프랑스 본토를 대략 감싸는 범위 (위도, 경도)
+BOUNDS = ((42.3, 51.1), (-4.8, 8.2))
+
+
+def make_map_spots(n, rng):
+    spots = make_spots(n, rng)
+    lats = rng.uniform(*BOUNDS[0], size=n)
+    lons = rng.uniform(*BOUNDS[1], size=n)
+    for spot, lat, lon in zip(spots, lats, lons):
+        spot["lat"], spot["lon"] = float(lat), float(lon)
+    return spots
+
+
+# 예전 02 페이지와 같은 방식: 관광지마다 folium.Marker + 팝업 문자열
+def legacy_map(spots):
+    m = folium.Map(location=[46.603354, 1.888334], zoom_start=6)
+    for spot in spots:
+        folium.Marker(
+            location=[spot["lat"], spot["lon"]],
+            popup=f"<b>{spot['name']}</b><br>{spot['description'].split('.')[0]}",
+            tooltip=spot["name"],
+            icon=folium.Icon(color=REGION_COLORS.get(spot["region"], "purple")),
+        ).add_to(m)
+    return m
+
+
+def _measure(build):
+    start = time.perf_counter()
+    page = render_html(build())
+    return {"seconds": round(time.perf_counter() - start, 3), "html_mb": round(len(page.encode("utf-8")) / 1e6, 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="관광지 지도 렌더링 벤치마크")
+    parser.add_argument("--spots", type=int, nargs="+", default=[1_000, 10_000, 50_000], help="가상 관광지 수")
+    parser.add_argument("--legacy-max", type=int, default=10_000, help="예전 방식은 이 수까지만 잼 (느림)")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(SEED)
+    results = []
+    for n in args.spots:
+        spots = make_map_spots(n, rng)
+        row = {"spots": n, "cluster_layer": _measure(lambda: spot_map(spots, REGION_COLORS))}
+        if n <= args.legacy_max:
+            row["legacy_markers"] = _measure(lambda: legacy_map(spots))
+        cached_html(("bench", n), lambda: render_html(spot_map(spots, REGION_COLORS)))
+        start = time.perf_counter()
+        for _ in range(1000):
+            cached_html(("bench", n), lambda: None)
+        row["cached_rerun_us"] = round((time.perf_counter() - start) * 1e3, 3)
+        results.append(row)
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
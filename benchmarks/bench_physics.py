@@ -0,0 +1,265 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from physics.core import G, INTEGRATOR_NAMES, FreeFallModel, PhysicsEngine, free_fall_trajectory
+from physics.sweep import make_grid, simulate_fall_with_drag
+
+# --- 물리 계산 벤치마크 ---
+# 사용 예:
+#   python -m benchmarks.bench_physics -o bench.json
+#   python -m benchmarks.bench_physics --quick --compare bench.json
+# 각 항목마다 초당 스텝 수, 스텝당 메모리, 에너지 드리프트를 JSON으로 기록함
+# (스텝의 단위는 항목마다 다르며 "unit"에 적어 둠: 시간 단계, 물체×틱, 파라미터 조합)
+# 시간은 여러 번 반복해 가장 빠른 값과 중앙값을 남기고, 메모리는 tracemalloc으로 따로 한 번 측정함
+# "equal_error"에는 적분기마다 해석해와의 높이 오차가 ACCURACY_TARGET 이하가 되는 가장 빠른 설정을 남김
+
+SEED = 0
+ENGINE_TICKS = 500  # 엔진 벤치마크에서 진행할 틱 수
+ENGINE_DT = 0.01
+ACCURACY_TIME = 5.0  # 정확도 벤치마크의 시뮬레이션 시간 (s)
+ACCURACY_CHECKPOINTS = 10  # 해석해와 높이를 비교할 시각 수
+ACCURACY_TARGET = 1e-2  # 같은 오차 비교의 기준 (최대 높이 오차, m)
+
+
+def _measure(run, repeats):
+    times = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = run()
+        times.append(time.perf_counter() - start)
+
+    # 메모리는 시간 측정과 분리해서 측정 (tracemalloc은 실행을 느리게 만듦)
+    tracemalloc.start()
+    run()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, min(times), statistics.median(times), peak_bytes
+
+
+# 단일 물체 자유 낙하 해석해 (페이지 04의 커널)
+def bench_free_fall(step_counts, repeats):
+    for steps in step_counts:
+        trajectory, best, median, peak = _measure(
+            lambda: free_fall_trajectory(1.0, 50.0, G, 5.0, steps), repeats
+        )
+        total = trajectory["total_energy"]
+        yield {
+            "benchmark": "free_fall_trajectory",
+            "params": {"steps": steps},
+            "unit": "time step",
+            "best_seconds": best,
+            "median_seconds": median,
+            "steps_per_second": steps / best,
+            "peak_bytes": peak,
+            "bytes_per_step": peak / steps,
+            "energy_drift": float(np.abs(total - total[0]).max() / total[0]),
+        }
+
+
+# 다물체 엔진 (페이지 05의 엔진): 적분기와 물체 수를 바꿔 가며 ENGINE_TICKS 틱 진행
+def bench_engine(body_counts, integrators, repeats):
+    for integrator in integrators:
+        for n_bodies in body_counts:
+            def run():
+                rng = np.random.default_rng(SEED)
+                engine = PhysicsEngine(
+                    masses=rng.uniform(0.5, 2.0, n_bodies),
+                    heights=rng.uniform(1.0, 50.0, n_bodies),
+                    restitutions=rng.uniform(0.5, 0.9, n_bodies),
+                    integrator=integrator,
+                )
+                for _ in range(ENGINE_TICKS):
+                    engine.step(ENGINE_DT)
+                return engine
+
+            engine, best, median, peak = _measure(run, repeats)
+            body_steps = engine.n_steps * n_bodies
+            yield {
+                "benchmark": "physics_engine",
+                "params": {"integrator": integrator, "bodies": n_bodies, "ticks": ENGINE_TICKS, "dt": ENGINE_DT},
+                "unit": "body step",
+                "best_seconds": best,
+                "median_seconds": median,
+                "steps_per_second": body_steps / best,
+                "peak_bytes": peak,
+                "bytes_per_step": peak / body_steps,
+                "energy_drift": float(engine.energy_drift()),
+                "simulated_seconds": engine.time,
+            }
+
+
+# 튀어 오르는 물체들을 해석해(FreeFallModel)와 비교: 적분기와 시간 간격마다 최대 높이 오차와 시간을 잼
+# 충돌은 모든 적분기가 같은 방식(물체별 정확한 충돌 시각)으로 처리하므로 오차 차이는 비행 구간의 적분에서만 생김
+def bench_accuracy(n_bodies, dts, integrators, repeats):
+    rng = np.random.default_rng(SEED)
+    masses = rng.uniform(0.5, 2.0, n_bodies)
+    heights = rng.uniform(1.0, 50.0, n_bodies)
+    restitutions = rng.uniform(0.5, 0.9, n_bodies)
+    checkpoints = np.linspace(ACCURACY_TIME / ACCURACY_CHECKPOINTS, ACCURACY_TIME, ACCURACY_CHECKPOINTS)
+    exact = np.array([
+        FreeFallModel(m, h, restitution=e).evaluate(checkpoints)["height"]
+        for m, h, e in zip(masses, heights, restitutions)
+    ]).T
+
+    for integrator in integrators:
+        for dt in dts:
+            def run():
+                engine = PhysicsEngine(masses, heights, restitutions, integrator=integrator)
+                error = 0.0
+                for checkpoint, expected in zip(checkpoints, exact):
+                    while engine.time < checkpoint - 1e-12:
+                        engine.step(min(dt, checkpoint - engine.time))
+                    error = max(error, float(np.abs(engine.heights - expected).max()))
+                return engine, error
+
+            (engine, error), best, median, peak = _measure(run, repeats)
+            body_steps = engine.n_steps * n_bodies
+            yield {
+                "benchmark": "engine_accuracy",
+                "params": {"integrator": integrator, "bodies": n_bodies, "dt": dt, "duration": ACCURACY_TIME},
+                "unit": "body step",
+                "best_seconds": best,
+                "median_seconds": median,
+                "steps_per_second": body_steps / best,
+                "peak_bytes": peak,
+                "bytes_per_step": peak / body_steps,
+                "max_height_error": error,
+            }
+
+
+# 같은 오차 비교: 적분기마다 최대 높이 오차가 target 이하인 가장 빠른 설정 (없으면 None)
+def equal_error_summary(results, target=ACCURACY_TARGET):
+    summary = {}
+    for r in results:
+        if r["benchmark"] != "engine_accuracy":
+            continue
+        name = r["params"]["integrator"]
+        best = summary.get(name)
+        if r["max_height_error"] <= target and (best is None or r["best_seconds"] < best["best_seconds"]):
+            best = {"dt": r["params"]["dt"], "best_seconds": r["best_seconds"], "max_height_error": r["max_height_error"]}
+        summary[name] = best
+    return {"target_height_error": target, "integrators": summary}
+
+
+# 공기 저항 스윕 커널 (페이지 06의 계산, 프로세스 풀 없이 한 프로세스에서)
+def bench_sweep(config_counts, repeats):
+    for n_configs in config_counts:
+        side = max(1, round(n_configs ** 0.5))
+        m, h, g, c = make_grid(np.linspace(0.5, 5.0, side), np.linspace(1.0, 100.0, side), [G], [0.1])
+        results, best, median, peak = _measure(lambda: simulate_fall_with_drag(m, h, g, c, "quadratic"), repeats)
+
+        # 공기 저항 계수가 같으므로 해석해와 비교 가능: t = vt/g * arccosh(exp(g h / vt^2))
+        vt = results["terminal_velocity"]
+        exact_time = vt / g * np.arccosh(np.exp(g * h / vt**2))
+        yield {
+            "benchmark": "drag_sweep",
+            "params": {"configs": int(m.size), "drag_model": "quadratic"},
+            "unit": "config",
+            "best_seconds": best,
+            "median_seconds": median,
+            "steps_per_second": m.size / best,
+            "peak_bytes": peak,
+            "bytes_per_step": peak / m.size,
+            "impact_time_error": float(np.abs(results["impact_time"] - exact_time).max()),
+        }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _case_key(result):
+    return (result["benchmark"], json.dumps(result["params"], sort_keys=True))
+
+
+# 이전 결과 파일과 비교하여 항목별 속도 변화를 출력
+def print_comparison(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {_case_key(r): r for r in json.load(f)["results"]}
+    print(f"\n{'benchmark':<22} {'params':<70} {'speedup':>8}")
+    for r in results:
+        old = baseline.get(_case_key(r))
+        if old is None:
+            continue
+        speedup = r["steps_per_second"] / old["steps_per_second"]
+        print(f"{r['benchmark']:<22} {json.dumps(r['params'], sort_keys=True):<70} {speedup:>7.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_physics", description="물리 계산 벤치마크")
+    parser.add_argument("-o", "--output", help="결과 JSON 파일 (기본: 표준 출력)")
+    parser.add_argument("--quick", action="store_true", help="작은 크기만 빠르게 실행")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        step_counts, body_counts, config_counts = [1_000, 100_000], [1, 100], [100, 1_000]
+        accuracy_dts = [5e-2, 1e-2, 1e-3]
+        repeats = min(args.repeats, 2)
+    else:
+        step_counts = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+        body_counts = [1, 10, 100, 1_000, 10_000]
+        config_counts = [100, 1_000, 10_000]
+        accuracy_dts = [5e-2, 1e-2, 1e-3, 1e-4]
+        repeats = args.repeats
+
+    results = []
+    for bench in (
+        bench_free_fall(step_counts, repeats),
+        bench_engine(body_counts, INTEGRATOR_NAMES, repeats),
+        bench_accuracy(100, accuracy_dts, INTEGRATOR_NAMES, repeats),
+        bench_sweep(config_counts, repeats),
+    ):
+        for result in bench:
+            print(f"{result['benchmark']:<22} {json.dumps(result['params'], sort_keys=True):<70} "
+                  f"{result['steps_per_second']:>14,.0f} steps/s", file=sys.stderr, flush=True)
+            results.append(result)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeats": repeats,
+        },
+        "results": results,
+        "equal_error": equal_error_summary(results),
+    }
+    for name, best in report["equal_error"]["integrators"].items():
+        found = f"dt={best['dt']:g}, {best['best_seconds']:.3f} s" if best else "기준 오차에 도달하지 못함"
+        print(f"같은 오차 ({ACCURACY_TARGET:g} m) {name:<10} {found}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
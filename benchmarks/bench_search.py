@@ -0,0 +1,142 @@
+import argparse
+import json
+import statistics
+import time
+
+import numpy as np
+
+from travel.search import SpotIndex, initials
+
+# --- 관광지 검색 벤치마크 ---
+# 사용 예:
+#   python -m benchmarks.bench_search
+#   python -m benchmarks.bench_search --spots 200000 -o search.json
+# 무작위 한글 이름/지역/설명을 가진 가상 관광지로 색인을 만들고
+# 색인 생성 시간, 색인 크기, 검색어 종류(전체 이름, 입력 중, 오타, 초성, 설명 단어)별 검색 시간을 JSON으로 기록함
+# 비교용으로 예전 방식(목록 전체에서 부분 문자열 찾기)의 검색 시간도 잼
+# 한 글자 검색어가 이름/지역의 마지막 글자도 찾는지 확인하고("니" -> 지베르니, "부" -> 프랑스 서부), 틀리면 실패로 끝남
+
+SEED = 0
+# 이름 = 고유한 부분(흔한 구조의 음절 2~3개) + 흔한 접미어, 설명 = 흔한 낱말 몇 개
+CHOSEONG = "ㄱㄴㄷㄹㅁㅂㅅㅇㅈㅊㅋㅌㅍㅎ"
+SUFFIXES = ["", "", "", " 해수욕장", " 박물관", " 대성당", " 공원", " 궁전", " 광장", " 시장", " 전망대", " 언덕",
+            " 정원", " 항구", " 수도원", " 미술관", " 성", " 다리", " 마을", " 호수"]
+WORDS = ["아름다운", "해변", "역사", "유적지", "전망", "미술관", "시장", "와인", "산책로", "야경", "성당", "정원",
+         "중세", "골목", "축제", "요리", "강변", "등산", "사진", "가족"]
+REGIONS = ["파리", "남프랑스", "프랑스 서부", "알프스", "노르망디", "브르타뉴", "부르고뉴", "알자스"]
+# 한 글자 검색 확인용 (관광지, 검색어): 검색어가 이름이나 지역의 마지막 글자에만 있음
+SINGLE_SYLLABLE_CASES = [
+    ({"name": "지베르니", "region": "노르망디", "description": "모네의 정원과 연못."}, "니"),
+    ({"name": "몽생미셸", "region": "프랑스 서부", "description": "바다 위의 수도원."}, "부"),
+]
+SINGLE_SYLLABLE_SPOTS = 1000  # 한 글자 검색 확인에 쓰는 가상 관광지 수 (결과를 전부 받아 보므로 작게)
+
+
+# 받침이 없거나 흔한 받침(ㄴ, ㄹ, ㅁ, ㅇ)인 음절들
+def common_syllables():
+    choseong = [ord(c) for c in "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"]
+    cho = [choseong.index(ord(c)) for c in CHOSEONG]
+    return [chr(0xAC00 + (c * 21 + v) * 28 + t) for c in cho for v in (0, 4, 8, 13, 18, 20, 5) for t in (0, 4, 8, 16, 21)]
+
+
+SYLLABLES = common_syllables()
+
+
+def make_spots(n, rng):
+    lengths = rng.integers(2, 4, size=n)
+    syllables = rng.integers(0, len(SYLLABLES), size=int(lengths.sum()))
+    suffixes = rng.integers(0, len(SUFFIXES), size=n)
+    names, position = [], 0
+    for length, suffix in zip(lengths, suffixes):
+        names.append("".join(SYLLABLES[s] for s in syllables[position:position + length]) + SUFFIXES[suffix])
+        position += length
+    regions = rng.integers(0, len(REGIONS), size=n)
+    words = rng.integers(0, len(WORDS), size=(n, 6))
+    return [
+        {"name": name, "region": REGIONS[r], "description": " ".join(WORDS[w] for w in ws) + "이 있는 곳입니다."}
+        for name, r, ws in zip(names, regions, words)
+    ]
+
+
+# 이름의 고유한 부분에서 한 글자를 다른 글자로 바꿈
+def with_typo(name, rng):
+    i = int(rng.integers(0, len(name.split()[0])))
+    return name[:i] + SYLLABLES[int(rng.integers(0, len(SYLLABLES)))] + name[i + 1:]
+
+
+def make_queries(spots, rng, per_kind):
+    picks = [spots[int(i)]["name"] for i in rng.integers(0, len(spots), size=per_kind * 4)]
+    long_names = [name for name in picks if len(name.split()[0]) >= 3][:per_kind] or picks[:per_kind]
+    return {
+        "전체 이름": picks[:per_kind],
+        "입력 중 (앞 두 글자)": [name[:2] for name in picks[per_kind:2 * per_kind]],
+        "오타 한 글자": [with_typo(name, rng) for name in long_names],
+        "초성": [initials(name) for name in picks[2 * per_kind:3 * per_kind]],
+        "설명 단어": [WORDS[int(i)] for i in rng.integers(0, len(WORDS), size=per_kind)],
+    }
+
+
+# 한 글자 검색: 정해 둔 사례가 모두 찾아지는지, 무작위 관광지의 이름 마지막 음절로 그 관광지를 찾는 비율
+def check_single_syllable(rng, per_kind):
+    spots = make_spots(SINGLE_SYLLABLE_SPOTS, rng) + [spot for spot, _ in SINGLE_SYLLABLE_CASES]
+    index = SpotIndex(spots)
+    cases = {
+        f"{query} -> {spot['name']} ({spot['region']})": SINGLE_SYLLABLE_SPOTS + i in index.search(query, len(spots))
+        for i, (spot, query) in enumerate(SINGLE_SYLLABLE_CASES)
+    }
+    picks = rng.integers(0, SINGLE_SYLLABLE_SPOTS, size=per_kind)
+    found = [int(i) in index.search(spots[int(i)]["name"].split()[0][-1], len(spots)) for i in picks]
+    return {"cases": cases, "last_syllable_recall": round(float(np.mean(found)), 4)}
+
+
+def _timings(run, queries):
+    times = []
+    for query in queries:
+        start = time.perf_counter()
+        run(query)
+        times.append(time.perf_counter() - start)
+    return {
+        "median_ms": round(statistics.median(times) * 1e3, 4),
+        "p95_ms": round(float(np.percentile(times, 95)) * 1e3, 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="관광지 검색 벤치마크")
+    parser.add_argument("--spots", type=int, default=100_000, help="가상 관광지 수")
+    parser.add_argument("--queries", type=int, default=200, help="검색어 종류별 검색 횟수")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(SEED)
+    spots = make_spots(args.spots, rng)
+    start = time.perf_counter()
+    index = SpotIndex(spots)
+    build_seconds = time.perf_counter() - start
+
+    results = {
+        "spots": args.spots,
+        "build_seconds": round(build_seconds, 3),
+        "index_mb": round(index.nbytes / 1e6, 2),
+        "queries": {},
+    }
+    for kind, queries in make_queries(spots, rng, args.queries).items():
+        results["queries"][kind] = _timings(index.search, queries)
+    results["queries"]["예전 방식 (부분 문자열 전체 탐색)"] = _timings(
+        lambda q: [s for s in spots if q.lower() in s["name"].lower() or q.lower() in s["region"].lower()],
+        [spots[int(i)]["name"] for i in rng.integers(0, len(spots), size=min(args.queries, 20))],
+    )
+    results["single_syllable"] = check_single_syllable(rng, args.queries)
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    failed = [case for case, ok in results["single_syllable"]["cases"].items() if not ok]
+    if failed:
+        raise SystemExit(f"한 글자 검색 확인 실패: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
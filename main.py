@@ -1,9 +1,18 @@
 import streamlit as st
 from datetime import date
+import logging
 import random
 
 st.set_page_config(page_title="MBTI 동물 추천 & 오늘의 운세", page_icon="✨")
 
+# 주식 페이지(03)의 기본 종목 주가를 백그라운드에서 미리 받아 둠 (프로세스마다 한 번)
+# 공급자 설정이 잘못되어 예열을 시작하지 못해도 이 페이지는 그대로 보여야 하므로 오류는 로그에만 남김
+try:
+    from stocks.warmup import start_warmup
+    start_warmup()
+except Exception:
+    logging.getLogger(__name__).exception("주가 데이터 예열을 시작하지 못했습니다")
+
 # 🎉 환영 인사
 st.markdown("# 👋 만나서 반가워요!")
 st.markdown("당신의 성향과 오늘의 기분을 알아보는 시간입니다 🌈")
@@ -2,51 +2,99 @@ import streamlit as st
 import folium
 from streamlit_folium import st_folium
 
+from travel.catalog import shared_catalog
+from travel.images import shared_image_cache
+from travel.maps import FRANCE_CENTER, viewport_layer
+
 st.set_page_config(page_title="프랑스 지역별 관광 가이드", layout="wide")
 
 st.title("🇫🇷 프랑스 지역별 관광 가이드")
 
+# 지도로 둘러보기의 처음 범위 (남, 서, 북, 동)와 확대 수준
+BROWSE_BOUNDS = (41.0, -5.5, 51.5, 10.0)
+BROWSE_ZOOM = 6
+
+# 탭 이미지는 열 너비에 꽉 차게 보이므로 썸네일을 넓게 저장함
+COLUMN_IMAGE_WIDTH = 1200
+
 # 세션 상태 초기화
 if "wishlist" not in st.session_state:
     st.session_state["wishlist"] = []
 
-# ------------------------- 🔍 검색 기능 -------------------------
-search_query = st.text_input("🔍 도시 또는 관광지를 검색해보세요:")
-
-# 관광지 데이터 (검색 및 지도용)
-tourist_data = {
-    "에펠탑": {"location": [48.8584, 2.2945], "region": "파리", "desc": "파리의 상징, 야경이 아름다움."},
-    "루브르 박물관": {"location": [48.8606, 2.3376], "region": "파리", "desc": "모나리자, 세계 최대 미술관."},
-    "마르세유": {"location": [43.2965, 5.3698], "region": "남부", "desc": "항구도시, 깔레뜨 섬이 유명."},
-    "몽생미셸": {"location": [48.6361, -1.5115], "region": "노르망디", "desc": "해안 수도원, 유네스코 세계유산."},
-    "리옹": {"location": [45.75, 4.85], "region": "리옹", "desc": "미식의 도시, 앙페르의 고향."},
-    "지베르니": {"location": [49.0756, 1.5331], "region": "노르망디", "desc": "모네의 정원이 있는 예술마을."},
-}
-
-if search_query:
-    results = {k: v for k, v in tourist_data.items() if search_query.lower() in k.lower()}
-    if results:
-        for name, info in results.items():
-            st.subheader(f"📍 {name}")
-            st.markdown(f"**지역:** {info['region']}\n\n{info['desc']}")
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                st.map({"lat": [info["location"][0]], "lon": [info["location"][1]]})
-            with col2:
-                if st.button(f"🌟 찜하기 ({name})"):
-                    if name not in st.session_state["wishlist"]:
-                        st.session_state["wishlist"].append(name)
-                        st.success(f"{name}이(가) 찜 목록에 추가되었습니다.")
+# ------------------------- 🔍 검색 기능 / 🗺️ 지도로 둘러보기 -------------------------
+# 관광지 데이터 (검색 및 지도용) - travel/data/catalog.json을 프로세스마다 한 번 읽고 모든 세션이 함께 씀
+catalog = shared_catalog()
+tourist_data = catalog.guide_spots
+# 검색 색인 (이름/지역/설명, 오타와 초성 검색 가능)
+tourist_index = catalog.index("guide_spots")
+
+mode = st.radio("보기 방식", ["🔍 검색", "🗺️ 지도로 둘러보기"], horizontal=True, label_visibility="collapsed")
+
+if mode == "🔍 검색":
+    search_query = st.text_input("🔍 도시 또는 관광지를 검색해보세요:")
+
+    if search_query:
+        results = [tourist_data[i] for i in tourist_index.search(search_query)]
+        if results:
+            for info in results:
+                name = info["name"]
+                st.subheader(f"📍 {name}")
+                st.markdown(f"**지역:** {info['region']}\n\n{info['description']}")
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    st.map({"lat": [info["lat"]], "lon": [info["lon"]]})
+                with col2:
+                    if st.button(f"🌟 찜하기 ({name})"):
+                        if name not in st.session_state["wishlist"]:
+                            st.session_state["wishlist"].append(name)
+                            st.success(f"{name}이(가) 찜 목록에 추가되었습니다.")
+        else:
+            st.warning("검색 결과가 없습니다.")
+else:
+    # 지도를 움직이거나 확대할 때마다 st_folium이 돌려준 보이는 범위(bounds)와 확대 수준(zoom)으로
+    # 공간 색인(travel.geo)에서 그 안의 관광지만 꺼내 보냄 (많으면 칸별 클러스터로 묶음)
+    # -> 지도로 보내는 마커 수는 카탈로그 크기가 아니라 화면 크기로 정해짐
+    browse_spots = catalog.spots
+    geo_index = catalog.geo_index("spots")
+    view = st.session_state.get("browse_map") or {}
+    bounds = view.get("bounds") or {}
+    south_west, north_east = bounds.get("_southWest") or {}, bounds.get("_northEast") or {}
+    if south_west.get("lat") is not None and north_east.get("lat") is not None:
+        box = (south_west["lat"], south_west["lng"], north_east["lat"], north_east["lng"])
     else:
-        st.warning("검색 결과가 없습니다.")
+        box = BROWSE_BOUNDS
+    zoom = view.get("zoom") or BROWSE_ZOOM
+    center = view.get("center") or {}
+    center = (center["lat"], center["lng"]) if center.get("lat") is not None else tuple(FRANCE_CENTER)
+
+    points, clusters = geo_index.query(box, zoom)
+    st.caption(
+        f"화면 안 관광지 {len(points):,}곳, 클러스터 {len(clusters):,}개 (전체 {len(browse_spots):,}곳) - "
+        "지도를 움직이거나 확대해 보세요."
+    )
+    st_folium(
+        folium.Map(location=FRANCE_CENTER, zoom_start=BROWSE_ZOOM),
+        key="browse_map",
+        center=center,
+        zoom=zoom,
+        feature_group_to_add=viewport_layer(browse_spots, points, clusters),
+        returned_objects=["bounds", "zoom", "center"],
+        height=500,
+        use_container_width=True,
+    )
 
 # ------------------------- 🗂️ 지역별 탭 -------------------------
-tabs = st.tabs(["🏖️ 프랑스 남부", "🏙️ 주요 도시", "📚 문화 & 유적지"])
+# st.tabs는 보이지 않는 탭의 내용(이미지 포함)까지 매번 모두 그리므로 고른 탭 하나만 그림
+# 이미지는 원본 주소마다 한 번 받아 WebP 썸네일로 저장한 로컬 캐시에서 보여 줌 (travel.images)
+images = shared_image_cache()
+tab = st.radio("지역별 안내", ["🏖️ 프랑스 남부", "🏙️ 주요 도시", "📚 문화 & 유적지"], horizontal=True,
+               label_visibility="collapsed")
 
 # ---------- 남부 ----------
-with tabs[0]:
+if tab == "🏖️ 프랑스 남부":
     st.header("프랑스 남부 명소")
-    st.image("https://upload.wikimedia.org/wikipedia/commons/6/6f/Nice_vue_generale.jpg", caption="니스 해변", use_column_width=True)
+    st.image(images.source("https://upload.wikimedia.org/wikipedia/commons/6/6f/Nice_vue_generale.jpg", COLUMN_IMAGE_WIDTH),
+             caption="니스 해변", width="stretch")
     st.markdown("**마르세유, 니스, 아비뇽, 엑상프로방스** 등 풍부한 자연과 문화유산이 공존하는 지역입니다.")
     if st.button("🌟 마르세유 찜하기"):
         if "마르세유" not in st.session_state["wishlist"]:
@@ -54,29 +102,13 @@ with tabs[0]:
             st.success("마르세유를 찜 목록에 추가했어요!")
 
 # ---------- 주요 도시 ----------
-with tabs[1]:
+elif tab == "🏙️ 주요 도시":
     st.header("프랑스 주요 도시 & 위대한 과학자들")
 
-    cities = {
-        "파리": {
-            "image": "https://upload.wikimedia.org/wikipedia/commons/a/af/Tour_Eiffel_Wikimedia_Commons.jpg",
-            "scientist": "앙리 푸앵카레",
-            "achievement": "상대성이론의 수학적 기반을 마련한 수학자"
-        },
-        "리옹": {
-            "image": "https://upload.wikimedia.org/wikipedia/commons/6/60/Lyon-Vieux-Lyon.jpg",
-            "scientist": "앙드레 마리 앙페르",
-            "achievement": "전자기학의 창시자, '암페어' 단위의 유래"
-        },
-        "툴루즈": {
-            "image": "https://upload.wikimedia.org/wikipedia/commons/2/29/Toulouse_Garonne.jpg",
-            "scientist": "폴 사바티에",
-            "achievement": "노벨화학상 수상, 수소화 반응 개발"
-        },
-    }
+    cities = catalog.cities
 
     city_choice = st.selectbox("도시 선택", list(cities.keys()))
-    st.image(cities[city_choice]["image"], use_column_width=True)
+    st.image(images.source(cities[city_choice]["image"], COLUMN_IMAGE_WIDTH), width="stretch")
     st.markdown(f"""
 **{city_choice}**
 - 출신 과학자: {cities[city_choice]['scientist']}
@@ -88,29 +120,13 @@ with tabs[1]:
             st.success(f"{city_choice}를 찜 목록에 추가했어요!")
 
 # ---------- 유적지/문화 ----------
-with tabs[2]:
+elif tab == "📚 문화 & 유적지":
     st.header("문화와 유적지가 살아있는 도시들")
 
-    culture_places = {
-        "몽생미셸": {
-            "description": "해안 수도원, 유네스코 세계유산. 밀물 썰물 풍경이 신비롭다.",
-            "image": "https://upload.wikimedia.org/wikipedia/commons/6/6b/Mont_St_Michel_3%2C_Brittany%2C_France_-_July_2011.jpg",
-            "media": ["『몽생미셸의 비밀』", "영화 『마법의 성』"]
-        },
-        "지베르니": {
-            "description": "모네의 정원과 집이 있는 곳. 인상파의 상징.",
-            "image": "https://upload.wikimedia.org/wikipedia/commons/3/38/Giverny_house_and_garden.jpg",
-            "media": ["다큐 『빛의 화가 모네』", "모네의 수련 연작"]
-        },
-        "아를": {
-            "description": "고흐가 살았던 도시. 고대 로마 유적과 예술의 만남.",
-            "image": "https://upload.wikimedia.org/wikipedia/commons/f/f6/Arles_Amphithéâtre.jpg",
-            "media": ["책 『반 고흐의 편지들』", "고흐의 아를 연작"]
-        }
-    }
+    culture_places = catalog.culture_places
 
     pick = st.selectbox("도시 선택", list(culture_places.keys()))
-    st.image(culture_places[pick]["image"], caption=pick, use_column_width=True)
+    st.image(images.source(culture_places[pick]["image"], COLUMN_IMAGE_WIDTH), caption=pick, width="stretch")
     st.markdown(f"**{pick}**: {culture_places[pick]['description']}")
 
     if st.button("🎬 이 지역이 배경이 된 영화나 책을 추천해드릴까요?"):
@@ -127,6 +143,8 @@ with tabs[2]:
 with st.expander("🌟 내가 찜한 관광지 보기"):
     if st.session_state["wishlist"]:
         for item in st.session_state["wishlist"]:
-            st.write(f"✅ {item}")
+            # 검색/지도 관광지는 이름별 조회표에서 지역을 찾아 함께 보여 줌 (도시, 유적지는 이름만)
+            info = catalog.guide_by_name.get(item)
+            st.write(f"✅ {item} · {info['region']}" if info else f"✅ {item}")
     else:
         st.write("아직 찜한 장소가 없어요.")
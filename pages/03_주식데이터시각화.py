@@ -1,39 +1,99 @@
 import streamlit as st
-import yfinance as yf
 import datetime
+import os
 import pandas as pd
+import plotly.express as px
 
-st.set_page_config(page_title="글로벌 시가총액 Top10 비교", layout="wide")
-
-st.title("🌐 글로벌 시가총액 Top10 기업 주가 분석")
-st.caption("최근 3년간 주가 변화 시각화 및 성장 가능성 분석")
-
-# 시가총액 상위 10개 기업 티커
-top10_tickers = {
-    "Apple (AAPL)": "AAPL",
-    "Microsoft (MSFT)": "MSFT",
-    "NVIDIA (NVDA)": "NVDA",
-    "Amazon (AMZN)": "AMZN",
-    "Alphabet (GOOGL)": "GOOGL",
-    "Meta (META)": "META",
-    "Berkshire Hathaway (BRK-B)": "BRK-B",
-    "TSMC (TSM)": "TSM",
-    "Eli Lilly (LLY)": "LLY",
-    "JPMorgan Chase (JPM)": "JPM"
-}
+from stocks import analytics
+from stocks.market import period, shared_market_data
+from stocks.streaming import StreamSet, looping, replay_file, replay_panel
+from stocks.universe import BENCHMARK_TICKER, filter_universe, parse_universe, sp500_universe, ticker_of, top10_universe
+from stocks.warmup import start_warmup
+from utils.price_chart import downsampled_line_figure
+
+st.set_page_config(page_title="글로벌 기업 주가 비교", layout="wide")
+
+st.title("🌐 글로벌 기업 주가 분석")
+st.caption("최근 주가 변화 시각화 및 성장 가능성 분석")
+
+# 종목 목록 종류
+UNIVERSES = ["시가총액 Top10", "S&P 500", "직접 입력"]
 
-# 찜한 종목 저장
+# 차트 렌더링 방식
+CHART_MODES = ["WebGL (다운샘플링)", "기본 (Streamlit)"]
+
+# 찜한 종목 저장 ("이름 (티커)" 형식)
 if "favorites" not in st.session_state:
     st.session_state.favorites = set()
 
 # 기간 설정
-end = datetime.date.today()
-start = end - datetime.timedelta(days=365*3)
+years = st.sidebar.select_slider("📅 조회 기간 (년)", [1, 3, 5, 10, 20], 3)
+start, end = period(years)
+
+# 시세 공급자, 저장소, 종가 행렬은 프로세스 전체가 공유함 (stocks.market)
+# 공급자는 MARKET_DATA_PROVIDER 환경 변수로 고름 (yfinance / files / synthetic)
+market = shared_market_data()
+
+# 기본 종목을 백그라운드에서 미리 받아 두는 예열 스레드 (앱 시작 시 main.py에서 시작, 이 페이지로 바로 들어오면 여기서 시작)
+warmup = start_warmup()
 
-# 주가 데이터 가져오기
-@st.cache_data(ttl=3600)
 def load_data(ticker):
-    return yf.Ticker(ticker).history(start=start, end=end)['Close']
+    return market.load_series(ticker, start, end)
+
+def load_panel(tickers):
+    return market.load_panel(tickers, start, end)
+
+@st.cache_data(show_spinner="종목 목록을 불러오는 중...")
+def load_universe(source, text=""):
+    if source == "S&P 500":
+        return sp500_universe()
+    if source == "직접 입력":
+        return parse_universe(text)
+    if source == "공급자 전체 종목":
+        return parse_universe(" ".join(market.provider.tickers()))
+    return top10_universe()
+
+# --- 종목 목록 및 검색 (사이드바) ---
+universe_options = UNIVERSES + (["공급자 전체 종목"] if hasattr(market.provider, "tickers") else [])
+source = st.sidebar.radio("📚 종목 목록", universe_options)
+universe_text = ""
+if source == "직접 입력":
+    universe_text = st.sidebar.text_area(
+        "티커 목록 (쉼표/줄바꿈 구분) 또는 ticker,name,sector CSV", "AAPL, MSFT, NVDA, AMZN, GOOGL"
+    )
+try:
+    universe = load_universe(source, universe_text)
+except Exception as e:
+    st.sidebar.error(f"종목 목록을 불러오지 못했습니다: {e}")
+    universe = top10_universe()
+
+query = st.sidebar.text_input("🔎 종목 검색 (티커 또는 이름)")
+sector_options = sorted(s for s in universe["sector"].unique() if s)
+sectors = st.sidebar.multiselect("업종", sector_options) if sector_options else []
+candidates = filter_universe(universe, query, sectors)
+st.sidebar.caption(f"{len(candidates):,} / {len(universe):,}개 종목")
+
+# --- 차트 설정 (사이드바) ---
+chart_mode = st.sidebar.radio("📈 차트 렌더링", CHART_MODES)
+chart_width = st.sidebar.number_input("차트 폭 (픽셀, 계열마다 보낼 최대 점 수)", 200, 4000, 1200, 100)
+
+# 시계열 차트: WebGL 모드에서는 보기 구간을 잘라낸 뒤 계열마다 화면 폭만큼의 점만 보냄
+# 보기 구간을 좁히면 그 구간을 다시 다운샘플링하므로 확대할수록 원래 해상도에 가까워짐
+def show_chart(frame, key, y_label=None):
+    if isinstance(frame, pd.Series):
+        frame = frame.to_frame()
+    frame = frame.dropna(how="all")
+    if chart_mode == "기본 (Streamlit)" or frame.empty:
+        st.line_chart(frame)
+        return
+    first, last = frame.index[0].date(), frame.index[-1].date()
+    if first < last:
+        # 기간이 바뀌면 다른 위젯이 되도록 키에 기간을 넣음
+        lo, hi = st.slider("🔍 보기 구간", first, last, (first, last), key=f"{key}_window_{first}_{last}")
+        frame = frame.loc[pd.Timestamp(lo):pd.Timestamp(hi)]
+    fig, n_points = downsampled_line_figure(frame, chart_width, y_label=y_label)
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"계열마다 {n_points:,} / {len(frame):,}개 점 표시 · {frame.shape[1]}개 계열 (WebGL)")
 
 # --- 1. 기업 선택 및 분석 ---
 st.subheader("📌 기업 선택 및 개별 분석")
@@ -41,56 +101,88 @@ st.subheader("📌 기업 선택 및 개별 분석")
 col1, col2 = st.columns([2, 1])
 
 with col1:
-    selected = st.selectbox("🔍 분석할 기업을 선택하세요:", list(top10_tickers.keys()))
+    selected = st.selectbox("🔍 분석할 기업을 선택하세요:", candidates["label"].tolist())
 
 with col2:
-    if st.button("⭐ 찜하기"):
+    if st.button("⭐ 찜하기", disabled=selected is None):
         st.session_state.favorites.add(selected)
         st.success(f"{selected}를 찜했습니다!")
 
+if selected is None:
+    st.info("검색 조건에 맞는 종목이 없습니다.")
+
 # 주가 데이터 로드 및 시각화
 if selected:
-    ticker = top10_tickers[selected]
+    ticker = ticker_of(selected)
     series = load_data(ticker)
 
-    st.line_chart(series)
+    if series.empty:
+        error = market.matrix(start, end).error(ticker)
+        st.warning(f"{selected}의 주가 데이터를 받지 못했습니다." + (f" ({error})" if error else ""))
+    else:
+        show_chart(series.rename(selected), "price", "종가")
 
-    # 성장 분석
-    growth = (series.iloc[-1] - series.iloc[0]) / series.iloc[0] * 100
-    st.metric("📈 최근 3년 수익률", f"{growth:.2f}%")
+        # 성장 분석
+        growth = (series.iloc[-1] - series.iloc[0]) / series.iloc[0] * 100
+        st.metric(f"📈 최근 {years}년 수익률", f"{growth:.2f}%")
 
-    if growth > 150:
-        st.success("✅ 매우 높은 성장률로, 강력한 성장 가능성이 보입니다!")
-    elif growth > 50:
-        st.info("📊 안정적인 성장세입니다.")
-    else:
-        st.warning("📉 성장률이 낮아, 향후 주의가 필요합니다.")
+        if growth > 150:
+            st.success("✅ 매우 높은 성장률로, 강력한 성장 가능성이 보입니다!")
+        elif growth > 50:
+            st.info("📊 안정적인 성장세입니다.")
+        else:
+            st.warning("📉 성장률이 낮아, 향후 주의가 필요합니다.")
 
 # --- 2. 찜한 주식 비교 ---
 st.divider()
 st.subheader("📂 찜한 주식 비교")
 
+selected_favs = []
 if st.session_state.favorites:
     selected_favs = st.multiselect("📌 비교할 찜한 주식을 선택하세요:", list(st.session_state.favorites), default=list(st.session_state.favorites))
 
     if selected_favs:
-        compare_df = pd.DataFrame()
-        for fav_name in selected_favs:
-            ticker = top10_tickers[fav_name]
-            series = load_data(ticker)
-            compare_df[fav_name] = series
-
-        # 정규화
-        norm_df = compare_df.divide(compare_df.iloc[0]).multiply(100)
-        st.line_chart(norm_df)
-
-        # 수익률 테이블
-        st.markdown("📊 **3년간 수익률 요약**")
-        for name in selected_favs:
-            series = compare_df[name].dropna()
-            if not series.empty:
-                growth = (series.iloc[-1] - series.iloc[0]) / series.iloc[0] * 100
-                st.write(f"**{name}**: {growth:.2f}%")
+        # 종목 집합별로 미리 맞춰 둔 종가/정규화(종목마다 자기 첫 거래일 = 100) 표를 공용 캐시에서 꺼냄
+        # (찜을 빼거나 더하면 이미 만든 표의 열을 재활용함)
+        labels = {ticker_of(name): name for name in selected_favs}
+        aligned = market.aligned_panel(labels, start, end)
+        missing = [labels[t] for t in aligned.tickers if aligned.prices[t].isna().all()]
+        if missing:
+            st.warning(f"{', '.join(missing)}의 주가 데이터를 받지 못했습니다.")
+
+    if selected_favs and len(missing) < len(selected_favs):
+        compare_df = aligned.prices.rename(columns=labels)
+        norm_df = aligned.normalized.rename(columns=labels)
+        show_chart(norm_df, "compare", "첫 거래일 = 100")
+
+        # 수익률 및 위험 지표 테이블
+        st.markdown(f"📊 **{years}년간 수익률 요약**")
+        benchmark = load_data(BENCHMARK_TICKER)
+        benchmark = benchmark if not benchmark.empty else None
+        st.dataframe(analytics.summary(compare_df, benchmark).style.format("{:.2f}"), use_container_width=True)
+        if benchmark is None:
+            st.caption(f"벤치마크({BENCHMARK_TICKER}) 데이터를 받지 못해 베타는 생략했습니다.")
+
+        # 이동 구간 지표, 낙폭, 상관관계
+        window = st.slider("이동 구간 (거래일)", 20, 252, 63, key="rolling_window")
+        returns = analytics.daily_returns(compare_df)
+        tab_vol, tab_beta, tab_dd, tab_corr = st.tabs(["📉 이동 변동성", "📐 이동 베타", "🕳️ 낙폭", "🔗 상관관계"])
+        with tab_vol:
+            show_chart(analytics.volatility(returns, window) * 100, "volatility", "연 변동성 (%)")
+            st.caption(f"최근 {window}거래일 수익률의 연율화 표준편차 (%)")
+        with tab_beta:
+            if benchmark is not None:
+                show_chart(analytics.beta(returns, analytics.daily_returns(benchmark), window), "beta", "베타")
+                st.caption(f"최근 {window}거래일 동안 {BENCHMARK_TICKER} 대비 베타")
+            else:
+                st.info("벤치마크 데이터가 없어 베타를 계산할 수 없습니다.")
+        with tab_dd:
+            show_chart(analytics.drawdowns(compare_df) * 100, "drawdown", "낙폭 (%)")
+            st.caption("최고점 대비 하락률 (%)")
+        with tab_corr:
+            corr = analytics.correlation(returns)
+            fig = px.imshow(corr, text_auto=".2f", zmin=-1, zmax=1, color_continuous_scale="RdBu_r")
+            st.plotly_chart(fig, use_container_width=True)
 
         # 찜 제거 기능 (선택적)
         if st.button("🗑️ 찜한 종목 초기화"):
@@ -100,3 +192,119 @@ if st.session_state.favorites:
         st.info("비교할 종목을 하나 이상 선택해주세요.")
 else:
     st.info("아직 찜한 종목이 없습니다.")
+
+# --- 3. 실시간/재생 스트리밍 ---
+st.divider()
+st.subheader("📡 실시간 재생 스트리밍")
+st.caption("막대가 하나씩 들어올 때마다 종목별 고정 크기 링 버퍼와 지표를 갱신합니다 (메모리 일정)")
+
+STREAM_SOURCES = ["저장된 종가 재생", "녹화 파일 재생"]
+STREAM_METRIC_NAMES = {
+    "bars": "막대 수",
+    "last": "현재가",
+    "growth": "수익률 (%)",
+    "volatility": "이동 변동성 (%)",
+    "vwap": "VWAP (버퍼)",
+    "session_vwap": "VWAP (전체)",
+}
+
+if "stream_set" not in st.session_state:
+    st.session_state.stream_set = None
+    st.session_state.stream_feed = None
+    st.session_state.stream_running = False
+
+if st.toggle("스트리밍 모드", key="stream_on"):
+    s_col1, s_col2, s_col3 = st.columns(3)
+    with s_col1:
+        stream_source = st.radio("피드", STREAM_SOURCES, key="stream_source")
+        replay_path = ""
+        if stream_source == "녹화 파일 재생":
+            replay_path = st.text_input("녹화 파일 (time, ticker, price, volume 열의 CSV/Parquet)",
+                                        os.environ.get("STREAM_REPLAY_PATH", ""), key="stream_path")
+        stream_loop = st.checkbox("끝나면 처음부터 반복", value=True)
+    with s_col2:
+        stream_capacity = st.slider("버퍼 크기 (종목당 막대 수)", 100, 5000, 500, 100)
+        stream_window = st.slider("변동성 구간 (막대 수)", 5, 250, 30)
+    with s_col3:
+        bars_per_update = st.slider("갱신마다 읽을 막대 수", 1, 500, 20)
+        stream_interval = st.slider("갱신 간격 (초)", 0.2, 5.0, 1.0, 0.1)
+
+    b_col1, b_col2, b_col3 = st.columns(3)
+    if b_col1.button("▶️ 시작"):
+        if stream_source == "녹화 파일 재생":
+            if not os.path.exists(replay_path):
+                st.error(f"녹화 파일이 없습니다: {replay_path}")
+                st.stop()
+            make_feed = lambda: replay_file(replay_path)
+        else:
+            # 비교 중인 찜 종목(없으면 선택한 종목)의 저장된 종가를 날짜순으로 재생
+            names = selected_favs or ([selected] if selected else [])
+            replay_df = load_panel([ticker_of(name) for name in names]) if names else pd.DataFrame()
+            make_feed = lambda: replay_panel(replay_df)
+        st.session_state.stream_set = StreamSet(stream_capacity, stream_window)
+        st.session_state.stream_feed = looping(make_feed) if stream_loop else make_feed()
+        st.session_state.stream_running = True
+    if b_col2.button("⏸️ 정지"):
+        st.session_state.stream_running = False
+    if b_col3.button("⏹️ 초기화"):
+        st.session_state.stream_set = None
+        st.session_state.stream_feed = None
+        st.session_state.stream_running = False
+
+    # 이 부분만 stream_interval초마다 다시 실행됨 (페이지 전체는 다시 실행하지 않음)
+    @st.fragment(run_every=stream_interval if st.session_state.stream_running else None)
+    def stream_view():
+        streams = st.session_state.stream_set
+        if streams is None:
+            st.info("▶️ 시작을 누르면 재생을 시작합니다.")
+            return
+        if st.session_state.stream_running and st.session_state.stream_feed is not None:
+            if streams.consume(st.session_state.stream_feed, bars_per_update) == 0:
+                st.session_state.stream_running = False
+                st.success("피드를 끝까지 재생했습니다.")
+        if not streams.streams:
+            st.info("아직 받은 막대가 없습니다.")
+            return
+        metrics = streams.metrics().rename(columns=STREAM_METRIC_NAMES)
+        st.dataframe(metrics.style.format("{:,.2f}", na_rep="-"), use_container_width=True)
+        fig, _ = downsampled_line_figure(streams.frame(), chart_width, y_label="가격", height=400)
+        st.plotly_chart(fig, use_container_width=True)
+        state = "재생 중" if st.session_state.stream_running else "정지"
+        st.caption(f"{state} · 종목당 최대 {streams.capacity:,}개 막대 보관")
+
+    stream_view()
+
+# 공유 종가 행렬의 크기 (이번 실행에서 불러온 종목까지 포함)
+matrix = market.matrix(start, end)
+st.sidebar.caption(f"캐시된 종목: {len(matrix):,}개 ({matrix.nbytes / 1e6:.2f} MB, float32)")
+
+# 업스트림 요청 통계 (네트워크 공급자만): 합친 요청은 진행 중인 같은 요청의 결과를 함께 받은 횟수
+if market.fetcher is not None:
+    fetch = market.fetcher.stats()
+    st.sidebar.caption(
+        f"업스트림 요청 {fetch['requests']:,}회 · 합친 요청 {fetch['coalesced']:,}회 · "
+        f"재시도 {fetch['retries']:,}회 · 실패 {fetch['failures']:,}회"
+    )
+    # 일괄 요청은 성공했지만 따로 받다가 실패한 종목 (공급자가 집계하는 경우)
+    if hasattr(market.provider, "stats"):
+        provider_stats = market.provider.stats()
+        if provider_stats["failures"]:
+            st.sidebar.caption(f"종목별 요청 실패 {provider_stats['failures']:,}회 · 마지막 오류: {provider_stats['last_error']}")
+    errors = dict(matrix.errors)
+    if errors:
+        with st.sidebar.expander(f"⚠️ 받지 못한 종목 {len(errors)}개"):
+            st.dataframe(pd.DataFrame({"종목": list(errors), "오류": list(errors.values())}), hide_index=True)
+
+# 예열 상태
+def format_time(timestamp):
+    return datetime.datetime.fromtimestamp(timestamp).strftime("%H:%M:%S") if timestamp else "-"
+
+if warmup is not None:
+    info = warmup.snapshot()
+    n_ready = sum(status == "완료" for status in info["status"].values())
+    with st.sidebar.expander(f"🔥 데이터 예열: {info['state']} ({n_ready}/{len(info['status'])})"):
+        st.progress(n_ready / len(info["status"]))
+        st.caption(f"마지막 갱신 {format_time(info['last_refresh'])} · 다음 갱신 {format_time(info['next_refresh'])} · {info['runs']}회")
+        if info["last_error"]:
+            st.error(info["last_error"])
+        st.dataframe(pd.DataFrame({"종목": list(info["status"]), "상태": list(info["status"].values())}), hide_index=True)
@@ -2,8 +2,23 @@ import streamlit as st
 import numpy as np
 import plotly.express as px
 import pandas as pd
+import json
 from streamlit_elements import elements, html
 
+from physics.core import FreeFallModel
+from physics.ensemble import percentile_bands, sample_distribution, simulate_drag_ensemble
+from utils.cache import ByteLRUCache
+from utils.ensemble_view import distribution_input, percentile_band_figure
+
+PLOT_FRAME_CACHE_BYTES = 64 * 1024 * 1024  # 그래프용 궤적 캐시가 쓸 수 있는 최대 메모리 (64MB)
+PLOT_POINT_BUDGET = 2000  # 그래프에 보내는 최대 점 개수 (사건 시각 제외)
+# 그래프 점 수 선택지 (로그 눈금: 1-2-5 간격, 최대 PLOT_POINT_BUDGET)
+# 궤적은 해석해로 요청한 시각에서만 계산하고 사건 시각은 따로 정확히 넣으므로 화면에 보낼 점보다 촘촘히 계산할 필요가 없음
+PLOT_POINT_OPTIONS = [base * 10**exp for exp in range(1, 4) for base in (1, 2, 5) if 50 <= base * 10**exp <= PLOT_POINT_BUDGET]
+EVENT_NAMES = {"impact": "💥 바닥 충돌", "apex": "⛰️ 최고점", "rest": "🛑 정지"}
+ENSEMBLE_TIME_POINTS = 200  # 앙상블 그래프의 시각 개수
+ENSEMBLE_DRAG_MODELS = {"이차 저항 (F = -cv²)": "quadratic", "선형 저항 (F = -bv)": "linear"}
+
 st.set_page_config(layout="wide", page_title="역학적 에너지 보존 시뮬레이션")
 
 st.title("🚀 움직이는 물체 시뮬레이션: 역학적 에너지 보존")
@@ -33,49 +48,43 @@ mass = st.sidebar.slider("질량 (kg)", min_value=0.1, max_value=10.0, value=1.0
 initial_height = st.sidebar.slider("초기 높이 (m)", min_value=1.0, max_value=100.0, value=50.0, step=1.0)
 g = st.sidebar.slider("중력 가속도 (m/s²)", min_value=1.0, max_value=20.0, value=9.81, step=0.01)
 time_duration = st.sidebar.slider("시뮬레이션 시간 (s)", min_value=1.0, max_value=10.0, value=5.0, step=0.1)
-time_steps = st.sidebar.slider("시간 단계 수", min_value=50, max_value=500, value=200, step=10)
+n_points = st.sidebar.select_slider("표시 점 수", options=PLOT_POINT_OPTIONS, value=200,
+                                    help="그래프에 그리는 균일한 시각의 개수 (충돌, 최고점 같은 사건 시각은 항상 따로 포함됨)")
 ball_diameter = st.sidebar.slider("물체 지름 (px)", min_value=10, max_value=50, value=30, step=1)
+bounce = st.sidebar.checkbox("바닥에서 튀어 오르기", value=False)
+restitution = st.sidebar.slider("반발 계수", min_value=0.0, max_value=1.0, value=0.8, step=0.05) if bounce else None
 
 
 # --- 계산 ---
-dt = time_duration / time_steps
-time_points = np.linspace(0, time_duration, time_steps)
-
-heights = []
-velocities = []
-potential_energies = []
-kinetic_energies = []
-total_energies = []
-
-# 각 시간 단계에서의 높이와 속도 계산
-# 여기서는 시뮬레이션 데이터 계산이므로, 실제 물리 법칙에 맞게 계산
-for t in time_points:
-    # 자유 낙하 공식: h = h0 - 0.5 * g * t^2
-    # v = g * t
-    h_current = initial_height - 0.5 * g * t**2
-    v_current = g * t
-
-    # 물체가 땅에 닿았을 때 (높이가 0 이하)
-    if h_current < 0:
-        h_current = 0 # 높이를 0으로 고정
-        # 땅에 닿는 순간의 최종 속도 계산 (vf = sqrt(2gh0))
-        v_current = np.sqrt(2 * g * initial_height)
-
-    heights.append(h_current)
-    velocities.append(v_current)
-    potential_energies.append(mass * g * h_current)
-    kinetic_energies.append(0.5 * mass * v_current**2)
-    total_energies.append(mass * g * h_current + 0.5 * mass * v_current**2) # PE + KE
-
-# 데이터를 DataFrame으로 변환
-df = pd.DataFrame({
-    "시간 (s)": time_points,
-    "높이 (m)": heights,
-    "속도 (m/s)": velocities,
-    "위치 에너지 (J)": potential_energies,
-    "운동 에너지 (J)": kinetic_energies,
-    "총 역학 에너지 (J)": total_energies
-})
+# 충돌, 최고점 같은 사건 시각은 공식으로 정확히 구하고,
+# 그래프에 필요한 시각(균일한 시각 + 사건 시각)에서만 궤적을 계산함
+model = FreeFallModel(mass, initial_height, g, restitution)
+
+
+# 모든 세션이 함께 쓰는 그래프용 궤적 캐시 (메모리 한도가 있는 LRU)
+@st.cache_resource
+def get_plot_frame_cache():
+    return ByteLRUCache(max_bytes=PLOT_FRAME_CACHE_BYTES)
+
+# 퀴즈 버튼처럼 설정과 상관없는 위젯으로 재실행되면 캐시된 결과가 바로 반환됨
+def build_plot_frame(mass, initial_height, g, restitution, time_duration, n_points):
+    def compute():
+        trajectory = FreeFallModel(mass, initial_height, g, restitution).sample(time_duration, n_points)
+
+        # 데이터를 DataFrame으로 변환
+        return pd.DataFrame({
+            "시간 (s)": trajectory["time"],
+            "높이 (m)": trajectory["height"],
+            "속도 (m/s)": trajectory["velocity"],
+            "위치 에너지 (J)": trajectory["potential_energy"],
+            "운동 에너지 (J)": trajectory["kinetic_energy"],
+            "총 역학 에너지 (J)": trajectory["total_energy"]
+        })
+
+    key = (mass, initial_height, g, restitution, time_duration, n_points)
+    return get_plot_frame_cache().get_or_compute(key, compute)
+
+df = build_plot_frame(mass, initial_height, g, restitution, time_duration, n_points)
 
 # --- 시뮬레이션 화면 및 그래프 배치 ---
 st.markdown("---")
@@ -154,6 +163,21 @@ with col1:
             const initialHeightMeters = {initial_height}; // 사용자 설정 초기 높이 (m)
             const g = {g}; // 중력 가속도 (m/s^2)
             const simulationDuration = {time_duration}; // 시뮬레이션 전체 시간 (s)
+            // 비행 구간 [시작 시각, 시작 높이, 시작 속도(위쪽 양수)]와 마지막 충돌 시각 (서버에서 정확히 계산)
+            const segments = {json.dumps(np.column_stack([model.segment_starts, model.segment_heights, model.segment_speeds]).tolist())};
+            const endTime = {model.end_time};
+
+            // 경과 시간에 해당하는 비행 구간의 포물선 공식으로 높이 (m) 계산
+            function heightAt(t) {{
+                if (t >= endTime) return 0;
+                let seg = segments[0];
+                for (const s of segments) {{
+                    if (s[0] > t) break;
+                    seg = s;
+                }}
+                const tau = t - seg[0];
+                return Math.max(0, seg[1] + seg[2] * tau - 0.5 * g * tau * tau);
+            }}
 
             let startTime = null;
             let animationFrameId = window.lastAnimationFrameId || null; // 이전에 저장된 ID 사용
@@ -168,21 +192,16 @@ with col1:
                 if (startTime === null) startTime = timestamp;
                 const elapsed = (timestamp - startTime) / 1000; // 경과 시간 (초)
 
-                // 자유 낙하 공식: h_meters = 0.5 * g * t^2
-                let fallDistanceMeters = 0.5 * g * elapsed * elapsed;
-
-                // 물체가 실제 초기 높이 (m)를 넘어서는 것을 방지
-                if (fallDistanceMeters > initialHeightMeters) {{
-                    fallDistanceMeters = initialHeightMeters;
-                }}
+                // 초기 높이에서 현재 높이를 뺀 만큼 떨어진 상태
+                let fallDistanceMeters = initialHeightMeters - heightAt(elapsed);
 
                 // 미터 단위 낙하 거리를 픽셀 단위로 스케일링
                 // 중요한 부분: 미터 단위의 전체 높이 (initialHeightMeters)에 비례하여
                 // 픽셀 단위의 전체 낙하 가능 거리 (maxFallPixels)를 사용하여 스케일링
                 let currentTopPx = (fallDistanceMeters / initialHeightMeters) * maxFallPixels;
                 
-                // 물체가 땅에 닿으면 멈춤
-                if (currentTopPx >= maxFallPixels) {{
+                // 마지막으로 땅에 닿으면 멈춤
+                if (elapsed >= endTime) {{
                     currentTopPx = maxFallPixels;
                     ball.style.top = currentTopPx + 'px';
                     // 애니메이션 종료
@@ -228,6 +247,20 @@ fig_height_velocity = px.line(df, x="시간 (s)", y=["높이 (m)", "속도 (m/s)
 fig_height_velocity.update_layout(hovermode="x unified")
 st.plotly_chart(fig_height_velocity, use_container_width=True)
 
+# 주요 사건 (공식으로 구한 정확한 시각)
+st.subheader("주요 사건")
+st.metric("바닥에 처음 닿는 시각", f"{model.impact_time:.4f} s", f"충돌 속도 {model.impact_speed:.2f} m/s", delta_color="off")
+events = model.events(time_duration)
+if events:
+    st.dataframe(pd.DataFrame({
+        "사건": [EVENT_NAMES[e["event"]] for e in events],
+        "시간 (s)": [e["time"] for e in events],
+        "높이 (m)": [e["height"] for e in events],
+        "속력 (m/s)": [e["speed"] for e in events],
+    }), hide_index=True, use_container_width=True)
+else:
+    st.info("시뮬레이션 시간 안에 물체가 바닥에 닿지 않습니다.")
+
 st.markdown("""
 ---
 ### 시뮬레이션 설명
@@ -239,6 +272,60 @@ st.markdown("""
 
 st.markdown("---")
 
+# --- 앙상블 시뮬레이션 (Monte Carlo) ---
+st.header("🎲 앙상블 시뮬레이션 (Monte Carlo)")
+st.write("초기 조건이 조금씩 다른 수천 개의 낙하를 한꺼번에 계산하여, 한 줄 대신 백분위수 띠로 보여 줍니다.")
+
+# 구성원 전체를 한 번에 계산하고 백분위수만 남겨서 캐시 (퀴즈 위젯으로 재실행되면 바로 반환)
+@st.cache_data(max_entries=16)
+def run_ensemble(n_members, mass_spec, height_spec, g_spec, drag_spec, drag_model, time_duration, seed=0):
+    rng = np.random.default_rng(seed)
+    result = simulate_drag_ensemble(
+        sample_distribution(rng, mass_spec[0], n_members, minimum=0.1, **mass_spec[1]),
+        sample_distribution(rng, height_spec[0], n_members, minimum=0.1, **height_spec[1]),
+        sample_distribution(rng, g_spec[0], n_members, minimum=0.1, **g_spec[1]),
+        sample_distribution(rng, drag_spec[0], n_members, minimum=0.0, **drag_spec[1]),
+        drag_model,
+        np.linspace(0, time_duration, ENSEMBLE_TIME_POINTS),
+    )
+    return {
+        "time": result["time"],
+        "height": percentile_bands(result["height"]),
+        "total_energy": percentile_bands(result["total_energy"]),
+        "impact_time": result["impact_time"],
+    }
+
+if st.checkbox("앙상블 모드 켜기", key="ensemble_on"):
+    col1, col2 = st.columns(2)
+    with col1:
+        n_members = st.slider("구성원 수", min_value=100, max_value=20_000, value=2_000, step=100)
+        mass_spec = distribution_input("질량 (kg)", 0.1, 10.0, 1.0, 0.1, key="ens_mass")
+        height_spec = distribution_input("초기 높이 (m)", 1.0, 100.0, 50.0, 1.0, key="ens_height", default="정규 분포")
+    with col2:
+        g_spec = distribution_input("중력 가속도 (m/s²)", 1.0, 20.0, 9.81, 0.01, key="ens_g")
+        drag_model = ENSEMBLE_DRAG_MODELS[st.selectbox("공기 저항 모델", list(ENSEMBLE_DRAG_MODELS.keys()))]
+        drag_spec = distribution_input("공기 저항 계수", 0.0, 2.0, 0.0, 0.01, key="ens_drag")
+
+    ensemble = run_ensemble(n_members, mass_spec, height_spec, g_spec, drag_spec, drag_model, time_duration)
+
+    impact_times = ensemble["impact_time"][np.isfinite(ensemble["impact_time"])]
+    col1, col2 = st.columns(2)
+    if impact_times.size:
+        low, median, high = np.percentile(impact_times, [5, 50, 95])
+        col1.metric("충돌 시각 중앙값", f"{median:.3f} s", f"5~95%: {low:.3f} ~ {high:.3f} s", delta_color="off")
+    col2.metric("시간 안에 바닥에 닿은 비율", f"{impact_times.size / n_members * 100:.1f}%")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(percentile_band_figure(ensemble["time"], ensemble["height"], "시간에 따른 높이 분포", "높이 (m)"),
+                        use_container_width=True)
+    with col2:
+        st.plotly_chart(percentile_band_figure(ensemble["time"], ensemble["total_energy"], "시간에 따른 총 역학 에너지 분포",
+                                               "에너지 (J)", color="148, 103, 189"),
+                        use_container_width=True)
+
+st.markdown("---")
+
 # --- 간단한 퀴즈 ---
 st.header("🤔 역학적 에너지 보존 개념 확인 퀴즈")
 
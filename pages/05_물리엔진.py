@@ -1,11 +1,91 @@
 import streamlit as st
 import matplotlib.pyplot as plt
 import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import time
 
-# --- 물리 상수 설정 ---
-G = 9.81  # 중력 가속도 (m/s^2)
-MASS = 1.0   # 물체의 질량 (kg)
+from physics.core import PhysicsEngine
+from physics.ensemble import percentile_bands, run_engine_ensemble, sample_distribution
+from utils.ensemble_view import distribution_input, percentile_band_figure
+
+# 선택 가능한 적분기 (화면 표시 이름 -> 내부 이름)
+INTEGRATORS = {
+    "반암시적 오일러": "euler",
+    "속도 베를레 (Velocity Verlet)": "verlet",
+    "RK4": "rk4",
+}
+
+# 애니메이션 방식 (화면 표시 이름 -> 내부 이름)
+ANIMATION_MODES = {
+    "브라우저 재생 (Plotly)": "plotly",
+    "실시간 렌더링 (Matplotlib)": "live",
+}
+MAX_FRAMES = 300  # 브라우저 재생 모드에서 보내는 최대 프레임 수
+ENSEMBLE_TIME_POINTS = 200  # 앙상블 그래프의 시각 개수
+
+
+# --- 브라우저 재생용 애니메이션 그래프 ---
+# 미리 계산한 전체 궤적을 Plotly 프레임으로 묶어 한 번에 보냄
+# 프레임마다 물체 위치와 현재 시각의 에너지 표시점만 바뀌고, 에너지 곡선은 한 번만 전송됨
+def build_animation_figure(x_positions, frame_times, frame_heights,
+                           time_data, pe_data, ke_data, te_data,
+                           initial_height, initial_total_energy, frame_duration):
+    fig = make_subplots(rows=2, cols=1, subplot_titles=("물체의 운동", "에너지 전환"), vertical_spacing=0.12)
+    marker_size = 10 if len(x_positions) == 1 else max(3, 30 / np.sqrt(len(x_positions)))
+
+    def energies_at(t):
+        if not time_data:
+            return [initial_total_energy, 0.0, initial_total_energy]
+        i = min(np.searchsorted(time_data, t), len(time_data) - 1)
+        return [pe_data[i], ke_data[i], te_data[i]]
+
+    # trace 0: 물체 위치, trace 1~3: 에너지 곡선, trace 4: 현재 시각의 에너지 표시점
+    fig.add_trace(go.Scatter(x=x_positions, y=frame_heights[0], mode="markers",
+                             marker=dict(color="red", size=marker_size), name="물체"), row=1, col=1)
+    fig.add_trace(go.Scatter(x=time_data, y=pe_data, name="위치 에너지 (PE)", line=dict(color="blue")), row=2, col=1)
+    fig.add_trace(go.Scatter(x=time_data, y=ke_data, name="운동 에너지 (KE)", line=dict(color="green")), row=2, col=1)
+    fig.add_trace(go.Scatter(x=time_data, y=te_data, name="총 역학적 에너지 (TE)",
+                             line=dict(color="purple", dash="dash")), row=2, col=1)
+    fig.add_trace(go.Scatter(x=[0.0] * 3, y=energies_at(0.0), mode="markers",
+                             marker=dict(color=["blue", "green", "purple"], size=10), showlegend=False), row=2, col=1)
+
+    fig.frames = [
+        go.Frame(
+            name=f"{t:.3f}",
+            data=[go.Scatter(y=h), go.Scatter(x=[t] * 3, y=energies_at(t))],
+            traces=[0, 4],
+        )
+        for t, h in zip(frame_times, frame_heights)
+    ]
+
+    duration_ms = max(1, int(frame_duration * 1000))
+    play_args = dict(frame=dict(duration=duration_ms, redraw=False), transition=dict(duration=0), fromcurrent=True)
+    fig.update_layout(
+        height=800,
+        updatemenus=[dict(
+            type="buttons", direction="left", x=0, y=-0.08, xanchor="left", yanchor="top",
+            buttons=[
+                dict(label="▶ 재생", method="animate", args=[None, play_args]),
+                dict(label="⏸ 정지", method="animate",
+                     args=[[None], dict(frame=dict(duration=0, redraw=False), mode="immediate")]),
+            ],
+        )],
+        sliders=[dict(
+            x=0.15, y=-0.08, len=0.85, currentvalue=dict(prefix="시간 (s): "),
+            steps=[
+                dict(label=f"{t:.2f}", method="animate",
+                     args=[[f"{t:.3f}"], dict(frame=dict(duration=0, redraw=False), mode="immediate")])
+                for t in frame_times
+            ],
+        )],
+    )
+    fig.update_xaxes(range=[-1, 1], title_text="X (임의의 좌표)", row=1, col=1)
+    fig.update_yaxes(range=[0, initial_height * 1.1], title_text="높이 (m)", row=1, col=1)
+    fig.update_xaxes(range=[0, (time_data[-1] if time_data else 1) * 1.05], title_text="시간 (s)", row=2, col=1)
+    fig.update_yaxes(range=[0, initial_total_energy * 1.1], title_text="에너지 (J)", row=2, col=1)
+    return fig
+
 
 # --- Streamlit 페이지 설정 ---
 st.set_page_config(layout="wide", page_title="역학적 에너지 보존 시뮬레이션")
@@ -14,92 +94,167 @@ st.markdown("---") # 구분선 추가
 
 # --- 사이드바 설정 (사용자 입력) ---
 st.sidebar.header("시뮬레이션 설정")
-initial_height = st.sidebar.slider("초기 높이 (m)", 1.0, 100.0, 50.0, 1.0)
+ensemble_mode = st.sidebar.checkbox("앙상블 모드 (Monte Carlo)")
+if ensemble_mode:
+    # 초기 조건을 분포에서 뽑은 구성원들을 한꺼번에 계산하여 백분위수 띠로 보여 줌
+    n_members = st.sidebar.slider("구성원 수", 100, 10_000, 2_000, 100)
+    height_spec = distribution_input("초기 높이 (m)", 1.0, 100.0, 50.0, 1.0, key="ens_height",
+                                     container=st.sidebar, default="정규 분포")
+    mass_spec = distribution_input("질량 (kg)", 0.1, 10.0, 1.0, 0.1, key="ens_mass", container=st.sidebar)
+    restitution_spec = distribution_input("반발 계수", 0.0, 1.0, 0.7, 0.05, key="ens_restitution",
+                                          container=st.sidebar, default="균등 분포")
+else:
+    n_bodies = st.sidebar.slider("물체 수", 1, 2000, 1, 1)
+    initial_height = st.sidebar.slider("초기 높이 (m)", 1.0, 100.0, 50.0, 1.0)
+    mass_range = st.sidebar.slider("질량 범위 (kg)", 0.1, 10.0, (1.0, 1.0), 0.1)
+    restitution_range = st.sidebar.slider("반발 계수 범위", 0.0, 1.0, (0.0, 0.0), 0.05)
+max_time = st.sidebar.slider("최대 시뮬레이션 시간 (s)", 1.0, 30.0, 10.0, 0.5)
 time_step = st.sidebar.slider("시간 간격 (s)", 0.01, 0.1, 0.05, 0.01)
-animation_speed = st.sidebar.slider("애니메이션 속도 (배속)", 0.1, 5.0, 1.0, 0.1)
+integrator_name = st.sidebar.selectbox("적분 방법", list(INTEGRATORS.keys()))
+if not ensemble_mode:
+    animation_speed = st.sidebar.slider("애니메이션 속도 (배속)", 0.1, 5.0, 1.0, 0.1)
+    animation_mode = st.sidebar.radio("애니메이션 방식", list(ANIMATION_MODES.keys()))
 
 # 시뮬레이션 시작 버튼
 start_button = st.sidebar.button("시뮬레이션 시작")
 
+# --- 앙상블 실행 로직 ---
+if start_button and ensemble_mode:
+    st.subheader("앙상블의 높이 및 에너지 분포")
+
+    rng = np.random.default_rng(0)
+    engine = PhysicsEngine(
+        masses=sample_distribution(rng, mass_spec[0], n_members, minimum=0.1, **mass_spec[1]),
+        heights=sample_distribution(rng, height_spec[0], n_members, minimum=0.1, **height_spec[1]),
+        restitutions=np.minimum(
+            sample_distribution(rng, restitution_spec[0], n_members, minimum=0.0, **restitution_spec[1]), 1.0
+        ),
+        integrator=INTEGRATORS[integrator_name],
+    )
+    sample_times = np.linspace(0, max_time, ENSEMBLE_TIME_POINTS)
+
+    compute_start = time.perf_counter()
+    ensemble = run_engine_ensemble(engine, time_step, sample_times)
+    compute_time = time.perf_counter() - compute_start
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(percentile_band_figure(sample_times, percentile_bands(ensemble["height"]),
+                                               "시간에 따른 높이 분포", "높이 (m)"),
+                        use_container_width=True)
+    with col2:
+        st.plotly_chart(percentile_band_figure(sample_times, percentile_bands(ensemble["total_energy"]),
+                                               "시간에 따른 총 역학적 에너지 분포", "에너지 (J)", color="148, 103, 189"),
+                        use_container_width=True)
+
+    metric_cols = st.columns(4)
+    metric_cols[0].metric("정지한 구성원", f"{engine.at_rest.sum():,} / {n_members:,}")
+    metric_cols[1].metric("에너지 드리프트", f"{engine.energy_drift():.2e}")
+    metric_cols[2].metric("스텝 수", f"{engine.n_steps:,}")
+    metric_cols[3].metric("계산 시간", f"{compute_time * 1000:.1f} ms")
+
 # --- 시뮬레이션 실행 로직 ---
-if start_button:
+if start_button and not ensemble_mode:
     st.subheader("물체의 운동 및 에너지 전환 과정")
 
-    # 초기 조건 설정
-    current_height = initial_height
-    current_velocity = 0.0 # 자유 낙하이므로 초기 속도는 0
-    current_time = 0.0
+    # 초기 조건 설정 (물체가 여러 개면 높이, 질량, 반발 계수를 범위 안에서 고르게 뽑음)
+    rng = np.random.default_rng(0)
+    if n_bodies == 1:
+        heights = np.array([initial_height])
+    else:
+        heights = rng.uniform(1.0, initial_height, n_bodies)
+    engine = PhysicsEngine(
+        masses=rng.uniform(*mass_range, n_bodies),
+        heights=heights,
+        restitutions=rng.uniform(*restitution_range, n_bodies),
+        integrator=INTEGRATORS[integrator_name],
+    )
+    # 물체들을 X축 방향으로 나란히 배치
+    x_positions = np.linspace(-0.9, 0.9, n_bodies) if n_bodies > 1 else np.zeros(1)
+    initial_total_energy = engine.initial_total_energy
+    compute_time = 0.0 # 화면 그리기를 제외한 순수 계산 시간 (s)
+    live_mode = ANIMATION_MODES[animation_mode] == "live"
+
+    # 브라우저 재생 모드에서 전송할 프레임 (프레임 수는 MAX_FRAMES 이하로 제한)
+    frame_interval = max(time_step, max_time / MAX_FRAMES)
+    next_frame_time = frame_interval
+    frame_times = [0.0]
+    frame_heights = [engine.heights.copy()]
 
-    # 데이터 저장을 위한 리스트
+    # 데이터 저장을 위한 리스트 (모든 물체의 에너지 합)
     time_data = []
-    height_data = []
     potential_energy_data = []
     kinetic_energy_data = []
     total_energy_data = []
 
-    # Matplotlib Figure 및 Axes 설정
-    # 두 개의 서브플롯: 물체 위치 시각화, 에너지 그래프
-    fig, (ax_pos, ax_energy) = plt.subplots(2, 1, figsize=(10, 8))
-    fig.tight_layout(pad=3.0) # 서브플롯 간 여백 설정
-
-    # ax_pos: 물체 위치 시각화 (상단 플롯)
-    ax_pos.set_xlim(-1, 1) # 물체는 수직으로만 움직이므로 X축은 고정
-    ax_pos.set_ylim(0, initial_height * 1.1) # 초기 높이보다 약간 여유 있게 설정
-    ax_pos.set_xlabel("X (임의의 좌표)")
-    ax_pos.set_ylabel("높이 (m)")
-    ax_pos.set_title("물체의 운동")
-    # 물체를 나타내는 점 (빨간색 원)
-    point, = ax_pos.plot(0, current_height, 'o', color='red', markersize=10)
-    # 물체의 현재 높이와 속도를 표시할 텍스트
-    pos_text = ax_pos.text(0.05, 0.95, '', transform=ax_pos.transAxes, fontsize=10, verticalalignment='top')
-
-    # ax_energy: 에너지 그래프 시각화 (하단 플롯)
-    # 초기 에너지 값의 110%까지 Y축 범위 설정
-    ax_energy.set_ylim(0, MASS * G * initial_height * 1.1)
-    ax_energy.set_xlabel("시간 (s)")
-    ax_energy.set_ylabel("에너지 (J)")
-    ax_energy.set_title("에너지 전환")
-    # 각 에너지 라인 초기화
-    line_pe, = ax_energy.plot([], [], label="위치 에너지 (PE)", color='blue')
-    line_ke, = ax_energy.plot([], [], label="운동 에너지 (KE)", color='green')
-    line_te, = ax_energy.plot([], [], label="총 역학적 에너지 (TE)", color='purple', linestyle='--')
-    ax_energy.legend()
-    # 각 에너지 값을 표시할 텍스트
-    energy_text = ax_energy.text(0.05, 0.95, '', transform=ax_energy.transAxes, fontsize=10, verticalalignment='top')
-
-
-    # Streamlit에 Matplotlib 그래프를 표시할 Placeholder
-    st_plot_placeholder = st.pyplot(fig)
+    if live_mode:
+        # Matplotlib Figure 및 Axes 설정
+        # 두 개의 서브플롯: 물체 위치 시각화, 에너지 그래프
+        fig, (ax_pos, ax_energy) = plt.subplots(2, 1, figsize=(10, 8))
+        fig.tight_layout(pad=3.0) # 서브플롯 간 여백 설정
+
+        # ax_pos: 물체 위치 시각화 (상단 플롯)
+        ax_pos.set_xlim(-1, 1) # 물체는 수직으로만 움직이므로 X축은 고정
+        ax_pos.set_ylim(0, initial_height * 1.1) # 초기 높이보다 약간 여유 있게 설정
+        ax_pos.set_xlabel("X (임의의 좌표)")
+        ax_pos.set_ylabel("높이 (m)")
+        ax_pos.set_title("물체의 운동")
+        # 물체들을 나타내는 점 (빨간색 원), 물체가 많으면 점 크기를 줄임
+        marker_size = 10 if n_bodies == 1 else max(2, 10 / np.sqrt(n_bodies) * 3)
+        points, = ax_pos.plot(x_positions, engine.heights, 'o', color='red', markersize=marker_size, linestyle='')
+        # 물체의 현재 높이와 속도를 표시할 텍스트
+        pos_text = ax_pos.text(0.05, 0.95, '', transform=ax_pos.transAxes, fontsize=10, verticalalignment='top')
+
+        # ax_energy: 에너지 그래프 시각화 (하단 플롯)
+        # 초기 에너지 값의 110%까지 Y축 범위 설정
+        ax_energy.set_ylim(0, initial_total_energy * 1.1)
+        ax_energy.set_xlabel("시간 (s)")
+        ax_energy.set_ylabel("에너지 (J)")
+        ax_energy.set_title("에너지 전환")
+        # 각 에너지 라인 초기화
+        line_pe, = ax_energy.plot([], [], label="위치 에너지 (PE)", color='blue')
+        line_ke, = ax_energy.plot([], [], label="운동 에너지 (KE)", color='green')
+        line_te, = ax_energy.plot([], [], label="총 역학적 에너지 (TE)", color='purple', linestyle='--')
+        ax_energy.legend()
+        # 각 에너지 값을 표시할 텍스트
+        energy_text = ax_energy.text(0.05, 0.95, '', transform=ax_energy.transAxes, fontsize=10, verticalalignment='top')
+
+
+        # Streamlit에 Matplotlib 그래프를 표시할 Placeholder
+        st_plot_placeholder = st.pyplot(fig)
 
     # --- 시뮬레이션 루프 ---
-    while current_height > 0:
-        # 시간 경과에 따른 속도 업데이트 (중력 가속도 G 적용)
-        current_velocity += G * time_step
-        # 업데이트된 속도에 따라 높이 감소
-        current_height -= current_velocity * time_step
-
-        # 물체가 바닥(높이 0)에 닿으면 멈춤
-        if current_height < 0:
-            current_height = 0
-            current_velocity = 0 # 바닥에 닿으면 속도도 0이 됨
-
-        current_time += time_step
-
-        # 에너지 계산
-        potential_energy = MASS * G * current_height
-        kinetic_energy = 0.5 * MASS * current_velocity**2
+    # 모든 물체가 바닥에 정지하거나 최대 시간에 도달할 때까지 한 틱씩 전진
+    while not engine.all_at_rest() and engine.time < max_time:
+        step_start = time.perf_counter()
+        dt_taken = engine.step(time_step)
+        compute_time += time.perf_counter() - step_start
+
+        # 에너지 계산 (모든 물체의 합)
+        potential_energy = engine.potential_energies().sum()
+        kinetic_energy = engine.kinetic_energies().sum()
         total_energy = potential_energy + kinetic_energy
 
         # 데이터 추가
-        time_data.append(current_time)
-        height_data.append(current_height)
+        time_data.append(engine.time)
         potential_energy_data.append(potential_energy)
         kinetic_energy_data.append(kinetic_energy)
         total_energy_data.append(total_energy)
 
+        if not live_mode:
+            # 브라우저 재생 모드: 화면을 그리지 않고 프레임 시각마다 위치만 기록
+            if engine.time >= next_frame_time or engine.all_at_rest():
+                frame_times.append(engine.time)
+                frame_heights.append(engine.heights.copy())
+                next_frame_time += frame_interval
+            continue
+
         # Matplotlib 플롯 데이터 업데이트
-        point.set_ydata(current_height) # 물체 위치 업데이트
-        pos_text.set_text(f'높이: {current_height:.2f} m\n속도: {current_velocity:.2f} m/s')
+        points.set_ydata(engine.heights) # 물체 위치 업데이트
+        if n_bodies == 1:
+            pos_text.set_text(f'높이: {engine.heights[0]:.2f} m\n속도: {abs(engine.velocities[0]):.2f} m/s')
+        else:
+            pos_text.set_text(f'평균 높이: {engine.heights.mean():.2f} m\n정지한 물체: {engine.at_rest.sum()} / {n_bodies}')
 
         line_pe.set_data(time_data, potential_energy_data)
         line_ke.set_data(time_data, kinetic_energy_data)
@@ -113,12 +268,34 @@ if start_button:
         st_plot_placeholder.pyplot(fig)
 
         # 애니메이션 속도 조절을 위한 딜레이
-        time.sleep(time_step / animation_speed)
+        time.sleep(dt_taken / animation_speed)
 
-    st.success("시뮬레이션이 완료되었습니다! 물체가 바닥에 도달했습니다.")
+    if not live_mode:
+        # 전체 궤적을 한 번만 보내고 재생과 탐색은 브라우저에서 처리
+        st.plotly_chart(
+            build_animation_figure(
+                x_positions, frame_times, frame_heights,
+                time_data, potential_energy_data, kinetic_energy_data, total_energy_data,
+                initial_height, initial_total_energy, frame_interval / animation_speed,
+            ),
+            use_container_width=True,
+        )
+
+    if engine.all_at_rest():
+        st.success("시뮬레이션이 완료되었습니다! 모든 물체가 바닥에 정지했습니다.")
+    else:
+        st.warning("최대 시뮬레이션 시간에 도달하여 시뮬레이션을 종료했습니다.")
     st.markdown("---")
-    st.info(f"최종 높이: {current_height:.2f} m, 최종 속도: {current_velocity:.2f} m/s")
-    st.info(f"총 시뮬레이션 시간: {current_time:.2f} 초")
+    if n_bodies == 1:
+        st.info(f"최종 높이: {engine.heights[0]:.2f} m, 최종 속도: {abs(engine.velocities[0]):.2f} m/s")
+    st.info(f"정지한 물체: {engine.at_rest.sum()} / {n_bodies}, 총 바닥 충돌 횟수: {engine.bounce_counts.sum()}")
+    st.info(f"총 시뮬레이션 시간: {engine.time:.2f} 초")
+
+    # 적분기 성능 지표
+    metric_cols = st.columns(3)
+    metric_cols[0].metric("에너지 드리프트", f"{engine.energy_drift():.2e}")
+    metric_cols[1].metric("스텝 수", f"{engine.n_steps:,}")
+    metric_cols[2].metric("계산 시간", f"{compute_time * 1000:.1f} ms")
 
     # 시뮬레이션 결과 요약 그래프 (선택 사항)
     st.subheader("최종 에너지 변화 요약")
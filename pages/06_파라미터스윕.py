@@ -0,0 +1,97 @@
+import streamlit as st
+import numpy as np
+import plotly.express as px
+import os
+import time
+
+from physics.sweep import PARAMETER_COLUMNS, RESULT_COLUMNS, run_sweep
+
+st.set_page_config(layout="wide", page_title="자유 낙하 파라미터 스윕")
+
+st.title("🧪 자유 낙하 파라미터 스윕 (공기 저항 포함)")
+st.subheader("질량, 높이, 중력 가속도, 공기 저항 계수의 여러 조합을 한 번에 비교해 보세요!")
+
+st.markdown("""
+### 💡 공기 저항 모델
+* **선형 저항**: $F = -bv$ → 종단 속도 $v_t = \\frac{mg}{b}$
+* **이차 저항**: $F = -cv^2$ → 종단 속도 $v_t = \\sqrt{\\frac{mg}{c}}$
+
+공기 저항이 있으면 물체는 종단 속도보다 빨라지지 않고, 떨어지는 동안 역학적 에너지의 일부를 잃습니다.
+""")
+
+st.markdown("---")
+
+# --- 사용자 입력 ---
+DRAG_MODEL_NAMES = {"이차 저항 (F = -cv²)": "quadratic", "선형 저항 (F = -bv)": "linear"}
+
+st.sidebar.header("스윕 범위 설정")
+mass_range = st.sidebar.slider("질량 범위 (kg)", 0.1, 10.0, (0.5, 5.0), 0.1)
+mass_count = st.sidebar.slider("질량 개수", 1, 50, 10)
+height_range = st.sidebar.slider("초기 높이 범위 (m)", 1.0, 100.0, (10.0, 100.0), 1.0)
+height_count = st.sidebar.slider("높이 개수", 1, 50, 10)
+g_range = st.sidebar.slider("중력 가속도 범위 (m/s²)", 1.0, 20.0, (9.81, 9.81), 0.01)
+g_count = st.sidebar.slider("중력 가속도 개수", 1, 50, 1)
+drag_model_name = st.sidebar.selectbox("공기 저항 모델", list(DRAG_MODEL_NAMES.keys()))
+drag_range = st.sidebar.slider("공기 저항 계수 범위", 0.0, 2.0, (0.0, 0.5), 0.01)
+drag_count = st.sidebar.slider("공기 저항 계수 개수", 1, 50, 10)
+max_workers = st.sidebar.number_input("작업 프로세스 수", min_value=1, max_value=64, value=os.cpu_count() or 1)
+
+n_configs = mass_count * height_count * g_count * drag_count
+st.sidebar.info(f"총 조합 수: {n_configs:,}개")
+
+# 스윕 결과는 세션에 저장해 두어 그래프 옵션만 바꿀 때는 다시 계산하지 않음
+if st.sidebar.button("스윕 실행"):
+    drag_model = DRAG_MODEL_NAMES[drag_model_name]
+    with st.spinner(f"{n_configs:,}개 조합 계산 중..."):
+        start_time = time.perf_counter()
+        st.session_state.sweep_df = run_sweep(
+            np.linspace(*mass_range, mass_count),
+            np.linspace(*height_range, height_count),
+            np.linspace(*g_range, g_count),
+            np.linspace(*drag_range, drag_count),
+            drag_model=drag_model,
+            max_workers=max_workers,
+        )
+        st.session_state.sweep_elapsed = time.perf_counter() - start_time
+
+# --- 결과 ---
+if "sweep_df" in st.session_state:
+    df = st.session_state.sweep_df
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("계산한 조합 수", f"{len(df):,}")
+    col2.metric("계산 시간", f"{st.session_state.sweep_elapsed:.2f} s")
+    col3.metric("초당 조합 수", f"{len(df) / max(st.session_state.sweep_elapsed, 1e-9):,.0f}")
+
+    st.header("결과 히트맵")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        x_param = st.selectbox("X축 변수", PARAMETER_COLUMNS, index=3)
+    with col2:
+        y_param = st.selectbox("Y축 변수", PARAMETER_COLUMNS, index=1)
+    with col3:
+        result_column = st.selectbox("표시할 결과", RESULT_COLUMNS)
+
+    if x_param == y_param:
+        st.warning("X축과 Y축에는 서로 다른 변수를 선택해주세요.")
+    else:
+        # 나머지 변수들은 평균으로 묶어서 표시 (종단 속도가 무한대인 칸은 비워 둠)
+        pivot = (
+            df.replace([np.inf, -np.inf], np.nan)
+            .pivot_table(index=y_param, columns=x_param, values=result_column, aggfunc="mean")
+        )
+        fig_heatmap = px.imshow(
+            pivot,
+            origin="lower",
+            aspect="auto",
+            labels={"x": x_param, "y": y_param, "color": result_column},
+            title=f"{result_column} (나머지 변수는 평균)",
+            height=500,
+        )
+        st.plotly_chart(fig_heatmap, use_container_width=True)
+
+    st.header("결과 표")
+    st.dataframe(df, use_container_width=True)
+    st.download_button("CSV로 내려받기", df.to_csv(index=False).encode("utf-8-sig"), "sweep_results.csv", "text/csv")
+else:
+    st.info("사이드바에서 범위를 정한 뒤 '스윕 실행' 버튼을 눌러주세요.")
@@ -0,0 +1,155 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from physics.core import G, INTEGRATOR_NAMES, PhysicsEngine, free_fall_state
+from physics.sweep import DRAG_MODELS, iter_sweep_chunks, make_grid
+from physics.writers import OUTPUT_FORMATS, open_chunk_writer
+
+# --- Streamlit 없이 실행하는 배치 시뮬레이터 ---
+# 사용 예:
+#   python -m physics.cli trajectory --steps 100000000 -o trajectory.parquet
+#   python -m physics.cli engine --bodies 10000 --max-time 20 -o bounces.npz
+#   python -m physics.cli sweep --mass 0.1 10 100 --height 1 100 100 --drag 0 1 100 -o sweep.parquet
+# 결과는 조각 단위로 바로 파일에 쓰므로 메모리 사용량은 조각 크기로 제한됨
+
+
+def _log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+# argparse type: 1 이상의 정수만 받음 (0이나 음수면 사용법과 함께 오류 메시지를 출력하고 종료)
+def _positive_int(text):
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {text}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return value
+
+
+# 단일 물체 자유 낙하 해석해를 아주 많은 시간 단계로 계산
+def run_trajectory(args, writer):
+    dt = args.duration / (args.steps - 1) if args.steps > 1 else 0.0
+    for start in range(0, args.steps, args.chunk_size):
+        end = min(start + args.chunk_size, args.steps)
+        writer.write(free_fall_state(args.mass, args.height, args.g, np.arange(start, end) * dt))
+        _log(f"{end:,} / {args.steps:,} 단계")
+
+
+# 다물체 엔진을 돌리며 record_every 틱마다 모든 물체의 상태를 긴 형식(틱, 물체)으로 기록
+def run_engine(args, writer):
+    rng = np.random.default_rng(args.seed)
+    engine = PhysicsEngine(
+        masses=rng.uniform(args.mass_min, args.mass_max, args.bodies),
+        heights=rng.uniform(args.height_min, args.height_max, args.bodies),
+        restitutions=rng.uniform(args.restitution_min, args.restitution_max, args.bodies),
+        g=args.g,
+        integrator=args.integrator,
+    )
+    bodies = np.arange(args.bodies)
+    buffer = []
+
+    def flush():
+        if buffer:
+            writer.write({key: np.concatenate([row[key] for row in buffer]) for key in buffer[0]})
+            buffer.clear()
+
+    def record():
+        buffer.append({
+            "tick": np.full(args.bodies, engine.n_steps),
+            "time": np.full(args.bodies, engine.time),
+            "body": bodies,
+            "height": engine.heights.copy(),
+            "velocity": engine.velocities.copy(),
+        })
+        if len(buffer) >= args.chunk_ticks:
+            flush()
+
+    record()
+    while not engine.all_at_rest() and engine.time < args.max_time:
+        engine.step(args.dt)
+        if engine.n_steps % args.record_every == 0:
+            record()
+    flush()
+    _log(f"{engine.n_steps:,} 스텝, 시뮬레이션 시간 {engine.time:.3f} s, 에너지 드리프트 {engine.energy_drift():.2e}")
+
+
+# 파라미터 조합 전체를 조각으로 나누어 계산 (작업자가 여럿이면 프로세스 풀 사용)
+def run_sweep(args, writer):
+    m, h, g, c = make_grid(
+        np.linspace(*args.mass[:2], int(args.mass[2])),
+        np.linspace(*args.height[:2], int(args.height[2])),
+        np.linspace(*args.g_range[:2], int(args.g_range[2])),
+        np.linspace(*args.drag[:2], int(args.drag[2])),
+    )
+    done = 0
+    for frame in iter_sweep_chunks(m, h, g, c, args.drag_model, chunk_size=args.chunk_size, max_workers=args.workers):
+        writer.write(frame)
+        done += len(frame)
+        _log(f"{done:,} / {m.size:,} 조합")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m physics.cli", description="자유 낙하 배치 시뮬레이터")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_output(p):
+        p.add_argument("-o", "--output", required=True, help="출력 파일 (.npz 또는 .parquet)")
+        p.add_argument("--format", choices=OUTPUT_FORMATS, help="출력 형식 (기본: 확장자로 판단)")
+
+    p = subparsers.add_parser("trajectory", help="단일 물체 자유 낙하 궤적 (해석해)")
+    p.add_argument("--mass", type=float, default=1.0)
+    p.add_argument("--height", type=float, default=50.0)
+    p.add_argument("--g", type=float, default=G)
+    p.add_argument("--duration", type=float, default=5.0)
+    p.add_argument("--steps", type=_positive_int, default=1_000_000)
+    p.add_argument("--chunk-size", type=_positive_int, default=1_000_000, help="한 번에 계산/저장할 시간 단계 수")
+    add_output(p)
+
+    p = subparsers.add_parser("engine", help="다물체 튕김 시뮬레이션 (PhysicsEngine)")
+    p.add_argument("--bodies", type=_positive_int, default=1000)
+    p.add_argument("--height-min", type=float, default=1.0)
+    p.add_argument("--height-max", type=float, default=50.0)
+    p.add_argument("--mass-min", type=float, default=1.0)
+    p.add_argument("--mass-max", type=float, default=1.0)
+    p.add_argument("--restitution-min", type=float, default=0.5)
+    p.add_argument("--restitution-max", type=float, default=0.9)
+    p.add_argument("--g", type=float, default=G)
+    p.add_argument("--integrator", choices=INTEGRATOR_NAMES, default="verlet")
+    p.add_argument("--dt", type=float, default=0.01, help="시간 간격")
+    p.add_argument("--max-time", type=float, default=10.0)
+    p.add_argument("--record-every", type=_positive_int, default=1, help="몇 스텝마다 상태를 기록할지")
+    p.add_argument("--chunk-ticks", type=_positive_int, default=100, help="한 조각에 모을 기록 횟수")
+    p.add_argument("--seed", type=int, default=0)
+    add_output(p)
+
+    p = subparsers.add_parser("sweep", help="공기 저항을 포함한 파라미터 스윕")
+    p.add_argument("--mass", type=float, nargs=3, default=[1.0, 1.0, 1], metavar=("MIN", "MAX", "N"))
+    p.add_argument("--height", type=float, nargs=3, default=[50.0, 50.0, 1], metavar=("MIN", "MAX", "N"))
+    p.add_argument("--g", dest="g_range", type=float, nargs=3, default=[G, G, 1], metavar=("MIN", "MAX", "N"))
+    p.add_argument("--drag", type=float, nargs=3, default=[0.0, 1.0, 10], metavar=("MIN", "MAX", "N"))
+    p.add_argument("--drag-model", choices=DRAG_MODELS, default="quadratic")
+    p.add_argument("--workers", type=_positive_int, default=None, help="작업 프로세스 수 (기본: CPU 코어 수)")
+    p.add_argument("--chunk-size", type=_positive_int, default=None, help="한 조각의 조합 수")
+    add_output(p)
+
+    return parser
+
+
+COMMANDS = {"trajectory": run_trajectory, "engine": run_engine, "sweep": run_sweep}
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    start_time = time.perf_counter()
+    with open_chunk_writer(args.output, args.format) as writer:
+        COMMANDS[args.command](args, writer)
+    _log(f"{writer.n_rows:,}행, {writer.n_chunks}개 조각을 {args.output}에 저장 ({time.perf_counter() - start_time:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
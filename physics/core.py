@@ -0,0 +1,245 @@
+import numpy as np
+
+# --- 물리 상수 설정 ---
+G = 9.81  # 중력 가속도 (m/s^2)
+REST_SPEED = 0.05  # 바닥에서 튀어 오르는 속도가 이보다 작으면 정지한 것으로 봄 (m/s)
+
+INTEGRATOR_NAMES = ("euler", "verlet", "rk4")  # 엔진이 지원하는 적분기
+MAX_BOUNCES = 1000  # 해석해 모델에서 계산할 최대 튀어 오름 횟수
+
+TRAJECTORY_COLUMNS = ("time", "height", "velocity", "potential_energy", "kinetic_energy", "total_energy")
+
+
+# --- 단일 물체 자유 낙하 (해석해) ---
+# 충돌, 최고점, 정지 같은 사건의 시각을 공식으로 정확히 구해 두고
+# 궤적은 요청한 시각에서만 계산함 (미리 촘촘한 시간 격자를 만들지 않음)
+#
+# restitution=None: 튀어 오르지 않음. 땅에 닿은 뒤에는 높이 0, 속도는 충돌 속도 그대로 둠
+#                   (에너지 보존을 보여 주기 위한 페이지 04의 원래 방식)
+# restitution=e:    땅에 닿을 때마다 속도가 e배가 되어 튀어 오름. 튀어 오르는 속도가 REST_SPEED보다 작아지면 정지
+class FreeFallModel:
+    def __init__(self, mass, initial_height, g=G, restitution=None, max_bounces=MAX_BOUNCES):
+        self.mass = mass
+        self.initial_height = initial_height
+        self.g = g
+        self.restitution = restitution
+        self.impact_time = np.sqrt(2 * initial_height / g)
+        self.impact_speed = np.sqrt(2 * g * initial_height)
+
+        # 비행 구간: (시작 시각, 시작 높이, 시작 속도(위쪽 양수))
+        # 첫 구간은 정지 상태에서 떨어지기 시작, 이후 구간은 n번째 튀어 오름
+        starts, heights, speeds = [0.0], [initial_height], [0.0]
+        end_time = self.impact_time
+        if restitution:
+            speed = restitution * self.impact_speed
+            while speed >= REST_SPEED and len(starts) <= max_bounces:
+                starts.append(end_time)
+                heights.append(0.0)
+                speeds.append(speed)
+                end_time += 2 * speed / g # 같은 속도로 다시 땅에 닿을 때까지 걸리는 시간
+                speed *= restitution
+        self.segment_starts = np.array(starts)
+        self.segment_heights = np.array(heights)
+        self.segment_speeds = np.array(speeds)
+        self.end_time = end_time # 마지막 충돌 시각 (이후로는 땅에 있음)
+
+    # 사건 목록: 충돌(impact), 최고점(apex), 정지(rest)
+    def events(self, t_max=np.inf):
+        events = [{"time": float(self.impact_time), "event": "impact", "height": 0.0, "speed": float(self.impact_speed)}]
+        for start, speed in zip(self.segment_starts[1:], self.segment_speeds[1:]):
+            events.append({"time": float(start + speed / self.g), "event": "apex",
+                           "height": float(speed**2 / (2 * self.g)), "speed": 0.0})
+            events.append({"time": float(start + 2 * speed / self.g), "event": "impact", "height": 0.0, "speed": float(speed)})
+        if self.restitution is not None:
+            events.append({"time": float(self.end_time), "event": "rest", "height": 0.0, "speed": 0.0})
+        return [e for e in events if e["time"] <= t_max]
+
+    # 요청한 시각들에서의 상태 (속도는 원래 페이지처럼 아래쪽을 양수로 둠)
+    # 시각 하나(스칼라)를 넘기면 값도 스칼라로 반환
+    def evaluate(self, time_points):
+        time_points = np.asarray(time_points, dtype=float)
+        if time_points.ndim == 0:
+            return {key: value.item() for key, value in self.evaluate(time_points[None]).items()}
+
+        # 각 시각이 속한 비행 구간을 찾아 그 구간의 포물선 공식으로 계산
+        segment = np.searchsorted(self.segment_starts, time_points, side="right") - 1
+        segment = np.clip(segment, 0, None)
+        tau = time_points - self.segment_starts[segment]
+        upward = self.segment_speeds[segment]
+        heights = self.segment_heights[segment] + upward * tau - 0.5 * self.g * tau**2
+        velocities = self.g * tau - upward
+
+        # 마지막 충돌 이후는 마스크로 한꺼번에 처리
+        landed = time_points >= self.end_time
+        heights[landed] = 0 # 높이를 0으로 고정
+        # 튀지 않는 모델은 땅에 닿는 순간의 최종 속도 (vf = sqrt(2gh0))를 유지, 튀는 모델은 정지
+        velocities[landed] = self.impact_speed if self.restitution is None else 0.0
+        heights = np.maximum(heights, 0.0)
+
+        potential_energies = self.mass * self.g * heights
+        kinetic_energies = 0.5 * self.mass * velocities**2
+        total_energies = potential_energies + kinetic_energies # PE + KE
+
+        return {
+            "time": time_points,
+            "height": heights,
+            "velocity": velocities,
+            "potential_energy": potential_energies,
+            "kinetic_energy": kinetic_energies,
+            "total_energy": total_energies,
+        }
+
+    # 화면에 필요한 만큼만 계산: 균일한 n_points개 시각에 사건 시각을 더함
+    # 충돌 순간에는 직전 값도 넣어서 속도가 바뀌는 모습이 그래프에 정확히 나타나게 함
+    def sample(self, time_duration, n_points):
+        times = [np.linspace(0, time_duration, n_points)]
+        for event in self.events(time_duration):
+            times.append([event["time"]])
+            if event["event"] == "impact":
+                times.append([np.nextafter(event["time"], -np.inf)])
+        return self.evaluate(np.unique(np.concatenate(times)))
+
+
+# 주어진 시각들에서의 튀지 않는 자유 낙하 상태 (시각 배열을 나누어 넘기면 아주 긴 궤적도 조각 단위로 계산할 수 있음)
+def free_fall_state(mass, initial_height, g, time_points):
+    return FreeFallModel(mass, initial_height, g).evaluate(time_points)
+
+
+# 0초부터 time_duration초까지 time_steps개의 시각에서 계산한 전체 궤적
+def free_fall_trajectory(mass, initial_height, g, time_duration, time_steps):
+    return free_fall_state(mass, initial_height, g, np.linspace(0, time_duration, time_steps))
+
+
+# --- 다물체 물리 엔진 ---
+# N개의 물체를 구조체 배열(struct-of-arrays) 형태로 보관하고
+# 한 틱마다 모든 물체를 벡터 연산 한 번으로 전진시킴
+class PhysicsEngine:
+    def __init__(self, masses, heights, restitutions, velocities=None, g=G, integrator="euler"):
+        self.masses = np.asarray(masses, dtype=float)
+        self.heights = np.asarray(heights, dtype=float).copy()
+        # 속도는 위쪽 방향을 양수로 둠 (자유 낙하 시작이면 0)
+        if velocities is None:
+            velocities = np.zeros_like(self.heights)
+        self.velocities = np.asarray(velocities, dtype=float).copy()
+        self.restitutions = np.asarray(restitutions, dtype=float)
+        self.g = g
+        if integrator not in INTEGRATOR_NAMES:
+            raise ValueError(f"알 수 없는 적분기: {integrator}")
+        self.integrator = integrator
+        self.time = 0.0
+        self.n_steps = 0
+        self.bounce_counts = np.zeros(self.heights.shape, dtype=int)
+        self.at_rest = np.zeros(self.heights.shape, dtype=bool)
+        # 바닥 충돌로 잃은 에너지 (에너지 드리프트 계산 시 보정용)
+        self.dissipated_energies = np.zeros(self.heights.shape)
+        self.initial_total_energy = self.total_energy()
+
+    @property
+    def n_bodies(self):
+        return self.heights.size
+
+    def acceleration(self, heights, velocities):
+        # 중력만 작용 (위쪽이 양수이므로 -g)
+        return np.full_like(heights, -self.g)
+
+    # 충돌을 고려하지 않은 비행 구간 적분: (새 높이, 새 속도), dt는 물체별 배열이어도 됨
+    def _advance(self, h, v, dt, method):
+        if method == "euler":
+            # 반암시적 오일러: 속도 먼저, 갱신된 속도로 높이 갱신
+            v_new = v + self.acceleration(h, v) * dt
+            h_new = h + v_new * dt
+        elif method == "verlet":
+            a0 = self.acceleration(h, v)
+            h_new = h + v * dt + 0.5 * a0 * dt**2
+            a1 = self.acceleration(h_new, v + a0 * dt)
+            v_new = v + 0.5 * (a0 + a1) * dt
+        elif method == "rk4":
+            k1_h, k1_v = v, self.acceleration(h, v)
+            k2_h, k2_v = v + 0.5 * dt * k1_v, self.acceleration(h + 0.5 * dt * k1_h, v + 0.5 * dt * k1_v)
+            k3_h, k3_v = v + 0.5 * dt * k2_v, self.acceleration(h + 0.5 * dt * k2_h, v + 0.5 * dt * k2_v)
+            k4_h, k4_v = v + dt * k3_v, self.acceleration(h + dt * k3_h, v + dt * k3_v)
+            h_new = h + dt / 6 * (k1_h + 2 * k2_h + 2 * k3_h + k4_h)
+            v_new = v + dt / 6 * (k1_v + 2 * k2_v + 2 * k3_v + k4_v)
+        else:
+            raise ValueError(f"알 수 없는 적분기: {method}")
+        return h_new, v_new
+
+    # 한 스텝 적분: 엔진 상태는 바꾸지 않고 (새 높이, 새 속도, 충돌 횟수, 질량당 손실 에너지)를 반환
+    # 충돌 시각을 물체마다 정확히 찾아 dt만큼 전진: 충돌하는 물체만 골라(마스크) 충돌 시각까지 적분하고
+    # 튀어 오른 뒤 남은 시간을 다시 적분함 (한 스텝 안에서 여러 번 튀어도 됨)
+    # 충돌 시각은 구간 시작의 가속도로 푼 2차 방정식의 근 (중력만 작용하므로 정확함)
+    # 비행 구간은 선택한 적분기로 적분하므로 적분기 사이의 차이는 비행 구간의 오차에서만 생김
+    # 튀어 오르는 속도가 REST_SPEED보다 작으면 그 자리에서 멈추고 step()이 정지로 처리함
+    def _integrate(self, h, v, e, dt, method):
+        h, v = h.copy(), v.copy()
+        remaining = np.full(h.shape, float(dt))
+        hits = np.zeros(h.shape, dtype=int)
+        lost = np.zeros(h.shape)
+        active = np.arange(h.size)
+        while active.size:
+            ha, va = h[active], v[active]
+            a = self.acceleration(ha, va)
+            ground_speed = np.sqrt(np.maximum(va**2 - 2 * a * ha, 0.0))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                impact = np.where(a < 0, (-va - ground_speed) / a, np.inf)
+            impact = np.maximum(impact, 0.0)
+
+            # 남은 시간 안에 바닥에 닿지 않는 물체는 남은 시간만큼 비행하고 끝
+            flying = impact >= remaining[active]
+            done = active[flying]
+            h[done], v[done] = self._advance(ha[flying], va[flying], remaining[done], method)
+            remaining[done] = 0.0
+
+            # 바닥에 닿는 물체는 충돌 순간 튀어 오름
+            landing = ~flying
+            bounced = active[landing]
+            speed = ground_speed[landing]
+            h[bounced] = 0.0
+            v[bounced] = e[bounced] * speed
+            lost[bounced] += 0.5 * (1 - e[bounced]**2) * speed**2
+            hits[bounced] += 1
+            remaining[bounced] -= impact[landing]
+            remaining[bounced[v[bounced] < REST_SPEED]] = 0.0
+            active = bounced[remaining[bounced] > 0]
+        return h, v, hits, lost
+
+    # 모든 물체를 한 스텝 전진시키고 실제로 진행한 시간 간격을 반환
+    def step(self, dt):
+        moving = np.flatnonzero(~self.at_rest)
+        h, v, e = self.heights[moving], self.velocities[moving], self.restitutions[moving]
+
+        h, v, hits, lost = self._integrate(h, v, e, dt, self.integrator)
+
+        # 튀어 오르는 속도가 충분히 작으면 바닥에 정지
+        # (스텝 안에서 튀어 오른 뒤 공중에서 스텝이 끝난 물체는 속도가 작아도 정지가 아님)
+        stopped = (hits > 0) & (h <= 0) & (v < REST_SPEED)
+        lost[stopped] += 0.5 * v[stopped]**2
+        v[stopped] = 0.0
+
+        self.heights[moving] = h
+        self.velocities[moving] = v
+        self.bounce_counts[moving] += hits
+        self.dissipated_energies[moving] += self.masses[moving] * lost
+        self.at_rest[moving[stopped]] = True
+
+        self.time += dt
+        self.n_steps += 1
+        return dt
+
+    def potential_energies(self):
+        return self.masses * self.g * self.heights
+
+    def kinetic_energies(self):
+        return 0.5 * self.masses * self.velocities**2
+
+    def total_energy(self):
+        return self.potential_energies().sum() + self.kinetic_energies().sum()
+
+    # 충돌 손실을 보정한 상대 에너지 드리프트 (적분 오차만 남음)
+    def energy_drift(self):
+        if self.initial_total_energy == 0:
+            return 0.0
+        return (self.total_energy() + self.dissipated_energies.sum() - self.initial_total_energy) / self.initial_total_energy
+
+    def all_at_rest(self):
+        return bool(self.at_rest.all())
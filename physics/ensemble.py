@@ -0,0 +1,113 @@
+import numpy as np
+
+from physics.sweep import DRAG_MODELS, drag_acceleration
+
+# --- Monte Carlo 앙상블 ---
+# 초기 조건을 확률 분포에서 뽑은 수천 개의 궤적을 앙상블 차원으로 벡터화해서 한꺼번에 계산하고
+# 시각마다 백분위수 띠(band)로 요약함
+
+DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+# 분포에서 n개의 값을 뽑음
+# fixed: value / uniform: low, high / normal: mean, std / lognormal: median, sigma
+# minimum을 주면 그보다 작은 값은 minimum으로 올림 (질량, 높이, 중력 가속도는 양수여야 함)
+def sample_distribution(rng, kind, n, minimum=None, **params):
+    if kind == "fixed":
+        values = np.full(n, float(params["value"]))
+    elif kind == "uniform":
+        values = rng.uniform(params["low"], params["high"], n)
+    elif kind == "normal":
+        values = rng.normal(params["mean"], params["std"], n)
+    elif kind == "lognormal":
+        values = params["median"] * rng.lognormal(0.0, params["sigma"], n)
+    else:
+        raise ValueError(f"알 수 없는 분포: {kind}")
+    if minimum is not None:
+        values = np.maximum(values, minimum)
+    return values
+
+
+# 공기 저항이 있는 자유 낙하 앙상블 (페이지 04)
+# time_points 시각마다 모든 구성원의 높이, 속도, 역학적 에너지를 (시각 수, 구성원 수) 배열로 반환
+# 땅에 닿은 뒤에는 페이지 04처럼 높이 0, 속도는 충돌 속도로 고정 (마지막 시각까지 닿지 않으면 충돌 시각은 inf)
+def simulate_drag_ensemble(masses, heights, gs, drags, drag_model="quadratic", time_points=None, substeps=10):
+    if drag_model not in DRAG_MODELS:
+        raise ValueError(f"알 수 없는 공기 저항 모델: {drag_model}")
+    masses, heights, gs, drags = (np.asarray(a, dtype=float) for a in (masses, heights, gs, drags))
+    time_points = np.asarray(time_points, dtype=float)
+    n_times, n = time_points.size, masses.size
+
+    if not drags.any():
+        # 공기 저항이 없으면 공식으로 한 번에 계산 (시각 x 구성원 브로드캐스팅)
+        t = time_points[:, None]
+        impact_time = np.sqrt(2 * heights / gs)
+        impact_speed = np.sqrt(2 * gs * heights)
+        height = np.maximum(heights - 0.5 * gs * t**2, 0.0)
+        velocity = np.where(t < impact_time, gs * t, impact_speed)
+        impact_time = np.where(impact_time <= time_points[-1], impact_time, np.inf) # 시간 안에 닿은 경우만
+    else:
+        # 시각 사이를 substeps개의 RK4 스텝으로 나누어 모든 구성원을 동시에 전진
+        k = drags / masses
+        height = np.empty((n_times, n))
+        velocity = np.empty((n_times, n))
+        impact_time = np.full(n, np.inf)
+        y = np.zeros(n) # 낙하 거리
+        v = np.zeros(n) # 아래쪽 양수 속도
+        landed = np.zeros(n, dtype=bool)
+        t = time_points[0]
+        for i, t_next in enumerate(time_points):
+            dt = (t_next - t) / substeps
+            for _ in range(substeps if dt > 0 else 0):
+                k1_v = drag_acceleration(v, k, gs, drag_model)
+                k2_v = drag_acceleration(v + 0.5 * dt * k1_v, k, gs, drag_model)
+                k3_v = drag_acceleration(v + 0.5 * dt * k2_v, k, gs, drag_model)
+                k4_v = drag_acceleration(v + dt * k3_v, k, gs, drag_model)
+                k1_y, k2_y, k3_y, k4_y = v, v + 0.5 * dt * k1_v, v + 0.5 * dt * k2_v, v + dt * k3_v
+                y_new = y + dt / 6 * (k1_y + 2 * k2_y + 2 * k3_y + k4_y)
+                v_new = v + dt / 6 * (k1_v + 2 * k2_v + 2 * k3_v + k4_v)
+
+                # 이번 스텝에 땅에 닿은 구성원: 충돌 시각과 속도를 보간하고 그 상태로 고정
+                hit = ~landed & (y_new >= heights)
+                if hit.any():
+                    frac = (heights[hit] - y[hit]) / (y_new[hit] - y[hit])
+                    impact_time[hit] = t + frac * dt
+                    v_new[hit] = v[hit] + frac * (v_new[hit] - v[hit])
+                    y_new[hit] = heights[hit]
+                    landed |= hit
+                y = np.where(landed, np.minimum(y_new, heights), y_new)
+                v = np.where(landed & ~hit, v, v_new)
+                t += dt
+            t = t_next
+            height[i] = heights - y
+            velocity[i] = v
+
+    total_energy = masses * gs * height + 0.5 * masses * velocity**2
+    return {
+        "time": time_points,
+        "height": height,
+        "velocity": velocity,
+        "total_energy": total_energy,
+        "impact_time": impact_time,
+    }
+
+
+# 다물체 엔진으로 앙상블 실행 (페이지 05): 엔진의 각 물체가 앙상블의 한 구성원
+# sample_times 시각마다 모든 물체의 높이와 역학적 에너지를 기록
+def run_engine_ensemble(engine, dt, sample_times):
+    sample_times = np.asarray(sample_times, dtype=float)
+    height = np.empty((sample_times.size, engine.n_bodies))
+    total_energy = np.empty((sample_times.size, engine.n_bodies))
+    for i, t_sample in enumerate(sample_times):
+        while engine.time < t_sample - 1e-12 and not engine.all_at_rest():
+            engine.step(min(dt, t_sample - engine.time))
+        height[i] = engine.heights
+        total_energy[i] = engine.potential_energies() + engine.kinetic_energies()
+    return {"time": sample_times, "height": height, "total_energy": total_energy}
+
+
+# (시각 수, 구성원 수) 배열을 시각마다의 백분위수로 요약 -> {백분위수: 길이가 시각 수인 배열}
+def percentile_bands(values, percentiles=PERCENTILES):
+    bands = np.percentile(values, percentiles, axis=1)
+    return dict(zip(percentiles, bands))
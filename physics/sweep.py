@@ -0,0 +1,151 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# 공기 저항 모델
+# linear: F = -b v (느린 속도, 작은 물체)
+# quadratic: F = -c v|v| (일반적인 낙하 속도)
+DRAG_MODELS = ("linear", "quadratic")
+
+STEPS_PER_FALL = 1000      # 예상 낙하 시간을 몇 스텝으로 나눌지
+MAX_ITERATIONS = 100_000   # 한 묶음(chunk)에서 허용하는 최대 반복 횟수
+MIN_PARALLEL_CONFIGS = 2000  # 이보다 적은 조합은 프로세스 풀 없이 바로 계산
+CHUNKS_PER_WORKER = 4      # 작업자당 나눌 묶음 수 (부하 분산용)
+
+PARAMETER_COLUMNS = ["질량 (kg)", "초기 높이 (m)", "중력 가속도 (m/s²)", "공기 저항 계수"]
+RESULT_COLUMNS = ["충돌 시간 (s)", "충돌 속도 (m/s)", "종단 속도 (m/s)", "공기 저항 손실 에너지 (J)"]
+
+
+# 종단 속도: 중력과 공기 저항이 같아지는 속도 (저항이 0이면 무한대)
+def terminal_velocity(masses, gs, drags, drag_model):
+    with np.errstate(divide="ignore"):
+        if drag_model == "linear":
+            return np.where(drags > 0, masses * gs / drags, np.inf)
+        return np.where(drags > 0, np.sqrt(masses * gs / drags), np.inf)
+
+
+# 아래쪽을 양수로 둔 속도 v에서의 가속도 (k = 공기 저항 계수 / 질량)
+def drag_acceleration(v, k, g, drag_model):
+    if drag_model == "linear":
+        return g - k * v
+    return g - k * v * v
+
+
+# 여러 조합의 낙하를 한꺼번에 계산 (조합 차원으로 벡터화된 RK4)
+# 속도와 낙하 거리는 아래쪽을 양수로 두고, 땅에 닿는 순간은 스텝 안에서 선형 보간으로 찾음
+def simulate_fall_with_drag(masses, heights, gs, drags, drag_model="quadratic", steps_per_fall=STEPS_PER_FALL):
+    if drag_model not in DRAG_MODELS:
+        raise ValueError(f"알 수 없는 공기 저항 모델: {drag_model}")
+    masses, heights, gs, drags = (np.asarray(a, dtype=float) for a in (masses, heights, gs, drags))
+    n = masses.size
+    v_terminal = terminal_velocity(masses, gs, drags, drag_model)
+
+    # 조합마다 시간 간격을 따로 잡음: 저항이 없을 때의 낙하 시간과 종단 속도로 떨어지는 시간 중 긴 쪽
+    free_fall_time = np.sqrt(2 * heights / gs)
+    with np.errstate(divide="ignore"):
+        expected_time = np.maximum(free_fall_time, heights / v_terminal)
+    dt = expected_time / steps_per_fall
+    k = drags / masses
+
+    def accel(v, k, g):
+        return drag_acceleration(v, k, g, drag_model)
+
+    impact_time = np.full(n, np.nan)
+    impact_velocity = np.full(n, np.nan)
+
+    # 아직 땅에 닿지 않은 조합만 남겨 가며 계산
+    active = np.arange(n)
+    y = np.zeros(n)
+    v = np.zeros(n)
+    t = np.zeros(n)
+    h, g, kk, step = heights, gs, k, dt
+    for _ in range(MAX_ITERATIONS):
+        if active.size == 0:
+            break
+        k1_v = accel(v, kk, g)
+        k2_v = accel(v + 0.5 * step * k1_v, kk, g)
+        k3_v = accel(v + 0.5 * step * k2_v, kk, g)
+        k4_v = accel(v + step * k3_v, kk, g)
+        # 낙하 거리의 기울기는 각 단계의 속도
+        k1_y, k2_y, k3_y, k4_y = v, v + 0.5 * step * k1_v, v + 0.5 * step * k2_v, v + step * k3_v
+        v_new = v + step / 6 * (k1_v + 2 * k2_v + 2 * k3_v + k4_v)
+        y_new = y + step / 6 * (k1_y + 2 * k2_y + 2 * k3_y + k4_y)
+
+        # 땅에 닿은 조합: 스텝 안에서 충돌 시각과 속도를 보간
+        landed = y_new >= h
+        if landed.any():
+            frac = (h[landed] - y[landed]) / (y_new[landed] - y[landed])
+            impact_time[active[landed]] = t[landed] + frac * step[landed]
+            impact_velocity[active[landed]] = v[landed] + frac * (v_new[landed] - v[landed])
+            keep = ~landed
+            active = active[keep]
+            y, v, t = y_new[keep], v_new[keep], t[keep] + step[keep]
+            h, g, kk, step = h[keep], g[keep], kk[keep], step[keep]
+        else:
+            y, v, t = y_new, v_new, t + step
+
+    # 공기 저항으로 잃은 에너지 = 처음 위치 에너지 - 충돌 순간 운동 에너지
+    drag_energy_loss = masses * gs * heights - 0.5 * masses * impact_velocity**2
+    return {
+        "impact_time": impact_time,
+        "impact_velocity": impact_velocity,
+        "terminal_velocity": v_terminal,
+        "drag_energy_loss": drag_energy_loss,
+    }
+
+
+# 프로세스 풀 작업자가 실행하는 함수 (피클 가능하도록 모듈 최상위에 둠)
+def _simulate_chunk(args):
+    masses, heights, gs, drags, drag_model = args
+    return simulate_fall_with_drag(masses, heights, gs, drags, drag_model)
+
+
+# 질량, 높이, 중력 가속도, 공기 저항 계수의 모든 조합 (각각 1차원 배열로 펼침)
+def make_grid(masses, heights, gs, drags):
+    axes = [np.asarray(a, dtype=float) for a in (masses, heights, gs, drags)]
+    return tuple(a.ravel() for a in np.meshgrid(*axes, indexing="ij"))
+
+
+# 조합을 chunk_size개씩 나누어 계산하고, 원래 순서대로 결과 조각(DataFrame)을 하나씩 내보냄
+# 작업자가 여럿이면 프로세스 풀에서 동시에 계산함
+def iter_sweep_chunks(m, h, g, c, drag_model="quadratic", chunk_size=None, max_workers=None):
+    n = m.size
+    max_workers = max_workers or os.cpu_count() or 1
+    serial = n < MIN_PARALLEL_CONFIGS or max_workers == 1
+    if chunk_size is None:
+        chunk_size = n if serial else -(-n // (max_workers * CHUNKS_PER_WORKER))
+    chunk_size = max(1, chunk_size)
+    chunks = [
+        (m[i:i + chunk_size], h[i:i + chunk_size], g[i:i + chunk_size], c[i:i + chunk_size], drag_model)
+        for i in range(0, n, chunk_size)
+    ]
+
+    if serial:
+        for chunk in chunks:
+            yield _to_frame(chunk, _simulate_chunk(chunk))
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for chunk, result in zip(chunks, executor.map(_simulate_chunk, chunks)):
+            yield _to_frame(chunk, result)
+
+
+# 계산에 쓴 조합과 결과를 한 DataFrame으로 묶음
+def _to_frame(chunk, results):
+    m, h, g, c, _ = chunk
+    df = pd.DataFrame(dict(zip(PARAMETER_COLUMNS, (m, h, g, c))))
+    df[RESULT_COLUMNS[0]] = results["impact_time"]
+    df[RESULT_COLUMNS[1]] = results["impact_velocity"]
+    df[RESULT_COLUMNS[2]] = results["terminal_velocity"]
+    df[RESULT_COLUMNS[3]] = results["drag_energy_loss"]
+    return df
+
+
+# 질량, 높이, 중력 가속도, 공기 저항 계수의 모든 조합을 만들어 프로세스 풀에서 나누어 계산
+def run_sweep(masses, heights, gs, drags, drag_model="quadratic", max_workers=None):
+    m, h, g, c = make_grid(masses, heights, gs, drags)
+    return pd.concat(
+        list(iter_sweep_chunks(m, h, g, c, drag_model, max_workers=max_workers)), ignore_index=True
+    )
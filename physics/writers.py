@@ -0,0 +1,97 @@
+import os
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+# Parquet 출력은 pyarrow가 있을 때만 사용 (Streamlit 설치 시 함께 설치됨)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+OUTPUT_FORMATS = ("npz", "parquet")
+
+
+# --- 조각 단위 결과 저장 ---
+# 시뮬레이션 결과를 한꺼번에 메모리에 모으지 않고 조각(chunk)마다 바로 파일에 씀
+# write()에는 {열 이름: 1차원 배열} 딕셔너리나 DataFrame을 넘김
+
+
+# NPZ: 하나의 .npz(zip) 파일 안에 조각마다 "열이름/00000.npy" 항목을 추가
+# np.load(path)로 열고 load_npz_column()으로 열 단위로 이어 붙여 읽을 수 있음
+class NpzChunkWriter:
+    def __init__(self, path):
+        self.path = path
+        self.n_chunks = 0
+        self.n_rows = 0
+        self._zip = zipfile.ZipFile(path, mode="w", compression=zipfile.ZIP_STORED, allowZip64=True)
+
+    def write(self, columns):
+        if isinstance(columns, pd.DataFrame):
+            columns = {name: columns[name].to_numpy() for name in columns.columns}
+        for name, values in columns.items():
+            with self._zip.open(f"{name}/{self.n_chunks:05d}.npy", mode="w", force_zip64=True) as f:
+                np.lib.format.write_array(f, np.asarray(values), allow_pickle=False)
+        self.n_rows += len(next(iter(columns.values()))) if columns else 0
+        self.n_chunks += 1
+
+    def close(self):
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Parquet: 조각마다 행 그룹(row group)을 하나씩 추가
+class ParquetChunkWriter:
+    def __init__(self, path):
+        if pq is None:
+            raise ImportError("Parquet 출력에는 pyarrow가 필요합니다: pip install pyarrow")
+        self.path = path
+        self.n_chunks = 0
+        self.n_rows = 0
+        self._writer = None
+
+    def write(self, columns):
+        if not isinstance(columns, pd.DataFrame):
+            columns = pd.DataFrame(columns)
+        table = pa.Table.from_pandas(columns, preserve_index=False)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+        self.n_rows += len(columns)
+        self.n_chunks += 1
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# 파일 확장자(또는 지정한 형식)에 맞는 저장기를 만듦
+def open_chunk_writer(path, output_format=None):
+    if output_format is None:
+        output_format = os.path.splitext(path)[1].lstrip(".").lower()
+    if output_format == "npz":
+        return NpzChunkWriter(path)
+    if output_format == "parquet":
+        return ParquetChunkWriter(path)
+    raise ValueError(f"지원하지 않는 출력 형식: {output_format} (npz 또는 parquet)")
+
+
+# NpzChunkWriter로 저장한 파일에서 한 열의 모든 조각을 이어 붙여 읽음
+def load_npz_column(path, name):
+    with np.load(path) as data:
+        keys = sorted(k for k in data.files if k.startswith(f"{name}/"))
+        return np.concatenate([data[k] for k in keys]) if keys else np.array([])
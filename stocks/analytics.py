@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+
+# --- 포트폴리오 분석 ---
+# 입력은 날짜 인덱스, 종목별 열의 종가 표(panel). 상장 전이거나 값이 없는 날은 NaN
+# 모든 지표를 종목별 반복문 없이 (날짜 수, 종목 수) 배열 연산 한 번으로 계산함
+# 상장일이 서로 달라도 각 종목은 자기 첫 거래일부터 계산함
+
+TRADING_DAYS = 252
+
+
+# 종목마다 첫 번째/마지막 유효 값의 위치 -> (첫 위치, 마지막 위치, 값이 하나라도 있는지)
+def _first_last(values):
+    valid = ~np.isnan(values)
+    first = valid.argmax(axis=0)
+    last = values.shape[0] - 1 - valid[::-1].argmax(axis=0)
+    return first, last, valid.any(axis=0)
+
+
+# 일간 수익률 (빠진 날을 앞 값으로 채우지 않음)
+def daily_returns(panel):
+    return panel.pct_change(fill_method=None)
+
+
+# 각 종목의 첫 거래일 값을 100으로 맞춘 지수
+def normalize(panel):
+    values = panel.to_numpy(dtype=float)
+    if values.shape[0] == 0:
+        return panel.astype(float)
+    first, _, _ = _first_last(values)
+    base = values[first, np.arange(values.shape[1])]
+    return pd.DataFrame(values / base * 100, index=panel.index, columns=panel.columns)
+
+
+# 첫 거래일부터 마지막 거래일까지의 수익률(%)과 연평균 성장률(CAGR, %)
+# 값이 하나도 없는 종목은 결과에서 뺌 (날짜나 종목이 없는 표면 빈 결과)
+def growth_and_cagr(panel):
+    panel = panel.dropna(axis=1, how="all")
+    if panel.empty:
+        return pd.Series(dtype=float, index=panel.columns), pd.Series(dtype=float, index=panel.columns)
+    values = panel.to_numpy(dtype=float)
+    first, last, has_data = _first_last(values)
+    columns = np.arange(values.shape[1])
+    start_price, end_price = values[first, columns], values[last, columns]
+    dates = panel.index.to_numpy()
+    years = (dates[last] - dates[first]) / np.timedelta64(1, "D") / 365.25
+    growth = np.where(has_data, (end_price / start_price - 1) * 100, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cagr = np.where(has_data & (years > 0), ((end_price / start_price) ** (1 / years) - 1) * 100, np.nan)
+    return pd.Series(growth, index=panel.columns), pd.Series(cagr, index=panel.columns)
+
+
+# 연율화한 변동성: 전체 기간(Series) 또는 window일 이동 구간(DataFrame)
+def volatility(returns, window=None):
+    if window is None:
+        return returns.std() * np.sqrt(TRADING_DAYS)
+    return returns.rolling(window, min_periods=window).std() * np.sqrt(TRADING_DAYS)
+
+
+# 최고점 대비 낙폭 (0 이하, 비율): 각 시점까지의 최고가는 NaN을 건너뛰는 fmax 누적으로 구함
+def drawdowns(panel):
+    values = panel.to_numpy(dtype=float)
+    running_max = np.fmax.accumulate(values, axis=0)
+    return pd.DataFrame(values / running_max - 1, index=panel.index, columns=panel.columns)
+
+
+def max_drawdown(panel):
+    return drawdowns(panel).min()
+
+
+# 연율화한 샤프 지수 (risk_free는 연 무위험 수익률)
+def sharpe_ratio(returns, risk_free=0.0):
+    excess = returns - risk_free / TRADING_DAYS
+    return excess.mean() / excess.std() * np.sqrt(TRADING_DAYS)
+
+
+# 상관계수 행렬: 두 종목이 모두 값을 가진 날만 쓰는(pairwise) 상관계수를
+# 행렬 곱 네 번으로 한꺼번에 계산 (종목 쌍마다 반복하는 DataFrame.corr보다 훨씬 빠름)
+def correlation(returns, min_periods=20):
+    x = returns.to_numpy(dtype=float)
+    valid = ~np.isnan(x)
+    mask = valid.astype(float)
+    x = np.where(valid, x, 0.0)
+    n = mask.T @ mask
+    sx = x.T @ mask # sx[i, j]: i와 j가 모두 있는 날의 i 합
+    sxx = (x * x).T @ mask
+    sxy = x.T @ x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = n * sxy - sx * sx.T
+        var = n * sxx - sx * sx
+        corr = cov / np.sqrt(var * var.T)
+    corr = np.where(n >= min_periods, np.clip(corr, -1.0, 1.0), np.nan)
+    return pd.DataFrame(corr, index=returns.columns, columns=returns.columns)
+
+
+# 벤치마크 대비 베타 = cov(r, r_b) / var(r_b)
+# 종목마다 두 수익률이 모두 있는 날만 쓰도록 마스크를 곱한 누적합의 차로 window일 합을 한꺼번에 구함
+# window가 None이면 전체 기간의 베타 하나
+def beta(returns, benchmark_returns, window=None):
+    r = returns.to_numpy(dtype=float)
+    b = benchmark_returns.reindex(returns.index).to_numpy(dtype=float)[:, None]
+    valid = ~np.isnan(r) & ~np.isnan(b)
+    r = np.where(valid, r, 0.0)
+    b = np.where(valid, b, 0.0)
+    sums = [valid.astype(float), r, b, r * b, b * b]
+    if window is None:
+        n, sr, sb, srb, sbb = (s.sum(axis=0) for s in sums)
+    else:
+        def rolling_sum(x):
+            c = np.cumsum(np.vstack([np.zeros((1, x.shape[1])), x]), axis=0)
+            out = np.full_like(x, np.nan)
+            out[window - 1:] = c[window:] - c[:-window]
+            return out
+        n, sr, sb, srb, sbb = (rolling_sum(s) for s in sums)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = srb - sr * sb / n
+        var = sbb - sb * sb / n
+        result = np.where(n >= (2 if window is None else window // 2), cov / var, np.nan)
+    if window is None:
+        return pd.Series(result, index=returns.columns)
+    return pd.DataFrame(result, index=returns.index, columns=returns.columns)
+
+
+# 종목별 요약표: 수익률, CAGR, 연 변동성, 최대 낙폭, 샤프 지수, (벤치마크가 있으면) 베타
+# 값이 하나도 없는 종목은 NaN뿐인 행이 되므로 표에서 뺌
+def summary(panel, benchmark=None, risk_free=0.0):
+    panel = panel.dropna(axis=1, how="all")
+    returns = daily_returns(panel)
+    growth, cagr = growth_and_cagr(panel)
+    table = pd.DataFrame({
+        "수익률 (%)": growth,
+        "CAGR (%)": cagr,
+        "연 변동성 (%)": volatility(returns) * 100,
+        "최대 낙폭 (%)": max_drawdown(panel) * 100,
+        "샤프 지수": sharpe_ratio(returns, risk_free),
+    })
+    if benchmark is not None:
+        table["베타"] = beta(returns, daily_returns(benchmark))
+    return table
@@ -0,0 +1,122 @@
+import argparse
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from stocks.providers import SyntheticProvider
+
+# --- 로컬 가짜 시세 서버 ---
+# stocks.providers.HttpProvider가 쓰는 /prices 엔드포인트를 흉내 내는 시험용 서버
+# 값은 SyntheticProvider로 만들고, 응답 지연, 무작위 실패(503), 초당 요청 한도(429)를 흉내 낼 수 있음
+# 받은 요청 수를 세어 두므로 요청 합치기, 속도 제한, 재시도가 업스트림에 어떤 부담을 주는지 확인할 수 있음
+# 사용 예:
+#   python -m stocks.fakeserver --port 8765 --latency 0.3 --failure-rate 0.2
+#   MARKET_DATA_PROVIDER=http MARKET_DATA_URL=http://127.0.0.1:8765 streamlit run main.py
+
+
+class FakePriceServer:
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, failure_rate=0.0, rate_limit=None, seed=0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.rate_limit = rate_limit  # 초당 허용 요청 수 (None이면 제한 없음)
+        self.provider = SyntheticProvider(seed=seed)
+        self.requests = 0
+        self.failures = 0
+        self.rejected = 0
+        self.tickers_served = 0
+        self._random = random.Random(seed)
+        self._window = []  # 최근 1초 동안 받은 요청 시각
+        self._lock = threading.Lock()
+        self._thread = None
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # 요청을 받아들일지 정함 -> HTTP 상태 코드
+    def _admit(self):
+        with self._lock:
+            self.requests += 1
+            now = time.monotonic()
+            self._window = [t for t in self._window if now - t < 1.0]
+            if self.rate_limit is not None and len(self._window) >= self.rate_limit:
+                self.rejected += 1
+                return 429
+            self._window.append(now)
+            if self._random.random() < self.failure_rate:
+                self.failures += 1
+                return 503
+        return 200
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urllib.parse.urlparse(self.path)
+                if url.path != "/prices":
+                    self.send_error(404)
+                    return
+                status = server._admit()
+                if server.latency:
+                    time.sleep(server.latency)
+                if status != 200:
+                    self.send_error(status)
+                    return
+                query = urllib.parse.parse_qs(url.query)
+                tickers = [t for t in query.get("tickers", [""])[0].split(",") if t]
+                panel = server.provider.fetch_panel(tickers, query["start"][0], query["end"][0])
+                with server._lock:
+                    server.tickers_served += len(tickers)
+                frame = panel.rename_axis("Date").reset_index().melt("Date", var_name="ticker", value_name="close")
+                body = frame.to_csv(index=False, date_format="%Y-%m-%d").encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/csv; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-price-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "tickers_served": self.tickers_served,
+            }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 가짜 시세 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="503으로 실패할 확률")
+    parser.add_argument("--rate-limit", type=int, default=None, help="초당 허용 요청 수 (넘으면 429)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    server = FakePriceServer(args.host, args.port, args.latency, args.failure_rate, args.rate_limit, args.seed)
+    print(f"가짜 시세 서버: {server.url}/prices?tickers=AAPL,MSFT&start=2024-01-01&end=2025-01-01")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
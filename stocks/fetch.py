@@ -0,0 +1,123 @@
+import random
+import threading
+import time
+
+from utils.singleflight import SingleFlight
+
+# --- 업스트림 시세 요청 계층 ---
+# 공급자의 fetch_panel을 감싸서 여러 세션이 한꺼번에 같은 데이터를 찾을 때 업스트림을 보호함
+#   single-flight: 똑같은 요청(종목 집합, 시작, 끝)이 이미 진행 중이면 새로 보내지 않고 그 결과를 함께 받음 (utils.singleflight)
+#   전역 속도 제한: 토큰 버킷으로 초당 요청 수를 제한함 (모든 세션과 예열 스레드가 함께 씀)
+#   재시도: 일시적인 오류(FetchError)는 지수 백오프 + 지터로 몇 번 더 시도함
+# 오래된 값을 먼저 보여 주고 뒤에서 다시 받는 일(stale-while-revalidate)은 stocks.matrix가 맡음
+
+FETCH_RATE = 2.0  # 초당 업스트림 요청 수
+FETCH_BURST = 4  # 한꺼번에 보낼 수 있는 요청 수
+FETCH_ATTEMPTS = 4  # 첫 시도를 포함한 최대 시도 횟수
+BASE_DELAY = 0.5  # 첫 재시도 전 최대 대기 시간 (초), 시도마다 두 배
+MAX_DELAY = 8.0
+
+
+# 다시 시도하면 성공할 수 있는 오류 (속도 제한, 서버 오류, 연결 끊김 등)
+class FetchError(Exception):
+    pass
+
+
+# 토큰 버킷: 초당 rate개씩 토큰이 차고 최대 burst개까지 쌓임, acquire()는 토큰이 생길 때까지 기다림
+class RateLimiter:
+    def __init__(self, rate=FETCH_RATE, burst=FETCH_BURST, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    # 기다린 시간(초)을 반환
+    def acquire(self):
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
+# fn()을 실행하고 retry_on 오류가 나면 최대 attempts번까지 다시 시도 -> (결과, 재시도 횟수)
+# 대기 시간은 0 ~ min(max_delay, base_delay * 2^n) 사이의 난수 (여러 세션이 동시에 다시 몰리지 않도록)
+def retry_call(fn, attempts=FETCH_ATTEMPTS, base_delay=BASE_DELAY, max_delay=MAX_DELAY,
+               retry_on=(FetchError,), sleep=time.sleep):
+    for attempt in range(attempts):
+        try:
+            return fn(), attempt
+        except retry_on:
+            if attempt == attempts - 1:
+                raise
+            sleep(random.uniform(0, min(max_delay, base_delay * 2**attempt)))
+
+
+class FetchLayer:
+    def __init__(self, fetch_panel, rate=FETCH_RATE, burst=FETCH_BURST, attempts=FETCH_ATTEMPTS,
+                 base_delay=BASE_DELAY, max_delay=MAX_DELAY):
+        self._fetch_panel = fetch_panel
+        self.limiter = RateLimiter(rate, burst)
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._flight = SingleFlight()
+        self._stats_lock = threading.Lock()
+        self.requests = 0  # 업스트림으로 실제 보낸 요청 수 (재시도 포함)
+        self.coalesced = 0  # 진행 중인 요청에 합쳐져 보내지 않은 요청 수
+        self.retries = 0
+        self.failures = 0  # 재시도까지 모두 실패한 요청 수
+        self.throttled = 0.0  # 속도 제한으로 기다린 시간 합 (초)
+        self.last_error = None
+
+    def _count(self, **amounts):
+        with self._stats_lock:
+            for name, amount in amounts.items():
+                setattr(self, name, getattr(self, name) + amount)
+
+    def _fetch(self, tickers, start, end):
+        sent = 0
+
+        def attempt():
+            nonlocal sent
+            self._count(throttled=self.limiter.acquire(), requests=1, retries=1 if sent else 0)
+            sent += 1
+            return self._fetch_panel(tickers, start, end)
+
+        try:
+            panel, _ = retry_call(attempt, self.attempts, self.base_delay, self.max_delay)
+        except Exception as e:
+            self._count(failures=1)
+            self.last_error = f"{type(e).__name__}: {e}"
+            raise
+        return panel
+
+    # 공급자의 fetch_panel과 같은 모양 (결과 표는 함께 받은 호출들이 공유하므로 복사해서 돌려줌)
+    def fetch_panel(self, tickers, start, end):
+        tickers = list(tickers)
+        key = (tuple(sorted(tickers)), str(start), str(end))
+        panel, shared = self._flight.do(key, lambda: self._fetch(tickers, start, end))
+        if shared:
+            self._count(coalesced=1)
+        return panel.copy()
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                "requests": self.requests,
+                "coalesced": self.coalesced,
+                "retries": self.retries,
+                "failures": self.failures,
+                "throttled": self.throttled,
+                "last_error": self.last_error,
+            }
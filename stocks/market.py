@@ -0,0 +1,86 @@
+import datetime
+import threading
+from collections import OrderedDict
+
+from stocks.fetch import FetchLayer
+from stocks.matrix import PriceMatrix
+from stocks.panels import PanelCache
+from stocks.providers import provider_from_env
+from stocks.store import PriceStore
+
+# --- 프로세스 전체가 함께 쓰는 시세 데이터 ---
+# 공급자, 요청 계층, 저장소, 기간별 종가 행렬, 정렬된 가격 표 캐시를 한곳에 모아 둠
+# Streamlit 페이지와 백그라운드 예열 스레드가 같은 객체를 쓰도록 모듈 안에 하나만 만듦
+
+ROW_MAX_AGE = 3600  # 행렬의 한 종목을 저장소와 다시 맞추기까지의 시간 (초)
+# 저장소가 비어 있던 뒤쪽 구간(새 거래일)을 업스트림에 다시 묻기까지의 시간 (초)
+# 예열 주기(stocks.warmup.WARMUP_INTERVAL)와 같게 둬서 예열할 때마다 새 거래일을 확인함
+RECHECK_SECONDS = ROW_MAX_AGE * 3 // 4
+MAX_PERIODS = 5  # 동시에 들고 있을 기간(시작일, 종료일)별 행렬 수
+
+
+# 오늘까지 최근 years년 -> (start, end), end는 포함하지 않음
+def period(years, today=None):
+    end = today or datetime.date.today()
+    return end - datetime.timedelta(days=365 * years), end
+
+
+class MarketData:
+    def __init__(self, provider, store=None, max_periods=MAX_PERIODS, max_age=ROW_MAX_AGE, recheck_seconds=RECHECK_SECONDS):
+        self.provider = provider
+        # 네트워크 공급자만 디스크 저장소에 쌓아 두고 저장된 기간 밖의 새 거래일만 받음
+        if store is None:
+            if provider.persistent:
+                store = PriceStore(recheck_seconds=recheck_seconds)
+            else:
+                store = PriceStore(":memory:", recheck_seconds)
+        self.store = store
+        # 네트워크 공급자의 요청은 요청 계층(합치기, 속도 제한, 재시도)을 거쳐 보냄
+        self.fetcher = FetchLayer(provider.fetch_panel) if provider.persistent else None
+        self.fetch_panel = self.fetcher.fetch_panel if self.fetcher else provider.fetch_panel
+        self.max_periods = max_periods
+        self.max_age = max_age
+        self.panels = PanelCache()
+        self._matrices = OrderedDict()
+        self._lock = threading.Lock()
+
+    # 기간별 종가 행렬 (오래 쓰지 않은 기간부터 버림)
+    def matrix(self, start, end):
+        with self._lock:
+            key = (start, end)
+            if key in self._matrices:
+                self._matrices.move_to_end(key)
+            else:
+                self._matrices[key] = PriceMatrix(
+                    self.store, self.fetch_panel, start, end, max_age=self.max_age
+                )
+                while len(self._matrices) > self.max_periods:
+                    self._matrices.popitem(last=False)
+            return self._matrices[key]
+
+    def load_series(self, ticker, start, end):
+        matrix = self.matrix(start, end)
+        matrix.ensure([ticker])
+        return matrix.series(ticker)
+
+    def load_panel(self, tickers, start, end):
+        matrix = self.matrix(start, end)
+        matrix.ensure(tickers)
+        return matrix.panel(tickers)
+
+    # 종목 집합의 정렬된 종가/정규화 표 (stocks.panels.AlignedPanel, 열은 티커 순)
+    def aligned_panel(self, tickers, start, end):
+        return self.panels.get(self.matrix(start, end), tickers)
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+# 환경 변수(MARKET_DATA_PROVIDER 등)로 고른 공급자를 쓰는 프로세스 공용 MarketData
+def shared_market_data():
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = MarketData(provider_from_env())
+        return _shared
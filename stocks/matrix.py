@@ -0,0 +1,155 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+# --- 열 단위 종가 행렬 ---
+# 종목마다 pandas Series를 따로 캐시하는 대신, 날짜 인덱스 하나와
+# (종목 수, 날짜 수) float32 배열 하나에 모든 종목을 담음 (한 종목의 값이 한 행에 연속으로 놓임)
+# 3년치 일봉이면 종목당 약 3 KB라서 유니버스 전체(수백~수천 종목)를 한 프로세스에 캐시할 수 있음
+# 처음 요청된 종목만 저장소에서 읽어 행을 추가하고, 배열은 두 배씩 늘림
+# max_age초보다 오래된 행은 다음 ensure()에서 저장소를 다시 맞춘 뒤 덮어씀
+#   없는 종목: 받아 올 때까지 기다림 (같은 종목을 다른 세션이 받고 있으면 새로 요청하지 않고 그 결과를 기다림)
+#   오래된 종목: 기존 값을 바로 쓰고 백그라운드 스레드에서 다시 받음 (stale-while-revalidate)
+# 받다가 실패하면 예외를 올리지 않고 errors에 남김 (기존 값이 있으면 그대로 씀)
+# 실패한 종목은 retry_after초 동안 다시 받지 않음 (업스트림이 죽었을 때 실행마다 재시도를 기다리지 않도록)
+
+
+RETRY_AFTER = 30  # 받기에 실패한 종목을 다시 받기까지의 시간 (초)
+
+
+class PriceMatrix:
+    def __init__(self, store, fetch_panel, start, end, capacity=64, max_age=None, retry_after=RETRY_AFTER):
+        self.store = store
+        self.fetch_panel = fetch_panel
+        self.start = start
+        self.end = end
+        self.max_age = max_age
+        self.retry_after = retry_after
+        self.dates = pd.DatetimeIndex([], name="Date")
+        self._values = np.empty((capacity, 0), dtype=np.float32)
+        self._rows = {}
+        self._loaded_at = {}
+        self._versions = {}  # 종목별로 행을 다시 쓸 때마다 1씩 늘어남
+        self._inflight = {}  # 받고 있는 종목 -> 끝나면 set되는 Event
+        self.errors = {}  # 마지막으로 받기에 실패한 종목 -> 오류 메시지
+        self._failed_at = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, ticker):
+        return ticker in self._rows
+
+    @property
+    def nbytes(self):
+        return len(self._rows) * self.dates.size * np.dtype(np.float32).itemsize
+
+    # 마지막으로 불러온 시각 (없으면 None)
+    def loaded_at(self, ticker):
+        return self._loaded_at.get(ticker)
+
+    # 종목별 행 버전 (행렬에서 만든 파생 결과가 아직 유효한지 확인할 때 씀)
+    def versions(self, tickers):
+        with self._lock:
+            return tuple(self._versions.get(t, 0) for t in tickers)
+
+    # 마지막으로 받기에 실패했으면 그 오류 메시지 (성공했으면 None)
+    def error(self, ticker):
+        return self.errors.get(ticker)
+
+    def _is_stale(self, ticker, now):
+        if ticker in self._failed_at and now - self._failed_at[ticker] < self.retry_after:
+            return False
+        if ticker not in self._rows:
+            return True
+        return self.max_age is not None and now - self._loaded_at[ticker] > self.max_age
+
+    # 종목들을 행렬에 준비함 (refresh=True면 있는 종목도 모두 다시 받고 끝날 때까지 기다림)
+    # 네트워크를 기다리는 동안에는 잠금을 풀어 두어 이미 있는 종목은 다른 세션이 바로 읽을 수 있게 함
+    def ensure(self, tickers, refresh=False, timeout=None):
+        now = time.time()
+        with self._lock:
+            tickers = list(dict.fromkeys(tickers))
+            needed = [t for t in tickers if refresh or (t not in self._rows and self._is_stale(t, now))]
+            expired = [t for t in tickers if t not in needed and self._is_stale(t, now)]
+            waiting = [self._inflight[t] for t in needed if t in self._inflight]
+            mine = self._claim([t for t in needed if t not in self._inflight])
+            background = self._claim([t for t in expired if t not in self._inflight])
+        if background:
+            threading.Thread(target=self._load, args=(background,), name="price-refresh", daemon=True).start()
+        if mine:
+            self._load(mine)
+        for event in waiting:
+            event.wait(timeout)
+
+    # 받을 종목을 "받는 중"으로 표시 (잠금 안에서 호출)
+    def _claim(self, tickers):
+        for ticker in tickers:
+            self._inflight[ticker] = threading.Event()
+        return tickers
+
+    def _load(self, tickers):
+        try:
+            self.store.sync(tickers, self.start, self.end, self.fetch_panel)
+            panel = self.store.read_panel(tickers, self.start, self.end)
+            with self._lock:
+                self._append(panel)
+                now = time.time()
+                for ticker in tickers:
+                    self._loaded_at[ticker] = now
+                    self.errors.pop(ticker, None)
+                    self._failed_at.pop(ticker, None)
+        except Exception as e:
+            message = f"{type(e).__name__}: {e}"
+            with self._lock:
+                now = time.time()
+                for ticker in tickers:
+                    self.errors[ticker] = message
+                    self._failed_at[ticker] = now
+        finally:
+            with self._lock:
+                for ticker in tickers:
+                    self._inflight.pop(ticker).set()
+
+    def _append(self, panel):
+        dates = self.dates.union(panel.index)
+        n_rows = len(self._rows) + sum(t not in self._rows for t in panel.columns)
+        capacity = self._values.shape[0]
+        if dates.size != self.dates.size or n_rows > capacity:
+            # 새 날짜가 생겼거나 자리가 모자라면 새 배열로 옮김 (기존 값은 새 날짜 위치에 맞춰 복사)
+            while capacity < n_rows:
+                capacity *= 2
+            values = np.full((capacity, dates.size), np.nan, dtype=np.float32)
+            values[:len(self._rows), dates.get_indexer(self.dates)] = self._values[:len(self._rows)]
+            self._values, self.dates = values, dates
+        positions = dates.get_indexer(panel.index)
+        for ticker in panel.columns:
+            row = self._rows.setdefault(ticker, len(self._rows))
+            self._values[row] = np.nan
+            self._values[row, positions] = panel[ticker].to_numpy(dtype=np.float32)
+            self._versions[ticker] = self._versions.get(ticker, 0) + 1
+
+    # 한 종목의 종가 (값이 있는 날만, 받지 못한 종목은 빈 Series)
+    def series(self, ticker):
+        with self._lock:
+            if ticker not in self._rows:
+                return pd.Series(dtype=np.float32, index=pd.DatetimeIndex([], name="Date"), name="Close")
+            values = self._values[self._rows[ticker]].copy()
+            dates = self.dates
+        valid = ~np.isnan(values)
+        return pd.Series(values[valid], index=dates[valid], name="Close")
+
+    # 여러 종목의 종가 표 (날짜 x 종목, 모든 종목에 값이 없는 날은 뺌, 받지 못한 종목은 NaN 열)
+    def panel(self, tickers):
+        tickers = list(tickers)
+        with self._lock:
+            values = np.full((self.dates.size, len(tickers)), np.nan, dtype=np.float32)
+            for j, ticker in enumerate(tickers):
+                if ticker in self._rows:
+                    values[:, j] = self._values[self._rows[ticker]]
+            dates = self.dates
+        frame = pd.DataFrame(values, index=dates, columns=tickers)
+        return frame[~np.isnan(values).all(axis=1)]
@@ -0,0 +1,103 @@
+import pandas as pd
+
+from stocks import analytics
+from utils.cache import ByteLRUCache
+
+# --- 정렬된 가격 표 캐시 ---
+# (기간, 종목 집합)마다 날짜로 맞춘 종가 표와 정규화(첫 거래일 = 100) 표를 한 번만 만들어 모든 세션이 함께 씀
+# 열은 항상 티커 순서로 정렬하므로 같은 종목 집합이면 선택 순서와 관계없이 같은 항목을 찾음
+# 캐시에 없으면 이미 있는 표를 재활용함:
+#   찜을 하나 뺐을 때: 그 종목들을 모두 포함하는 표에서 열만 골라냄
+#   찜을 하나 더했을 때: 그 종목들의 일부를 가진 표에 새 종목 열만 행렬에서 가져와 붙임
+# 행렬의 행이 다시 채워지면(버전이 바뀌면) 그 종목을 포함한 표는 다시 만듦
+
+PANEL_CACHE_BYTES = 64 * 1024 * 1024
+PANEL_CACHE_ENTRIES = 256
+
+
+class AlignedPanel:
+    def __init__(self, prices, normalized, versions):
+        self.prices = prices
+        self.normalized = normalized
+        self.versions = versions  # {티커: 행렬의 행 버전}
+        self.tickers = tuple(prices.columns)
+
+    @property
+    def nbytes(self):
+        return int(self.prices.memory_usage().sum() + self.normalized.memory_usage().sum())
+
+    def is_current(self, versions):
+        return all(self.versions.get(t) == v for t, v in versions.items())
+
+
+class PanelCache:
+    def __init__(self, max_bytes=PANEL_CACHE_BYTES, max_entries=PANEL_CACHE_ENTRIES):
+        self._cache = ByteLRUCache(max_bytes, max_entries)
+        self.builds = 0
+        self.reuses = 0
+
+    @property
+    def hits(self):
+        return self._cache.hits
+
+    def get(self, matrix, tickers):
+        tickers = tuple(sorted(set(tickers)))
+        matrix.ensure(tickers)
+        versions = dict(zip(tickers, matrix.versions(tickers)))
+        key = (matrix.start, matrix.end, frozenset(tickers))
+        entry = self._cache.get(key)
+        if entry is not None and entry.is_current(versions):
+            return entry
+
+        entry = self._from_cached(matrix, tickers, versions) or self._build(matrix, tickers, versions)
+        self._cache.put(key, entry, entry.nbytes)
+        return entry
+
+    def _build(self, matrix, tickers, versions):
+        self.builds += 1
+        prices = matrix.panel(tickers)
+        return AlignedPanel(prices, analytics.normalize(prices), versions)
+
+    # 같은 기간의 캐시된 표 중 재활용할 수 있는 것으로 만듦 (없으면 None)
+    def _from_cached(self, matrix, tickers, versions):
+        wanted = set(tickers)
+        supersets, subsets = [], []
+        for start, end, key_tickers in self._cache.keys():
+            if (start, end) != (matrix.start, matrix.end) or not key_tickers:
+                continue
+            if wanted < key_tickers:
+                supersets.append(key_tickers)
+            elif key_tickers < wanted:
+                subsets.append(key_tickers)
+
+        # 가장 작은 상위 집합에서 열만 골라냄 (모든 열이 비어 있는 날은 뺌)
+        for key_tickers in sorted(supersets, key=len):
+            source = self._cache.get((matrix.start, matrix.end, key_tickers))
+            if source is not None and source.is_current(versions):
+                self.reuses += 1
+                columns = list(tickers)
+                rows = source.prices[columns].notna().any(axis=1).to_numpy()
+                return AlignedPanel(
+                    source.prices.loc[rows, columns], source.normalized.loc[rows, columns], versions
+                )
+
+        # 가장 큰 부분 집합에 새 종목 열만 붙임
+        for key_tickers in sorted(subsets, key=len, reverse=True):
+            source = self._cache.get((matrix.start, matrix.end, key_tickers))
+            if source is not None and source.is_current({t: versions[t] for t in key_tickers}):
+                self.reuses += 1
+                added = matrix.panel(sorted(wanted - key_tickers))
+                columns = list(tickers)
+                prices = source.prices.join(added, how="outer")[columns]
+                normalized = source.normalized.join(analytics.normalize(added), how="outer")[columns]
+                return AlignedPanel(prices, normalized, versions)
+        return None
+
+    def stats(self):
+        return {
+            "entries": len(self._cache),
+            "bytes": self._cache.current_bytes,
+            "hits": self._cache.hits,
+            "builds": self.builds,
+            "reuses": self.reuses,
+        }
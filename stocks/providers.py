@@ -0,0 +1,264 @@
+import io
+import os
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from stocks.fetch import FetchError
+
+# --- 시세 데이터 공급자 ---
+# 페이지는 공급자의 fetch_panel(종목 목록, 시작, 끝)만 호출함 -> 날짜 인덱스, 종목별 열의 종가 표
+# 날짜 구간은 [start, end) (end는 포함하지 않음)이고, 받지 못한 종목은 열이 없거나 전부 NaN
+#   yfinance: Yahoo Finance에서 받음 (네트워크)
+#   http: 시세 HTTP 서버에서 받음 (네트워크, 로컬 가짜 서버 stocks.fakeserver로 시험 가능)
+#   files: 디렉터리 안의 "티커.csv" / "티커.parquet" 파일 (Date, Close 열)
+#   synthetic: 시드가 고정된 기하 브라운 운동(GBM)으로 만든 가상 종가 (네트워크 없이 수천 종목)
+# persistent가 True인 공급자만 디스크 저장소(stocks.store)에 쌓아 둠 (나머지는 이미 로컬에 있음)
+# 네트워크 공급자는 다시 시도하면 될 수 있는 오류를 stocks.fetch.FetchError로 올림
+
+MARKET_CLOSURE_DAYS = 7  # 거래소가 연달아 쉬는 가장 긴 기간으로 봄: 이보다 긴 구간이 통째로 비면 받지 못한 것
+PERMANENT_ERRORS = ("delisted", "no price data", "no data found", "not found")  # 다시 시도해도 소용없는 yfinance 오류
+
+
+class YFinanceProvider:
+    name = "yfinance"
+    persistent = True
+
+    # 일괄 요청에서 빠진 종목을 다시 받을 때 동시에 보낼 개별 요청 수
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
+        self._stats_lock = threading.Lock()
+        self.failures = 0  # 개별 요청에서 실패한 종목 수
+        self.last_error = None
+
+    # 한 종목을 따로 받음 -> (종가 Series, None) 또는 실패하면 (None, 오류)
+    def _fetch_one(self, ticker, start, end):
+        try:
+            return self.fetch_close(ticker, start, end), None
+        except Exception as e:
+            with self._stats_lock:
+                self.failures += 1
+                self.last_error = f"{ticker}: {type(e).__name__}: {e}"
+            return None, e
+
+    def fetch_close(self, ticker, start, end):
+        import yfinance as yf
+
+        series = yf.Ticker(ticker).history(start=start, end=end)["Close"]
+        # history()는 거래소 시간대가 붙은 시각을 주므로 일괄 요청과 같은 날짜 인덱스로 맞춤
+        if series.index.tz is not None:
+            series.index = series.index.tz_localize(None)
+        series.index = series.index.normalize()
+        return series
+
+    # yfinance가 종목별로 남긴 오류 메시지 -> {티커: 메시지}
+    # 비공개 속성(yf.shared._ERRORS)이라 버전에 따라 없을 수 있음: 실패 판단은 받은 표로 하고 이 값은 덧붙이는 신호로만 씀
+    @staticmethod
+    def _download_errors(tickers):
+        import yfinance as yf
+
+        errors = getattr(getattr(yf, "shared", None), "_ERRORS", None) or {}
+        return {t: str(errors[t]) for t in tickers if t in errors}
+
+    # 받은 표에서 실패를 알아냄: 휴장일만으로 채울 수 없는 긴 구간에서 한 종목도 값이 없으면 받지 못한 것
+    # (yfinance는 네트워크 오류를 예외 없이 빈 표로 돌려주기도 함)
+    @staticmethod
+    def _nothing_received(panel, start, end):
+        long_window = (pd.Timestamp(end) - pd.Timestamp(start)).days > MARKET_CLOSURE_DAYS
+        return long_window and not panel.notna().to_numpy().any()
+
+    # 여러 종목을 한 번의 일괄 요청으로 받고, 빠진 종목만 스레드 풀에서 동시에 따로 받아 채움
+    # 따로 받다가 실패한 종목은 열을 빼고 나머지로 만든 표를 돌려줌 (실패는 stats()로 확인)
+    # 받은 종목이 하나도 없이 모두 실패했을 때만 FetchError로 올려서 요청 계층이 다시 시도하게 함
+    def fetch_panel(self, tickers, start, end):
+        import yfinance as yf
+
+        tickers = list(tickers)
+        data = yf.download(tickers, start=start, end=end, auto_adjust=True, progress=False, threads=True)
+        panel = data["Close"] if not data.empty else pd.DataFrame(columns=tickers, dtype=float)
+        if isinstance(panel, pd.Series):
+            panel = panel.to_frame(tickers[0])
+        # 일괄 요청이 통째로 비었을 때 yfinance가 남긴 오류가 일시적인 것이면 종목별로 다시 받지 않고 바로 올림
+        if self._nothing_received(panel, start, end):
+            errors = self._download_errors(tickers).values()
+            transient = [m for m in errors if not any(p in m.lower() for p in PERMANENT_ERRORS)]
+            if transient:
+                raise FetchError(transient[0])
+
+        missing = [t for t in tickers if t not in panel.columns or panel[t].isna().all()]
+        failed = []
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as pool:
+                fetched = pool.map(lambda t: self._fetch_one(t, start, end), missing)
+                for t, (series, error) in zip(missing, fetched):
+                    panel = panel.drop(columns=t, errors="ignore")
+                    if error is None:
+                        panel = panel.join(series.rename(t), how="outer")
+                    else:
+                        failed.append((t, error))
+        if failed and len(failed) == len(tickers):
+            ticker, error = failed[0]
+            raise FetchError(f"{len(failed)}개 종목을 받지 못했습니다 ({ticker}: {type(error).__name__}: {error})")
+        failed_tickers = {t for t, _ in failed}
+        panel = panel.reindex(columns=[t for t in tickers if t not in failed_tickers]).sort_index()
+        # 종목별로 다시 받아도 값이 하나도 없으면 일시적인 오류로 보고 요청 계층이 다시 시도하게 함
+        # 단, yfinance가 모든 종목에 상장 폐지/데이터 없음 오류를 남겼으면 빈 표를 그대로 돌려줌
+        if self._nothing_received(panel, start, end):
+            errors = self._download_errors(tickers)
+            permanent = [t for t, m in errors.items() if any(p in m.lower() for p in PERMANENT_ERRORS)]
+            if len(permanent) < len(tickers):
+                ticker = next((t for t in tickers if t not in permanent), tickers[0])
+                raise FetchError(f"{len(tickers)}개 종목 모두 {start}~{end} 구간의 종가를 받지 못했습니다 "
+                                 f"({ticker}: {errors.get(ticker, '빈 응답')})")
+        return panel
+
+    def stats(self):
+        with self._stats_lock:
+            return {"failures": self.failures, "last_error": self.last_error}
+
+
+# GET {base_url}/prices?tickers=A,B&start=YYYY-MM-DD&end=YYYY-MM-DD -> Date, ticker, close 열의 CSV (긴 형식)
+class HttpProvider:
+    name = "http"
+    persistent = True
+    RETRY_STATUS = (408, 425, 429, 500, 502, 503, 504)
+
+    def __init__(self, base_url, timeout=30):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def fetch_panel(self, tickers, start, end):
+        tickers = list(tickers)
+        query = urllib.parse.urlencode({"tickers": ",".join(tickers), "start": str(start), "end": str(end)})
+        try:
+            with urllib.request.urlopen(f"{self.base_url}/prices?{query}", timeout=self.timeout) as response:
+                text = response.read().decode("utf-8")
+        except urllib.error.HTTPError as e:
+            if e.code in self.RETRY_STATUS:
+                raise FetchError(f"HTTP {e.code}") from e
+            raise
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+            raise FetchError(str(e)) from e
+        frame = pd.read_csv(io.StringIO(text), parse_dates=["Date"])
+        panel = frame.pivot(index="Date", columns="ticker", values="close")
+        return panel.reindex(columns=tickers).sort_index().astype(float)
+
+
+class FileProvider:
+    name = "files"
+    persistent = False
+    EXTENSIONS = (".parquet", ".csv")
+
+    def __init__(self, directory):
+        if not os.path.isdir(directory):
+            raise ValueError(f"시세 파일 디렉터리가 없습니다: {directory}")
+        self.directory = directory
+        self._series = {}
+
+    # 디렉터리에 파일이 있는 종목 목록
+    def tickers(self):
+        names = {os.path.splitext(f)[0] for f in os.listdir(self.directory) if f.endswith(self.EXTENSIONS)}
+        return sorted(names)
+
+    # 종목 파일 전체를 한 번만 읽어 두고 이후에는 구간만 잘라 씀
+    def _load(self, ticker):
+        if ticker not in self._series:
+            series = None
+            for ext in self.EXTENSIONS:
+                path = os.path.join(self.directory, ticker + ext)
+                if os.path.exists(path):
+                    frame = pd.read_parquet(path) if ext == ".parquet" else pd.read_csv(path)
+                    frame = frame.set_index("Date") if "Date" in frame.columns else frame
+                    series = frame["Close"].astype(float)
+                    series.index = pd.DatetimeIndex(pd.to_datetime(series.index), name="Date")
+                    if series.index.tz is not None:
+                        series.index = series.index.tz_localize(None)
+                    series = series.sort_index()
+                    break
+            self._series[ticker] = series
+        return self._series[ticker]
+
+    def fetch_panel(self, tickers, start, end):
+        tickers = list(tickers)
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        columns = {}
+        for ticker in tickers:
+            series = self._load(ticker)
+            if series is not None:
+                columns[ticker] = series[(series.index >= start) & (series.index < end)]
+        return pd.DataFrame(columns, dtype=float).reindex(columns=tickers).sort_index()
+
+
+class SyntheticProvider:
+    name = "synthetic"
+    persistent = False
+    TRADING_DAYS = 252
+
+    # 종목마다 (seed, 티커)로 난수를 만들어 origin부터의 경로를 생성하므로
+    # 어떤 구간을 어떤 순서로 요청해도 같은 날의 값은 항상 같음
+    def __init__(self, seed=0, mu=0.08, sigma=0.3, start_price=100.0, origin="2000-01-03"):
+        self.seed = seed
+        self.mu = mu
+        self.sigma = sigma
+        self.start_price = start_price
+        self.origin = pd.Timestamp(origin)
+
+    def tickers(self, n=1000):
+        return [f"SYN{i:04d}" for i in range(n)]
+
+    def _path(self, ticker, n_days):
+        rng = np.random.default_rng([self.seed, zlib.crc32(ticker.encode())])
+        # 종목마다 기대 수익률, 변동성, 시작 가격도 조금씩 다르게
+        mu = rng.normal(self.mu, 0.1)
+        sigma = self.sigma * rng.lognormal(0.0, 0.3)
+        price0 = self.start_price * rng.lognormal(0.0, 0.5)
+        dt = 1.0 / self.TRADING_DAYS
+        log_returns = (mu - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * rng.standard_normal(n_days)
+        log_returns[0] = 0.0
+        return price0 * np.exp(np.cumsum(log_returns))
+
+    def fetch_panel(self, tickers, start, end):
+        tickers = list(tickers)
+        days = pd.bdate_range(self.origin, pd.Timestamp(end), inclusive="left", name="Date")
+        keep = days >= pd.Timestamp(start)
+        values = np.empty((int(keep.sum()), len(tickers)))
+        for j, ticker in enumerate(tickers):
+            values[:, j] = self._path(ticker, days.size)[keep]
+        return pd.DataFrame(values, index=days[keep], columns=tickers)
+
+
+PROVIDERS = {
+    "yfinance": YFinanceProvider,
+    "http": HttpProvider,
+    "files": FileProvider,
+    "synthetic": SyntheticProvider,
+}
+
+
+# 이름과 옵션으로 공급자를 만듦
+def get_provider(name="yfinance", **options):
+    if name not in PROVIDERS:
+        raise ValueError(f"알 수 없는 시세 공급자: {name} ({', '.join(PROVIDERS)})")
+    return PROVIDERS[name](**options)
+
+
+# 환경 변수로 공급자를 고름 (기본: yfinance)
+#   MARKET_DATA_PROVIDER=files MARKET_DATA_PATH=./prices streamlit run main.py
+#   MARKET_DATA_PROVIDER=synthetic MARKET_DATA_SEED=42 streamlit run main.py
+#   MARKET_DATA_PROVIDER=http MARKET_DATA_URL=http://127.0.0.1:8765 streamlit run main.py
+def provider_from_env(environ=os.environ):
+    name = environ.get("MARKET_DATA_PROVIDER", "yfinance")
+    options = {}
+    if name == "http":
+        options["base_url"] = environ.get("MARKET_DATA_URL", "http://127.0.0.1:8765")
+    elif name == "files":
+        options["directory"] = environ.get("MARKET_DATA_PATH", "prices")
+    elif name == "synthetic":
+        options["seed"] = int(environ.get("MARKET_DATA_SEED", 0))
+    return get_provider(name, **options)
@@ -0,0 +1,155 @@
+import datetime
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+# --- 디스크에 남는 종가 저장소 ---
+# 종목마다 받은 일별 종가와 "어느 기간까지 받아 두었는지(coverage)"를 SQLite 파일에 기록함
+# 서버를 다시 켜도 디스크에서 바로 읽고, 네트워크로는 저장된 기간 밖의 부분(새 거래일 등)만 받음
+# 뒤쪽 구간을 물어봤는데 새 값이 없으면(주말, 휴장일) 확인 시각만 남기고 recheck_seconds 동안 다시 묻지 않음
+# (기본 RECHECK_SECONDS, stocks.market은 예열 주기에 맞춘 더 짧은 값을 넘김)
+# 앞쪽 구간이 비어 있으면(상장 전) 나중에도 값이 생기지 않으므로 그 구간도 받은 것으로 기록함
+
+RECHECK_SECONDS = 6 * 3600
+
+DEFAULT_STORE_PATH = os.environ.get(
+    "PRICE_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "prices.sqlite"),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS prices (
+    ticker TEXT NOT NULL,
+    date TEXT NOT NULL,
+    close REAL NOT NULL,
+    PRIMARY KEY (ticker, date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    ticker TEXT PRIMARY KEY,
+    start TEXT NOT NULL,
+    end TEXT NOT NULL,
+    checked REAL NOT NULL
+);
+"""
+
+
+def _iso(day):
+    return pd.Timestamp(day).strftime("%Y-%m-%d")
+
+
+# 날짜 구간은 모두 [start, end) (end는 포함하지 않음, yfinance의 start/end와 같음)
+class PriceStore:
+    def __init__(self, path=DEFAULT_STORE_PATH, recheck_seconds=RECHECK_SECONDS):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.recheck_seconds = recheck_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    # 저장해 둔 기간 -> (start, end 날짜, 마지막 확인 시각) 또는 None
+    def coverage(self, ticker):
+        with self._lock:
+            row = self._conn.execute("SELECT start, end, checked FROM coverage WHERE ticker = ?", (ticker,)).fetchone()
+        if row is None:
+            return None
+        return datetime.date.fromisoformat(row[0]), datetime.date.fromisoformat(row[1]), row[2]
+
+    # [start, end) 중 아직 받지 않은 구간 목록 (앞쪽, 뒤쪽 최대 두 개)
+    # 구간은 저장 기간까지 이어서 돌려줌: 요청이 저장 기간과 떨어져 있어도 받은 뒤 저장 기간 하나로 합칠 수 있음
+    def missing_ranges(self, ticker, start, end):
+        covered = self.coverage(ticker)
+        if covered is None:
+            return [(start, end)] if start < end else []
+        covered_start, covered_end, checked = covered
+        gaps = []
+        if start < covered_start:
+            gaps.append((start, covered_start))
+        if covered_end < end and time.time() - checked >= self.recheck_seconds:
+            gaps.append((covered_end, end))
+        return gaps
+
+    # [start, end) 구간에서 받은 종가를 저장하고 저장 기간을 넓힘
+    # 받은 값이 없으면(휴장일뿐인 구간) 기간은 넓히지 않고 확인 시각만 남김
+    # 단, 저장 기간 바로 앞 구간이 비어 있으면 상장 전이므로 시작일을 start로 옮김 (그러지 않으면 매번 다시 받음)
+    # 네트워크 오류는 요청 계층에서 예외로 올라오므로 여기까지 오지 않음
+    # 뒤쪽 끝은 마지막으로 받은 거래일 다음 날까지만 인정함
+    # 저장 기간은 하나뿐이므로 겹치거나 맞닿은 구간만 합침: 떨어진 구간을 합치면 사이의 받지 않은 날까지 받은 것이 됨
+    # (떨어진 구간은 종가만 저장하고 저장 기간은 그대로 둠 -> 그 구간은 다음에도 빠진 구간으로 남음)
+    def write(self, ticker, series, start, end):
+        series = series.dropna()
+        covered = self.coverage(ticker)
+        touching = covered is None or (start <= covered[1] and end >= covered[0])
+        if series.empty:
+            if covered is not None and touching:
+                covered_start = covered[0]
+                if start < covered_start <= end:
+                    covered_start = start
+                with self._lock, self._conn:
+                    self._conn.execute(
+                        "UPDATE coverage SET start = ?, checked = ? WHERE ticker = ?",
+                        (_iso(covered_start), time.time(), ticker),
+                    )
+            return
+        days = series.index.to_numpy().astype("datetime64[D]").astype(str).tolist()
+        rows = list(zip([ticker] * len(days), days, series.to_numpy(dtype=float).tolist()))
+        fetched_end = min(end, series.index.max().date() + datetime.timedelta(days=1))
+        if covered is not None:
+            start, fetched_end = min(start, covered[0]), max(fetched_end, covered[1])
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO prices (ticker, date, close) VALUES (?, ?, ?)", rows)
+            if touching:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO coverage (ticker, start, end, checked) VALUES (?, ?, ?, ?)",
+                    (ticker, _iso(start), _iso(fetched_end), time.time()),
+                )
+
+    # 한 종목의 [start, end) 종가 -> 날짜 인덱스의 Series
+    def read(self, ticker, start, end):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, close FROM prices WHERE ticker = ? AND date >= ? AND date < ? ORDER BY date",
+                (ticker, _iso(start), _iso(end)),
+            ).fetchall()
+        index = pd.DatetimeIndex([date for date, _ in rows], name="Date")
+        return pd.Series([close for _, close in rows], index=index, name="Close", dtype=float)
+
+    # 여러 종목의 [start, end) 종가 -> 날짜로 맞춘 표 (종목별 열, 없는 날은 NaN)
+    def read_panel(self, tickers, start, end):
+        tickers = list(tickers)
+        placeholders = ", ".join("?" * len(tickers))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT date, ticker, close FROM prices WHERE ticker IN ({placeholders}) AND date >= ? AND date < ?",
+                (*tickers, _iso(start), _iso(end)),
+            ).fetchall()
+        frame = pd.DataFrame(rows, columns=["Date", "ticker", "close"])
+        panel = frame.pivot(index="Date", columns="ticker", values="close")
+        panel.index = pd.DatetimeIndex(panel.index, name="Date")
+        panel.columns.name = None
+        return panel.reindex(columns=tickers).sort_index()
+
+    # 저장소를 최신으로 맞춤: 종목마다 빠진 구간을 구하고, 같은 구간끼리 묶어 fetch_panel(종목 목록, 시작, 끝)을 한 번씩 호출
+    # fetch_panel은 종목별 열을 가진 종가 표를 반환해야 함 (받지 못한 종목은 열을 뺌) -> 요청한 (종목, 구간) 수를 반환
+    def sync(self, tickers, start, end, fetch_panel):
+        groups = {}
+        for ticker in tickers:
+            for gap in self.missing_ranges(ticker, start, end):
+                groups.setdefault(gap, []).append(ticker)
+        for (gap_start, gap_end), group in groups.items():
+            panel = fetch_panel(group, gap_start, gap_end)
+            for ticker in group:
+                # 열이 없으면 받지 못한 종목이므로 저장 기간도 확인 시각도 남기지 않음 (다음에 다시 받음)
+                if ticker in panel.columns:
+                    self.write(ticker, panel[ticker], gap_start, gap_end)
+        return sum(len(group) for group in groups.values())
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
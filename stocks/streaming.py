@@ -0,0 +1,214 @@
+import math
+import os
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# --- 실시간/재생 스트리밍 ---
+# 틱이나 분봉이 한 개씩 들어올 때마다 종목별 고정 크기 링 버퍼에 넣고
+# 수익률, 이동 변동성, VWAP를 전체를 다시 계산하지 않고 들어온 값과 밀려난 값만으로 갱신함
+# 버퍼와 누적값의 크기가 고정이라 스트림이 아무리 길어도 메모리는 일정함
+
+Bar = namedtuple("Bar", ["time", "ticker", "price", "volume"])
+
+TRADING_DAYS = 252
+TRADING_SECONDS_PER_DAY = 6.5 * 3600
+RECOMPUTE_EVERY = 10_000  # 이동 합의 부동소수점 오차가 쌓이지 않도록 가끔 버퍼에서 다시 더함
+
+
+# 정해진 개수만 담는 원형 버퍼: 가득 차면 가장 오래된 값을 밀어내고 그 값을 반환
+class RingBuffer:
+    def __init__(self, capacity, dtype=float):
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=dtype)
+        self._start = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, value):
+        evicted = None
+        if self.size < self.capacity:
+            self._data[(self._start + self.size) % self.capacity] = value
+            self.size += 1
+        else:
+            evicted = self._data[self._start]
+            self._data[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+        return evicted
+
+    # 오래된 값부터 순서대로 (사본)
+    def values(self):
+        end = self._start + self.size
+        if end <= self.capacity:
+            return self._data[self._start:end].copy()
+        return np.concatenate([self._data[self._start:], self._data[:end - self.capacity]])
+
+    def last(self):
+        return self._data[(self._start + self.size - 1) % self.capacity]
+
+
+# 막대 간격으로 1년에 들어 있는 막대 수를 추정 (변동성 연율화용): 일봉 이상이면 252
+def periods_per_year(bar_seconds):
+    if not bar_seconds or bar_seconds >= 86400 * 0.5:
+        return TRADING_DAYS
+    return TRADING_DAYS * TRADING_SECONDS_PER_DAY / bar_seconds
+
+
+# 한 종목의 스트림: capacity개의 최근 막대와 window개 수익률의 이동 합을 들고 있음
+class TickerStream:
+    def __init__(self, ticker, capacity=1000, window=30):
+        self.ticker = ticker
+        self.times = RingBuffer(capacity, dtype="datetime64[ns]")
+        self.prices = RingBuffer(capacity)
+        self.volumes = RingBuffer(capacity)
+        self.returns = RingBuffer(window)
+        self.n_bars = 0
+        self.first_price = None
+        self._sum_r = 0.0
+        self._sum_r2 = 0.0
+        self._sum_pv = 0.0  # 버퍼 안 막대들의 가격 x 거래량 합
+        self._sum_v = 0.0
+        self._session_pv = 0.0  # 스트림 시작부터의 누적 (세션 VWAP)
+        self._session_v = 0.0
+
+    def update(self, time, price, volume=1.0):
+        price = float(price)
+        volume = 1.0 if volume is None or math.isnan(volume) else float(volume)
+        if self.n_bars:
+            previous = self.prices.last()
+            r = math.log(price / previous) if previous > 0 and price > 0 else 0.0
+            evicted = self.returns.append(r)
+            self._sum_r += r
+            self._sum_r2 += r * r
+            if evicted is not None:
+                self._sum_r -= evicted
+                self._sum_r2 -= evicted * evicted
+        else:
+            self.first_price = price
+
+        self.times.append(np.datetime64(pd.Timestamp(time).to_datetime64(), "ns"))
+        evicted_price = self.prices.append(price)
+        evicted_volume = self.volumes.append(volume)
+        self._sum_pv += price * volume
+        self._sum_v += volume
+        if evicted_price is not None:
+            self._sum_pv -= evicted_price * evicted_volume
+            self._sum_v -= evicted_volume
+        self._session_pv += price * volume
+        self._session_v += volume
+
+        self.n_bars += 1
+        if self.n_bars % RECOMPUTE_EVERY == 0:
+            self._recompute()
+
+    def _recompute(self):
+        r = self.returns.values()
+        self._sum_r, self._sum_r2 = float(r.sum()), float((r * r).sum())
+        p, v = self.prices.values(), self.volumes.values()
+        self._sum_pv, self._sum_v = float((p * v).sum()), float(v.sum())
+
+    # 최근 막대 간격 (초)
+    def bar_seconds(self):
+        if len(self.times) < 2:
+            return None
+        times = self.times
+        last = times.last()
+        previous = times._data[(times._start + times.size - 2) % times.capacity]
+        return float((last - previous) / np.timedelta64(1, "s"))
+
+    # 현재 지표: 스트림 시작 대비 수익률(%), 이동 변동성(연율화, %), 버퍼 VWAP, 세션 VWAP
+    def metrics(self):
+        n = len(self.returns)
+        volatility = None
+        if n >= 2:
+            variance = max((self._sum_r2 - self._sum_r * self._sum_r / n) / (n - 1), 0.0)
+            volatility = math.sqrt(variance * periods_per_year(self.bar_seconds())) * 100
+        last = self.prices.last() if self.n_bars else None
+        return {
+            "bars": self.n_bars,
+            "last": last,
+            "growth": (last / self.first_price - 1) * 100 if self.n_bars else None,
+            "volatility": volatility,
+            "vwap": self._sum_pv / self._sum_v if self._sum_v else None,
+            "session_vwap": self._session_pv / self._session_v if self._session_v else None,
+        }
+
+    def series(self):
+        return pd.Series(self.prices.values(), index=pd.DatetimeIndex(self.times.values()), name=self.ticker)
+
+
+# 여러 종목의 스트림 묶음
+class StreamSet:
+    def __init__(self, capacity=1000, window=30):
+        self.capacity = capacity
+        self.window = window
+        self.streams = {}
+
+    def update(self, bar):
+        stream = self.streams.get(bar.ticker)
+        if stream is None:
+            stream = self.streams[bar.ticker] = TickerStream(bar.ticker, self.capacity, self.window)
+        stream.update(bar.time, bar.price, bar.volume)
+
+    def consume(self, feed, max_bars):
+        n = 0
+        for bar in feed:
+            self.update(bar)
+            n += 1
+            if n >= max_bars:
+                break
+        return n
+
+    # 버퍼 안의 가격을 시각으로 맞춘 표 (종목별 열)
+    def frame(self):
+        if not self.streams:
+            return pd.DataFrame()
+        return pd.concat([s.series() for s in self.streams.values()], axis=1).sort_index()
+
+    def metrics(self):
+        return pd.DataFrame({ticker: s.metrics() for ticker, s in self.streams.items()}).T
+
+
+# --- 피드 ---
+# 피드는 시간순 Bar를 하나씩 내보내는 반복자
+
+# 녹화 파일 재생: time, ticker, price(또는 close), volume 열을 가진 시간순 CSV/Parquet
+# 파일 전체를 읽지 않고 조각(chunk_size행) 단위로 읽음
+def replay_file(path, chunk_size=10_000):
+    if os.path.splitext(path)[1].lower() == ".parquet":
+        import pyarrow.parquet as pq
+
+        chunks = (batch.to_pandas() for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size))
+    else:
+        chunks = pd.read_csv(path, chunksize=chunk_size)
+    for chunk in chunks:
+        chunk.columns = [c.lower() for c in chunk.columns]
+        price = chunk["price"] if "price" in chunk.columns else chunk["close"]
+        volume = chunk["volume"] if "volume" in chunk.columns else pd.Series(1.0, index=chunk.index)
+        yield from map(Bar._make, zip(pd.to_datetime(chunk["time"]), chunk["ticker"].astype(str), price, volume))
+
+
+# 종가 표(날짜 x 종목)를 날짜순 막대로 재생 (거래량이 없으므로 1로 둠 -> VWAP는 단순 평균)
+def replay_panel(panel):
+    for time, row in zip(panel.index, panel.to_numpy(dtype=float)):
+        for ticker, price in zip(panel.columns, row):
+            if not math.isnan(price):
+                yield Bar(time, ticker, price, 1.0)
+
+
+# 피드를 다 쓰면 make_feed()로 처음부터 다시 재생 (메모리 확인용 무한 스트림)
+# 시각이 뒤로 가지 않도록 다시 재생할 때마다 (녹화 길이 + 하루)만큼 시각을 뒤로 미룸
+def looping(make_feed):
+    offset = pd.Timedelta(0)
+    while True:
+        first = last = None
+        for bar in make_feed():
+            first = bar.time if first is None else first
+            last = bar.time
+            yield bar._replace(time=bar.time + offset)
+        if first is None:
+            return
+        offset += last - first + pd.Timedelta(days=1)
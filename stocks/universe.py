@@ -0,0 +1,100 @@
+import io
+import os
+import urllib.request
+
+import pandas as pd
+
+from stocks.store import DEFAULT_STORE_PATH
+
+# --- 종목 목록 (유니버스) ---
+# 유니버스는 ticker, name, sector 열과 화면에 보일 label("이름 (티커)") 열을 가진 DataFrame
+# label 형식이 모든 유니버스에서 같으므로 찜 목록(label 집합)은 유니버스를 바꿔도 그대로 쓸 수 있음
+
+SP500_URL = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
+SP500_CACHE_PATH = os.path.join(os.path.dirname(DEFAULT_STORE_PATH), "sp500.csv")
+
+# 베타 계산과 예열에 쓰는 벤치마크 (S&P 500 ETF)
+BENCHMARK_TICKER = "SPY"
+
+# 시가총액 상위 10개 기업 (기본 유니버스, 네트워크 없이 사용 가능)
+TOP10 = [
+    ("AAPL", "Apple", "Information Technology"),
+    ("MSFT", "Microsoft", "Information Technology"),
+    ("NVDA", "NVIDIA", "Information Technology"),
+    ("AMZN", "Amazon", "Consumer Discretionary"),
+    ("GOOGL", "Alphabet", "Communication Services"),
+    ("META", "Meta", "Communication Services"),
+    ("BRK-B", "Berkshire Hathaway", "Financials"),
+    ("TSM", "TSMC", "Information Technology"),
+    ("LLY", "Eli Lilly", "Health Care"),
+    ("JPM", "JPMorgan Chase", "Financials"),
+]
+
+
+def make_universe(tickers, names=None, sectors=None):
+    tickers = [str(t).strip().upper() for t in tickers]
+    frame = pd.DataFrame({
+        "ticker": tickers,
+        "name": list(names) if names is not None else tickers,
+        "sector": list(sectors) if sectors is not None else "",
+    })
+    frame = frame[frame["ticker"] != ""].drop_duplicates("ticker").reset_index(drop=True)
+    frame["label"] = frame["name"] + " (" + frame["ticker"] + ")"
+    return frame
+
+
+def top10_universe():
+    tickers, names, sectors = zip(*TOP10)
+    return make_universe(tickers, names, sectors)
+
+
+# "이름 (티커)" 형식의 label에서 티커를 꺼냄
+def ticker_of(label):
+    return label.rsplit("(", 1)[-1].rstrip(")")
+
+
+# S&P 500 구성 종목: 위키백과 표를 한 번 받아 디스크에 저장해 두고 이후에는 파일에서 읽음
+# (pandas.read_html에는 lxml이 필요함)
+def sp500_universe(cache_path=SP500_CACHE_PATH, url=SP500_URL):
+    if not os.path.exists(cache_path):
+        request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            html = response.read().decode("utf-8")
+        table = pd.read_html(io.StringIO(html))[0]
+        frame = pd.DataFrame({
+            # yfinance는 BRK.B를 BRK-B로 씀
+            "ticker": table["Symbol"].str.replace(".", "-", regex=False),
+            "name": table["Security"],
+            "sector": table["GICS Sector"],
+        })
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+        frame.to_csv(cache_path, index=False)
+    frame = pd.read_csv(cache_path, keep_default_na=False)
+    return make_universe(frame["ticker"], frame["name"], frame["sector"])
+
+
+# 사용자가 준 목록: 티커를 쉼표/공백/줄바꿈으로 구분한 문자열, 또는 ticker(필수), name, sector 열이 있는 CSV
+def parse_universe(text):
+    text = text.strip()
+    if not text:
+        return make_universe([])
+    first_line = text.splitlines()[0].lower()
+    if "ticker" in first_line and "," in first_line:
+        frame = pd.read_csv(io.StringIO(text), keep_default_na=False)
+        frame.columns = [c.strip().lower() for c in frame.columns]
+        return make_universe(frame["ticker"], frame.get("name"), frame.get("sector"))
+    return make_universe(text.replace(",", " ").split())
+
+
+# 티커 또는 이름에 query가 들어 있고 sectors에 속하는 종목만 (대소문자 무시)
+def filter_universe(universe, query="", sectors=None):
+    mask = pd.Series(True, index=universe.index)
+    query = query.strip()
+    if query:
+        mask &= (
+            universe["ticker"].str.contains(query, case=False, regex=False)
+            | universe["name"].str.contains(query, case=False, regex=False)
+        )
+    if sectors:
+        mask &= universe["sector"].isin(sectors)
+    return universe[mask]
@@ -0,0 +1,103 @@
+import os
+import threading
+import time
+
+from stocks.market import RECHECK_SECONDS, period, shared_market_data
+from stocks.universe import BENCHMARK_TICKER, TOP10
+
+# --- 주가 데이터 예열 ---
+# 앱이 시작되면(main.py) 작업 스레드가 기본 종목(시가총액 Top10과 벤치마크)의 기본 기간 데이터를
+# 공용 행렬에 미리 채워 두고, 행이 오래되기(ROW_MAX_AGE) 전에 주기적으로 다시 채움
+# 그래서 첫 사용자도 이 종목들은 네트워크를 기다리지 않음
+# STOCK_WARMUP=0 환경 변수로 끌 수 있음
+
+WARMUP_YEARS = 3
+# 행이 만료되기(ROW_MAX_AGE) 전에 다시 채움, 저장소의 재확인 시간과 같으므로 채울 때마다 새 거래일을 업스트림에 물어봄
+WARMUP_INTERVAL = RECHECK_SECONDS
+RETRY_INTERVAL = 60  # 실패했을 때 다시 시도하기까지의 시간 (초)
+
+
+class PriceWarmup:
+    def __init__(self, market, tickers, years=WARMUP_YEARS, interval=WARMUP_INTERVAL, retry_interval=RETRY_INTERVAL):
+        self.market = market
+        self.tickers = list(tickers)
+        self.years = years
+        self.interval = interval
+        self.retry_interval = retry_interval
+        self.state = "시작 전"
+        self.status = {t: "대기" for t in self.tickers}
+        self.runs = 0
+        self.last_refresh = None
+        self.next_refresh = None
+        self.last_error = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="price-warmup", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    # 한 번 채움: 모든 종목을 한 번의 일괄 요청으로 다시 받아 공용 행렬에 넣음 -> 성공 여부
+    def refresh_once(self):
+        self.state = "불러오는 중"
+        for ticker in self.tickers:
+            self.status[ticker] = "불러오는 중"
+        matrix = self.market.matrix(*period(self.years))
+        matrix.ensure(self.tickers, refresh=True)
+        errors = [matrix.error(t) for t in self.tickers if matrix.error(t)]
+        for ticker in self.tickers:
+            if matrix.error(ticker):
+                self.status[ticker] = "오류"
+            else:
+                self.status[ticker] = "완료" if not matrix.series(ticker).empty else "데이터 없음"
+        if errors:
+            self.last_error = errors[0]
+            self.state = "오류"
+            return False
+        self.runs += 1
+        self.last_refresh = time.time()
+        self.last_error = None
+        self.state = "완료"
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            wait = self.interval if self.refresh_once() else self.retry_interval
+            self.next_refresh = time.time() + wait
+            self._stop.wait(wait)
+        self.state = "중지"
+
+    # 화면 표시용 상태 사본
+    def snapshot(self):
+        return {
+            "state": self.state,
+            "status": dict(self.status),
+            "runs": self.runs,
+            "last_refresh": self.last_refresh,
+            "next_refresh": self.next_refresh,
+            "last_error": self.last_error,
+        }
+
+
+_warmup = None
+_warmup_lock = threading.Lock()
+
+
+# 프로세스마다 한 번만 예열 스레드를 시작하고 그 객체를 반환 (꺼져 있으면 None)
+def start_warmup(tickers=None):
+    global _warmup
+    if os.environ.get("STOCK_WARMUP", "1") == "0":
+        return None
+    with _warmup_lock:
+        if _warmup is None:
+            if tickers is None:
+                tickers = [ticker for ticker, _, _ in TOP10] + [BENCHMARK_TICKER]
+            _warmup = PriceWarmup(shared_market_data(), tickers).start()
+        return _warmup
@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import threading
+from types import MappingProxyType
+
+from travel.geo import GeoIndex
+from travel.search import SpotIndex
+
+# --- 관광 안내 카탈로그 ---
+# 관광지, 과학자, 영화 등 여행 페이지(01, 02)가 보여 주는 모든 데이터를 JSON 파일 하나(travel/data/catalog.json)에 모아 둠
+# 파일은 프로세스마다 한 번 읽어 검사하고 지역별/이름별 조회표를 미리 만들어 모든 세션이 함께 씀
+# (재실행마다 큰 딕셔너리를 새로 만들지 않으므로 카탈로그 크기가 재실행 시간과 세션별 메모리에 영향을 주지 않음)
+# 공유하는 값이므로 페이지에서 고치면 안 됨 (조회표는 읽기 전용 매핑)
+# 사용 예:
+#   TRAVEL_CATALOG=/path/to/catalog.json streamlit run main.py
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "catalog.json")
+SCHEMA_VERSION = 1
+
+# 컬렉션별 필수 필드와 형식 (다른 필드가 더 있어도 됨)
+SCHEMA = {
+    "spots": {"name": str, "region": str, "lat": float, "lon": float, "description": str, "image": str},
+    "scientists": {"name": str, "region": str, "description": str},
+    "movies": {"title": str, "region": str, "description": str},
+    "guide_spots": {"name": str, "region": str, "lat": float, "lon": float, "description": str},
+    "cities": {"name": str, "image": str, "scientist": str, "achievement": str},
+    "culture_places": {"name": str, "description": str, "image": str, "media": list},
+}
+# region이 regions 목록에 있어야 하는 컬렉션, 이름이 겹치면 안 되는 컬렉션
+REGIONAL = ("spots", "scientists", "movies")
+UNIQUE_NAMES = ("spots", "guide_spots", "cities", "culture_places")
+
+
+def _check_type(value, kind, where):
+    if kind is float:
+        ok = isinstance(value, (int, float)) and not isinstance(value, bool)
+    else:
+        ok = isinstance(value, kind)
+    if not ok:
+        raise ValueError(f"{where}: {kind.__name__} 형식이어야 합니다 ({value!r})")
+
+
+# 스키마에 맞지 않으면 어디가 틀렸는지 알려 주는 ValueError
+def validate(data):
+    if not isinstance(data, dict):
+        raise ValueError("카탈로그 최상위는 객체여야 합니다")
+    if data.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"지원하지 않는 카탈로그 스키마: {data.get('schema')!r} (지원: {SCHEMA_VERSION})")
+    regions = data.get("regions")
+    if not isinstance(regions, list) or not all(isinstance(r, str) for r in regions):
+        raise ValueError("regions: 문자열 목록이어야 합니다")
+    for collection, fields in SCHEMA.items():
+        items = data.get(collection)
+        if not isinstance(items, list):
+            raise ValueError(f"{collection}: 목록이어야 합니다")
+        names = set()
+        for i, item in enumerate(items):
+            where = f"{collection}[{i}]"
+            if not isinstance(item, dict):
+                raise ValueError(f"{where}: 객체여야 합니다")
+            for field, kind in fields.items():
+                if field not in item:
+                    raise ValueError(f"{where}: '{field}' 필드가 없습니다")
+                _check_type(item[field], kind, f"{where}.{field}")
+            if "lat" in fields and not (-90 <= item["lat"] <= 90 and -180 <= item["lon"] <= 180):
+                raise ValueError(f"{where}: 좌표가 범위를 벗어났습니다 ({item['lat']}, {item['lon']})")
+            if collection in REGIONAL and item["region"] not in regions:
+                raise ValueError(f"{where}: regions에 없는 지역입니다 ({item['region']})")
+            if collection in UNIQUE_NAMES:
+                if item["name"] in names:
+                    raise ValueError(f"{where}: 이름이 겹칩니다 ({item['name']})")
+                names.add(item["name"])
+    return data
+
+
+def _by_region(regions, items):
+    groups = {region: [] for region in regions}
+    for item in items:
+        groups[item["region"]].append(item)
+    return MappingProxyType({region: tuple(group) for region, group in groups.items()})
+
+
+def _by_name(items):
+    return MappingProxyType({item["name"]: item for item in items})
+
+
+class Catalog:
+    def __init__(self, data, version=None):
+        validate(data)
+        self.version = version  # 파일 내용의 해시 (지도 등 카탈로그에서 만든 결과를 캐시할 때 키로 씀)
+        self.regions = tuple(data["regions"])
+        # 02: 지역 탭 순서대로의 관광지, 과학자, 영화
+        self.spots = tuple(data["spots"])
+        self.spots_by_region = _by_region(self.regions, self.spots)
+        self.spot_by_name = _by_name(self.spots)
+        self.scientists_by_region = _by_region(self.regions, data["scientists"])
+        self.movies_by_region = _by_region(self.regions, data["movies"])
+        # 01: 검색/지도용 관광지, 주요 도시, 문화 & 유적지
+        self.guide_spots = tuple(data["guide_spots"])
+        self.guide_by_name = _by_name(self.guide_spots)
+        self.cities = _by_name(data["cities"])
+        self.culture_places = _by_name(data["culture_places"])
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    # 컬렉션("spots", "guide_spots")의 검색 색인 (처음 찾을 때 한 번 만듦, 결과는 그 컬렉션의 번호)
+    def index(self, collection="spots"):
+        return self._shared_index(SpotIndex, collection)
+
+    # 좌표가 있는 컬렉션의 공간 색인 (travel.geo, 결과는 그 컬렉션의 번호)
+    def geo_index(self, collection="spots"):
+        return self._shared_index(GeoIndex.from_spots, collection)
+
+    def _shared_index(self, build, collection):
+        with self._lock:
+            index = self._indexes.get((build, collection))
+            if index is None:
+                index = self._indexes[(build, collection)] = build(getattr(self, collection))
+            return index
+
+
+def load_catalog(path=CATALOG_PATH):
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"카탈로그 JSON을 읽을 수 없습니다: {path} ({e})") from e
+    return Catalog(data, version=hashlib.sha256(raw).hexdigest()[:16])
+
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+# 프로세스 공용 카탈로그 (TRAVEL_CATALOG 환경 변수로 다른 파일을 쓸 수 있음)
+# 파일이 바뀌면(수정 시각) 다시 읽고, 그렇지 않으면 stat 한 번으로 끝남
+def shared_catalog(path=None):
+    path = path or os.environ.get("TRAVEL_CATALOG", CATALOG_PATH)
+    mtime = os.stat(path).st_mtime_ns
+    with _shared_lock:
+        cached = _shared.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = _shared[path] = (mtime, load_catalog(path))
+        return cached[1]
@@ -0,0 +1,102 @@
+import threading
+
+import numpy as np
+
+# --- 관광지 공간 색인 ---
+# 지도에서 보이는 범위(bounds)와 확대 수준(zoom)으로 그 안의 관광지만 꺼내는 격자 색인
+# 확대 수준마다 지구를 같은 크기(타일 한 장 = CELLS_PER_TILE x CELLS_PER_TILE칸, 한 칸이 화면에서 약 64px)의 칸으로 나누고
+# 칸 번호(행 x 열 수 + 열) 순으로 관광지를 정렬해 둠 -> 보이는 범위의 행마다 이진 탐색 두 번으로 칸 구간을 찾음
+# 보이는 칸 수는 화면 크기로 정해지므로 (카탈로그 크기와 무관) 돌려주는 양도 화면 크기로 제한됨
+#   관광지가 max_markers개 이하이면 관광지 하나하나를, 넘으면 칸별로 묶은 클러스터(중심, 개수)를 돌려줌
+# 수준별 격자는 처음 쓰일 때 한 번 만들어 모든 세션이 함께 씀
+
+CELLS_PER_TILE = 4  # 256px 타일 한 장을 4 x 4칸으로 (한 칸 약 64px)
+MAX_ZOOM = 18
+MAX_MARKERS = 300  # 이보다 많으면 클러스터로 묶음
+
+
+class _Level:
+    def __init__(self, lat, lon, zoom):
+        self.size = 360.0 / (2**zoom * CELLS_PER_TILE)  # 칸 한 변 (도)
+        self.n_cols = 2**zoom * CELLS_PER_TILE
+        keys = self.cell(lat, lon)
+        self.order = np.argsort(keys, kind="stable").astype(np.int32)
+        keys = keys[self.order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if keys.size else np.empty(0, dtype=np.int64)
+        self.keys = keys[starts]
+        self.indptr = np.append(starts, keys.size)
+        self.count = np.diff(self.indptr)
+        if keys.size:
+            self.lat = np.add.reduceat(lat[self.order], starts) / self.count
+            self.lon = np.add.reduceat(lon[self.order], starts) / self.count
+        else:
+            self.lat = self.lon = np.empty(0)
+
+    def cell(self, lat, lon):
+        rows = np.floor((np.clip(lat, -90, 90) + 90) / self.size).astype(np.int64)
+        cols = np.minimum(np.floor((np.clip(lon, -180, 180) + 180) / self.size).astype(np.int64), self.n_cols - 1)
+        return rows * self.n_cols + cols
+
+    # (남, 서, 북, 동) 범위와 겹치는 칸 번호들
+    def cells_in(self, south, west, north, east):
+        (low,), (high,) = self.cell(np.array([south]), np.array([west])), self.cell(np.array([north]), np.array([east]))
+        row_lo, col_lo = divmod(int(low), self.n_cols)
+        row_hi, col_hi = divmod(int(high), self.n_cols)
+        rows = np.arange(row_lo, row_hi + 1, dtype=np.int64) * self.n_cols
+        lo = np.searchsorted(self.keys, rows + col_lo)
+        hi = np.searchsorted(self.keys, rows + col_hi, "right")
+        lengths = hi - lo
+        return np.repeat(lo - np.cumsum(lengths) + lengths, lengths) + np.arange(int(lengths.sum()))
+
+    # 칸들에 든 관광지 번호
+    def members(self, cells):
+        starts, lengths = self.indptr[cells], self.count[cells]
+        entries = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(int(lengths.sum()))
+        return self.order[entries]
+
+
+class GeoIndex:
+    def __init__(self, lat, lon):
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self._levels = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_spots(cls, spots):
+        spots = list(spots)
+        return cls([s["lat"] for s in spots], [s["lon"] for s in spots])
+
+    def __len__(self):
+        return self.lat.size
+
+    def level(self, zoom):
+        zoom = min(max(int(zoom), 0), MAX_ZOOM)
+        with self._lock:
+            level = self._levels.get(zoom)
+            if level is None:
+                level = self._levels[zoom] = _Level(self.lat, self.lon, zoom)
+            return level
+
+    # 보이는 범위 (남, 서, 북, 동)의 관광지 -> (관광지 번호 배열, 클러스터 배열 [[위도, 경도, 개수], ...])
+    # 클러스터로 묶을 때도 관광지가 하나뿐인 칸은 관광지로 돌려줌
+    def query(self, bounds, zoom, max_markers=MAX_MARKERS):
+        south, west, north, east = bounds
+        if west > east:  # 날짜 변경선을 넘는 범위는 전체 경도로 봄
+            west, east = -180.0, 180.0
+        level = self.level(zoom)
+        cells = level.cells_in(south, west, north, east)
+        if int(level.count[cells].sum()) > max_markers and zoom < MAX_ZOOM:
+            single = level.count[cells] == 1
+            grouped = cells[~single]
+            clusters = np.column_stack([level.lat[grouped], level.lon[grouped], level.count[grouped]])
+            # 가장자리 칸은 범위 밖까지 걸치므로 중심이 범위 안에 있는 클러스터만 남김
+            clusters = clusters[(clusters[:, 0] >= south) & (clusters[:, 0] <= north)
+                                & (clusters[:, 1] >= west) & (clusters[:, 1] <= east)]
+            points = level.members(cells[single])
+        else:
+            clusters = np.empty((0, 3))
+            points = level.members(cells)
+        inside = (self.lat[points] >= south) & (self.lat[points] <= north) & (self.lon[points] >= west) & (self.lon[points] <= east)
+        return np.sort(points[inside]), clusters
+
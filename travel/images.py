@@ -0,0 +1,207 @@
+import hashlib
+import io
+import os
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageOps
+
+from utils.singleflight import SingleFlight
+
+# --- 관광지 이미지 프록시 ---
+# 원격 이미지(나무위키, 위키미디어 등)를 원본 주소마다 한 번만 받아 WebP 썸네일로 줄여 로컬 캐시에 저장하고
+# 페이지는 캐시된 파일을 보여 줌 (재실행이나 다른 세션에서는 네트워크를 쓰지 않음)
+# 캐시에 없으면 페이지를 기다리게 하지 않고 원본 주소를 바로 돌려준 뒤(브라우저가 직접 받음)
+# 백그라운드 작업 스레드(FETCH_WORKERS개)에서 받아 썸네일을 만들어 둠 -> 다음 재실행부터 썸네일을 보여 줌
+# 캐시는 내용 주소 방식:
+#   refs/<주소의 sha256>               원본 내용의 sha256 (이 주소는 이미 받았음을 뜻함)
+#   sources/<내용 sha256>              원본 (다른 너비의 썸네일이 필요해도 다시 받지 않음)
+#   thumbs/<내용 sha256>_<너비>.webp   썸네일 (같은 이미지를 여러 주소가 가리켜도 하나만 저장)
+# 받지 못한 이미지도 원본 주소를 그대로 돌려주고 RETRY_AFTER초 동안 다시 받지 않음
+# TRAVEL_IMAGE_FIXTURES 디렉터리를 주면 네트워크 대신 그 안에서 주소의 파일 이름으로 이미지를 찾음 (시험용)
+# 사용 예:
+#   TRAVEL_IMAGE_FIXTURES=/path/to/images streamlit run main.py
+
+IMAGE_CACHE_DIR = os.environ.get(
+    "TRAVEL_IMAGE_CACHE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "images"),
+)
+THUMB_WIDTH = 800  # 화면에서 400px로 보여도 고해상도 화면에서 흐리지 않도록 두 배로 저장
+WEBP_QUALITY = 80
+FETCH_TIMEOUT = 10
+FETCH_WORKERS = 4
+RETRY_AFTER = 300
+USER_AGENT = "Mozilla/5.0 (travel-guide image cache)"
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def fetch_url(url, timeout=FETCH_TIMEOUT):
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+
+# 네트워크 대신 디렉터리에서 주소의 마지막 경로 조각(디코딩한 파일 이름)으로 이미지를 찾음
+class FixtureFetcher:
+    def __init__(self, directory):
+        if not os.path.isdir(directory):
+            raise ValueError(f"이미지 디렉터리가 없습니다: {directory}")
+        self.directory = directory
+
+    def __call__(self, url):
+        name = urllib.parse.unquote(os.path.basename(urllib.parse.urlparse(url).path))
+        with open(os.path.join(self.directory, name), "rb") as f:
+            return f.read()
+
+
+class ImageCache:
+    def __init__(self, root=IMAGE_CACHE_DIR, fetch=fetch_url, width=THUMB_WIDTH, quality=WEBP_QUALITY,
+                 retry_after=RETRY_AFTER):
+        self.root = root
+        self.fetch = fetch
+        self.width = width
+        self.quality = quality
+        self.retry_after = retry_after
+        self.fetched = 0  # 원본을 실제로 받은 횟수
+        self.errors = {}  # 주소 -> 마지막 오류 메시지
+        self._failed_at = {}
+        self._known = {}  # (주소, 너비) -> 썸네일 경로 (이미 준비한 것은 디스크도 보지 않음)
+        self._pending = set()  # 백그라운드에서 준비 중인 (주소, 너비)
+        self._flight = SingleFlight()  # 같은 주소의 원본은 너비가 달라도 한 번만 받음
+        self._pool = ThreadPoolExecutor(FETCH_WORKERS, thread_name_prefix="image-cache")
+        self._lock = threading.Lock()
+        for name in ("refs", "sources", "thumbs"):
+            os.makedirs(os.path.join(root, name), exist_ok=True)
+
+    def _ref_path(self, url):
+        return os.path.join(self.root, "refs", _sha256(url.encode("utf-8")))
+
+    def _source_path(self, digest):
+        return os.path.join(self.root, "sources", digest)
+
+    def _thumb_path(self, digest, width):
+        return os.path.join(self.root, "thumbs", f"{digest}_{width}.webp")
+
+    # 임시 파일에 쓰고 이름을 바꿔서 다른 세션이 반쯤 쓴 파일을 읽지 않게 함
+    @staticmethod
+    def _write(path, data):
+        temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp, "wb") as f:
+            f.write(data)
+        os.replace(temp, path)
+
+    def _resize(self, raw, width):
+        with Image.open(io.BytesIO(raw)) as image:
+            image = ImageOps.exif_transpose(image)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if image.mode in ("LA", "PA") or "transparency" in image.info else "RGB")
+            if image.width > width:
+                image = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+            out = io.BytesIO()
+            image.save(out, "WEBP", quality=self.quality, method=4)
+            return out.getvalue()
+
+    # 원본 주소가 가리키는 내용의 sha256 (아직 받지 않았으면 None)
+    def _digest(self, url):
+        ref = self._ref_path(url)
+        if not os.path.exists(ref):
+            return None
+        with open(ref) as f:
+            return f.read().strip()
+
+    # 디스크에 이미 있는 썸네일 경로 (없으면 None, 네트워크를 쓰지 않음)
+    def _on_disk(self, url, width):
+        digest = self._digest(url)
+        if digest is None:
+            return None
+        thumb = self._thumb_path(digest, width)
+        return thumb if os.path.exists(thumb) else None
+
+    # 원본을 받아 저장하고 주소가 그 내용을 가리키게 함 -> (내용 sha256, 원본)
+    def _download(self, url):
+        raw = self.fetch(url)
+        with self._lock:
+            self.fetched += 1
+        digest = _sha256(raw)
+        if not os.path.exists(self._source_path(digest)):
+            self._write(self._source_path(digest), raw)
+        self._write(self._ref_path(url), digest.encode("ascii"))
+        return digest, raw
+
+    def _load(self, url, width):
+        digest = self._digest(url)
+        if digest is not None and os.path.exists(self._thumb_path(digest, width)):
+            return self._thumb_path(digest, width)
+        if digest is not None and os.path.exists(self._source_path(digest)):
+            with open(self._source_path(digest), "rb") as f:
+                raw = f.read()
+        else:
+            (digest, raw), _ = self._flight.do(url, lambda: self._download(url))
+        thumb = self._thumb_path(digest, width)
+        if not os.path.exists(thumb):
+            self._write(thumb, self._resize(raw, width))
+        return thumb
+
+    # 백그라운드 작업: 받아서 썸네일을 만들고 결과(또는 오류)를 기록
+    def _fill(self, url, width):
+        try:
+            thumb = self._load(url, width)
+        except Exception as e:
+            with self._lock:
+                self._failed_at[url] = time.monotonic()
+                self.errors[url] = f"{type(e).__name__}: {e}"
+        else:
+            with self._lock:
+                self._known[(url, width)] = thumb
+                self._failed_at.pop(url, None)
+                self.errors.pop(url, None)
+        finally:
+            with self._lock:
+                self._pending.discard((url, width))
+
+    # 썸네일 파일 경로, 아직 없으면 원본 주소 (백그라운드에서 준비를 시작하고 기다리지 않음)
+    def source(self, url, width=None):
+        width = width or self.width
+        key = (url, width)
+        with self._lock:
+            known = self._known.get(key)
+            failed_at = self._failed_at.get(url)
+        if known is not None:
+            return known
+        # 다른 프로세스나 이전 실행이 만들어 둔 썸네일은 바로 씀
+        thumb = self._on_disk(url, width)
+        if thumb is not None:
+            with self._lock:
+                self._known[key] = thumb
+            return thumb
+        if failed_at is not None and time.monotonic() - failed_at < self.retry_after:
+            return url
+        with self._lock:
+            if key not in self._pending and key not in self._known:
+                self._pending.add(key)
+                self._pool.submit(self._fill, url, width)
+        return url
+
+    # 여러 이미지 -> {주소: 썸네일 경로 또는 원본 주소} (없는 것은 모두 백그라운드에서 함께 준비함)
+    def sources(self, urls, width=None):
+        return {url: self.source(url, width) for url in dict.fromkeys(urls)}
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+# 프로세스 공용 이미지 캐시 (TRAVEL_IMAGE_FIXTURES가 있으면 네트워크 대신 그 디렉터리를 씀)
+def shared_image_cache():
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            fixtures = os.environ.get("TRAVEL_IMAGE_FIXTURES")
+            _shared = ImageCache(fetch=FixtureFetcher(fixtures) if fixtures else fetch_url)
+        return _shared
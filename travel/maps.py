@@ -0,0 +1,107 @@
+import html
+import json
+import math
+import threading
+from collections import OrderedDict
+
+import folium
+from folium.plugins import FastMarkerCluster
+
+# --- 관광지 지도 ---
+# 관광지마다 folium.Marker를 만들면 지도 HTML에 마커마다 자바스크립트 코드가 붙어 관광지가 수만 개면 만들기도 그리기도 느림
+# 대신 [위도, 경도, 이름, 설명, 색] 행 목록 하나를 FastMarkerCluster 레이어로 넘기고 브라우저에서 마커를 만들어 묶음
+# 완성된 지도 HTML은 키(카탈로그 버전 등)별로 프로세스 전체가 공유하므로 찜 버튼처럼 지도와 무관한 재실행은
+# 지도를 다시 만들거나 직렬화하지 않고 같은 문자열을 그대로 내보냄
+
+FRANCE_CENTER = [46.603354, 1.888334]
+MAP_CACHE_SIZE = 8
+# 지역별 마커 색 (나머지 지역은 보라색)
+REGION_COLORS = {"파리": "red", "남프랑스": "blue", "프랑스 서부": "green"}
+
+# 행 [위도, 경도, 이름, 설명 첫 문장, 색 번호] 하나로 색이 있는 AwesomeMarkers 아이콘 마커를 만듦
+# (folium.Icon(color=...)과 같은 모양, 팝업은 이름과 설명의 첫 문장만이고 글자는 textContent로 넣어 HTML로 해석하지 않음)
+_MARKER_CALLBACK = """(function (palette) {
+    return function (row) {
+        var icon = L.AwesomeMarkers.icon({markerColor: palette[row[4]], icon: 'info-sign', prefix: 'glyphicon', iconColor: 'white'});
+        var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+        var popup = document.createElement('div');
+        var title = document.createElement('b');
+        title.textContent = row[2];
+        popup.appendChild(title);
+        popup.appendChild(document.createElement('br'));
+        popup.appendChild(document.createTextNode(row[3]));
+        marker.bindPopup(popup);
+        var tooltip = document.createElement('span');
+        tooltip.textContent = row[2];
+        marker.bindTooltip(tooltip);
+        return marker;
+    };
+})(%s)"""
+
+
+# 행마다 팝업 HTML과 색 이름을 넣지 않고 글자와 색 번호만 넣어 HTML 크기를 줄임
+def marker_layer(spots, colors=REGION_COLORS, default_color="purple"):
+    palette = sorted(set(colors.values()) | {default_color})
+    color_index = {color: i for i, color in enumerate(palette)}
+    rows = [
+        [round(spot["lat"], 5), round(spot["lon"], 5), spot["name"], spot["description"].split(".")[0],
+         color_index[colors.get(spot.get("region"), default_color)]]
+        for spot in spots
+    ]
+    return FastMarkerCluster(rows, callback=_MARKER_CALLBACK % json.dumps(palette), name="관광지", chunkedLoading=True)
+
+
+def spot_map(spots, colors=REGION_COLORS, default_color="purple", location=FRANCE_CENTER, zoom_start=6):
+    m = folium.Map(location=location, zoom_start=zoom_start)
+    marker_layer(spots, colors, default_color).add_to(m)
+    return m
+
+
+# 지도로 둘러보기: 보이는 범위의 관광지(번호)와 클러스터([[위도, 경도, 개수], ...], travel.geo.GeoIndex.query)만 담은 레이어
+# st_folium(feature_group_to_add=...)으로 넘기면 지도는 그대로 두고 이 레이어만 바뀜
+def viewport_layer(spots, points, clusters, colors=REGION_COLORS, default_color="purple"):
+    layer = folium.FeatureGroup(name="보이는 관광지")
+    for i in points:
+        spot = spots[i]
+        folium.Marker(
+            location=[spot["lat"], spot["lon"]],
+            popup=folium.Popup(f"<b>{html.escape(spot['name'])}</b><br>{html.escape(spot['description'].split('.')[0])}"),
+            tooltip=html.escape(spot["name"]),
+            icon=folium.Icon(color=colors.get(spot.get("region"), default_color)),
+        ).add_to(layer)
+    for lat, lon, count in clusters:
+        size = int(28 + 8 * math.log10(count))
+        folium.Marker(
+            location=[lat, lon],
+            tooltip=f"관광지 {int(count):,}곳 (확대하면 보입니다)",
+            icon=folium.DivIcon(
+                html=f'<div style="width:{size}px;height:{size}px;line-height:{size}px;border-radius:50%;'
+                     f'background:rgba(110,204,57,0.8);text-align:center;font:bold 12px sans-serif">{int(count):,}</div>',
+                icon_size=(size, size),
+                icon_anchor=(size // 2, size // 2),
+            ),
+        ).add_to(layer)
+    return layer
+
+
+# streamlit_folium.folium_static과 같은 HTML (Figure로 감싸서 렌더링)
+def render_html(m):
+    return folium.Figure().add_child(m).render()
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+# key에 해당하는 지도 HTML (없으면 build()로 만들어 최근 MAP_CACHE_SIZE개까지 보관)
+def cached_html(key, build):
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+    page = build()
+    with _cache_lock:
+        _cache[key] = page
+        while len(_cache) > MAP_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return page
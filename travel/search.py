@@ -0,0 +1,326 @@
+import math
+import re
+import unicodedata
+
+import numpy as np
+
+# --- 관광지 검색 색인 ---
+# 관광지 목록으로 역색인을 한 번 만들어 두고 모든 세션이 함께 씀 (목록을 매번 훑지 않음)
+#   이름, 지역: 한글을 자모로 풀어 3글자씩 자른 n-gram (오타가 몇 글자 있어도 대부분의 조각이 맞음)
+#   설명: 글자 2개씩 자른 n-gram (설명은 길어서 자모로 풀면 색인이 너무 커짐)
+#   이름의 초성: "ㅇㅍㅌ"처럼 자음만 입력해도 찾음
+# 자모로 풀기 때문에 "에펠ㅌ"처럼 마지막 글자를 입력하는 중이어도 찾고,
+# 된소리/예사소리, ㅐ/ㅔ처럼 표기가 흔히 갈리는 소리는 하나로 모아서 "몽마르트"로 "몽마르뜨"를 찾음
+# 색인은 정렬된 n-gram 키 배열과 CSR 형식의 게시 목록(NumPy)이라 후보 찾기는 키 몇 개의 이진 탐색과 배열 합산뿐이고,
+# 점수가 높은 후보 몇십 개만 이름과의 편집 거리로 다시 정렬함 ("루부르" -> "루브르 박물관")
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"  # 맨 앞은 받침 없음
+HANGUL_BASE = 0xAC00
+HANGUL_COUNT = 11172
+
+# 겹모음과 겹받침은 낱자로 나눔 (입력 중인 "왜"는 "ㅇㅗ"로 시작하므로)
+SPLIT = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+# 외래어 표기에서 자주 갈리는 소리는 같은 자모로 봄
+FOLD = {"ㄲ": "ㄱ", "ㄸ": "ㄷ", "ㅃ": "ㅂ", "ㅆ": "ㅅ", "ㅉ": "ㅈ", "ㅐ": "ㅔ", "ㅒ": "ㅖ"}
+
+FIELD_WEIGHTS = {"name": 3.0, "region": 2.0, "description": 1.0}
+MIN_COVERAGE = 0.5  # 검색어 n-gram 중 이 비율 이상이 맞으면 결과에 넣음
+FUZZY_COVERAGE = 0.25  # 이름/지역은 이 비율만 맞아도 후보로 보고, 이름과 충분히 비슷하면 결과에 넣음
+MIN_SIMILARITY = 0.75  # 1 - (이름 안에서 찾은 가장 가까운 부분과의 편집 거리 / 검색어 자모 수), 자모 4개당 한 글자 틀림
+MAX_DF = 0.2  # 이보다 많은 비율의 관광지에 나오는 n-gram은 검색에서 뺌 ("니다", "습니" 등)
+RERANK = 16  # 편집 거리로 다시 정렬할 상위 후보 수 (limit의 2배가 더 크면 그쪽을 씀)
+
+_SEPARATORS = re.compile(r"[\W_]+")
+_SHIFT = 21  # 유니코드 코드 포인트는 21비트 안에 들어감
+
+
+def _fold(jamo):
+    return "".join(FOLD.get(j, j) for j in "".join(SPLIT.get(c, c) for c in jamo))
+
+
+# str.translate용 표: 한글 음절 -> 자모(접은 것), 음절 -> 초성, 악센트 있는 라틴 문자 -> 악센트 없는 문자
+def _make_tables():
+    jamo, initials, plain = {}, {}, {}
+    for i in range(HANGUL_COUNT):
+        cho, jung, jong = CHOSEONG[i // 588], JUNGSEONG[i // 28 % 21], JONGSEONG[i % 28].strip()
+        jamo[HANGUL_BASE + i] = _fold(cho + jung + jong)
+        initials[HANGUL_BASE + i] = _fold(cho)
+    for c in set(CHOSEONG + JUNGSEONG) | set(SPLIT):
+        jamo[ord(c)] = initials[ord(c)] = _fold(c)
+    for cp in range(0xC0, 0x250):
+        base = "".join(ch for ch in unicodedata.normalize("NFKD", chr(cp)) if not unicodedata.combining(ch))
+        if base and base != chr(cp):
+            jamo[cp] = initials[cp] = plain[cp] = base.lower()
+    return jamo, initials, plain
+
+
+_JAMO, _INITIALS, _PLAIN = _make_tables()
+
+
+def _normalize(text, table):
+    return _SEPARATORS.sub(" ", str(text).lower().translate(table)).strip()
+
+
+# "에펠탑 🗼" -> "ㅇㅔㅍㅔㄹㅌㅏㅂ"
+def jamo(text):
+    return _normalize(text, _JAMO)
+
+
+# "에펠탑" -> "ㅇㅍㅌ"
+def initials(text):
+    return _normalize(text, _INITIALS)
+
+
+# 소문자로 바꾸고 악센트와 기호를 뺀 글자 그대로 (설명 색인용)
+def plain(text):
+    return _normalize(text, _PLAIN)
+
+
+# 초성(자음)만으로 된 검색어인지
+def is_initials(text):
+    letters = text.replace(" ", "")
+    return bool(letters) and all("ㄱ" <= c <= "ㅎ" for c in letters)
+
+
+# 검색어를 text 안 어디에서든 맞출 때의 최소 편집 거리 (Myers의 비트 병렬 알고리즘, 검색어 길이와 무관하게 글자당 한 번)
+def fuzzy_distance(pattern, text):
+    m = len(pattern)
+    if m == 0:
+        return 0
+    peq = {}
+    for i, c in enumerate(pattern):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = mask, 0, m
+    best = m
+    for c in text:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = (ph << 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+        best = min(best, score)
+    return best
+
+
+# 띄어쓰기를 뺀 검색어와 이름의 유사도 (이름에 그대로 들어 있으면 1)
+def similarity(query, name):
+    query, name = query.replace(" ", ""), name.replace(" ", "")
+    if not query:
+        return 0.0
+    if query in name:
+        return 1.0
+    return 1.0 - fuzzy_distance(query, name) / len(query)
+
+
+def _codes(text):
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+
+
+# 연속한 n개 코드 포인트를 하나의 정수 키로 묶음
+def _grams(codes, n):
+    if codes.size < n:
+        return np.empty(0, dtype=np.uint64)
+    keys = codes[: codes.size - n + 1].copy()
+    for k in range(1, n):
+        keys = (keys << np.uint64(_SHIFT)) | codes[k: codes.size - n + 1 + k]
+    return keys
+
+
+# n-gram 역색인: 정렬된 키, 키별 게시 목록(관광지 번호, 필드 가중치), 키별 IDF
+class _GramIndex:
+    def __init__(self, fields, n_docs, n):
+        self.n = n
+        self.n_docs = n_docs
+        all_keys, all_docs, all_weights = [], [], []
+        for texts, weight in fields:
+            # 관광지들을 줄바꿈으로 이어 붙여 한 번에 n-gram을 만들고 줄바꿈에서 시작하는 조각은 버림
+            # 줄 끝에서 시작해 줄바꿈을 넘는 조각("ㄴㅣ\n")은 남겨서 짧은 검색어가 텍스트의 마지막 글자도 찾게 함
+            # (검색어에는 줄바꿈이 없으므로 n글자 검색에는 영향이 없고, _prefix의 키 구간에만 들어감)
+            codes = _codes("\n".join(texts) + "\n" * (n - 1))
+            newline = codes == 10
+            doc = np.cumsum(newline)
+            keys = _grams(codes, n)
+            inside = ~newline[: keys.size]
+            all_keys.append(keys[inside])
+            all_docs.append(doc[: keys.size][inside].astype(np.int32))
+            all_weights.append(np.full(int(inside.sum()), weight, dtype=np.float32))
+        keys = np.concatenate(all_keys) if all_keys else np.empty(0, dtype=np.uint64)
+        docs = np.concatenate(all_docs) if all_docs else np.empty(0, dtype=np.int32)
+        weights = np.concatenate(all_weights) if all_weights else np.empty(0, dtype=np.float32)
+
+        # (키, 관광지)마다 한 번만 남기고 가중치는 가장 큰 필드의 것으로
+        order = np.lexsort((-weights, docs, keys))
+        keys, docs, weights = keys[order], docs[order], weights[order]
+        first = np.ones(keys.size, dtype=bool)
+        first[1:] = (keys[1:] != keys[:-1]) | (docs[1:] != docs[:-1])
+        keys, self.docs, self.weights = keys[first], docs[first], weights[first]
+
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if keys.size else np.empty(0, dtype=np.int64)
+        self.keys = keys[starts]
+        self.indptr = np.append(starts, keys.size)
+        self.df = np.diff(self.indptr)
+        self.idf = np.log1p(n_docs / np.maximum(self.df, 1)).astype(np.float32)
+        self.max_df = max(1, int(MAX_DF * n_docs))
+
+    @property
+    def nbytes(self):
+        arrays = (self.keys, self.indptr, self.df, self.docs, self.weights, self.idf)
+        return sum(a.nbytes for a in arrays)
+
+    # 검색어가 n글자보다 짧으면 그 글자들로 시작하는 모든 키의 게시 목록 (정렬된 키에서 연속 구간)
+    # 줄 끝을 넘는 조각도 색인에 있으므로 텍스트 맨 끝에 있는 글자("지베르니"의 "니")도 찾음
+    def _prefix(self, codes):
+        shift = np.uint64(_SHIFT * (self.n - codes.size))
+        low = np.uint64(0)
+        for code in codes:
+            low = (low << np.uint64(_SHIFT)) | code
+        low <<= shift
+        lo, hi = np.searchsorted(self.keys, [low, low + (np.uint64(1) << shift)])
+        return self.indptr[lo], self.indptr[hi]
+
+    # 검색어의 n-gram이 min_coverage 이상 맞는 관광지 -> (번호 배열, 점수 배열, 맞은 비율 배열), 번호 순
+    # 점수 = 맞은 n-gram의 (필드 가중치 x IDF) 합 / 검색어 n-gram의 IDF 합
+    # 후보가 수만 개여도 정렬하지 않도록 관광지 수 길이의 배열에 bincount로 세고 조건을 넘는 것만 꺼냄
+    def match(self, text, min_coverage=MIN_COVERAGE):
+        empty = np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32), np.empty(0, dtype=np.float32)
+        codes = _codes(text)
+        if codes.size == 0 or self.keys.size == 0:
+            return empty
+        if codes.size < self.n:
+            lo, hi = self._prefix(codes)
+            scores = np.zeros(self.n_docs, dtype=np.float32)
+            np.maximum.at(scores, self.docs[lo:hi], self.weights[lo:hi])
+            docs = np.flatnonzero(scores)
+            return docs, scores[docs], np.ones(docs.size, dtype=np.float32)
+
+        grams = np.unique(_grams(codes, self.n))
+        positions = np.minimum(np.searchsorted(self.keys, grams), self.keys.size - 1)
+        found = self.keys[positions] == grams
+        df = np.where(found, self.df[positions], 0)
+        # 거의 모든 관광지에 나오는 n-gram은 빼되, 검색어가 그런 n-gram뿐이면 그대로 씀
+        common = found & (df > self.max_df)
+        if common.all():
+            common[:] = False
+        found &= ~common
+        max_idf = math.log1p(self.n_docs)
+        total = float(np.where(found, self.idf[positions], max_idf)[~common].sum())
+        n_grams = int((~common).sum())
+        need = max(1, math.ceil(min_coverage * n_grams))
+        if found.sum() < need:
+            return empty
+
+        # 맞은 n-gram들의 게시 목록을 이어 붙여 관광지별로 맞은 개수와 점수를 셈
+        slots = positions[found]
+        starts, lengths = self.indptr[slots], self.df[slots]
+        entries = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(int(lengths.sum()))
+        docs = self.docs[entries]
+        hits = np.bincount(docs, minlength=self.n_docs)
+        keep = np.flatnonzero(hits >= need)
+        contributions = self.weights[entries] * np.repeat(self.idf[slots], lengths)
+        scores = np.bincount(docs, contributions, minlength=self.n_docs)[keep] / total
+        return keep, scores.astype(np.float32), (hits[keep] / n_grams).astype(np.float32)
+
+
+# 여러 색인의 결과를 관광지별로 합침 (점수는 더하고 맞은 비율은 큰 것)
+def _merge(first, second):
+    if first[0].size == 0 or second[0].size == 0:
+        return first if second[0].size == 0 else second
+    docs, inverse = np.unique(np.concatenate([first[0], second[0]]), return_inverse=True)
+    scores = np.bincount(inverse, np.concatenate([first[1], second[1]]), minlength=docs.size)
+    coverage = np.zeros(docs.size, dtype=np.float32)
+    np.maximum.at(coverage, inverse, np.concatenate([first[2], second[2]]))
+    return docs, scores, coverage
+
+
+# 관광지(name, region, description 키를 가진 딕셔너리) 목록의 검색 색인
+class SpotIndex:
+    def __init__(self, spots, weights=FIELD_WEIGHTS):
+        self.spots = list(spots)
+        n = len(self.spots)
+        names = [str(s.get("name", "")) for s in self.spots]
+        names_jamo = [jamo(name) for name in names]
+        names_initials = [initials(name) for name in names]
+        # 유사도 계산용 (띄어쓰기 뺀 것)
+        self._names = [name.replace(" ", "") for name in names_jamo]
+        self._name_initials = [name.replace(" ", "") for name in names_initials]
+        self._jamo = _GramIndex(
+            [(names_jamo, weights["name"]), ([jamo(s.get("region", "")) for s in self.spots], weights["region"])],
+            n, 3,
+        )
+        self._text = _GramIndex([([plain(s.get("description", "")) for s in self.spots], weights["description"])], n, 2)
+        self._initials = _GramIndex([(names_initials, weights["name"])], n, 2)
+
+    def __len__(self):
+        return len(self.spots)
+
+    @property
+    def nbytes(self):
+        return self._jamo.nbytes + self._text.nbytes + self._initials.nbytes
+
+    # 검색어와 가장 잘 맞는 관광지 번호를 점수 순으로 최대 limit개
+    def search(self, query, limit=20):
+        return [i for i, _ in self.search_scored(query, limit)]
+
+    # [(관광지 번호, 점수)]: 이름과 충분히 비슷한 관광지를 유사도 순으로 먼저, 같으면 n-gram 점수 순
+    # (점수 = 이름 유사도 + n-gram 점수 + 이름이 검색어로 시작하거나 같으면 가산점)
+    def search_scored(self, query, limit=20):
+        query_jamo = jamo(query)
+        if not query_jamo:
+            return []
+        compact = query_jamo.replace(" ", "")
+        if is_initials(query_jamo):
+            # 초성 검색은 오타를 허용하지 않음: 모든 조각이 맞고 이름의 초성에 그대로 들어 있어야 함
+            docs, scores, _ = self._initials.match(query_jamo, 1.0)
+            coverage = np.zeros(docs.size, dtype=np.float32)
+            return self._rank(docs, scores, coverage, compact, self._name_initials, 1.0, limit)[0]
+
+        # 이름/지역은 n-gram이 절반 이상 맞는 것부터 보고, 결과가 limit개가 안 되는데 이름이 검색어와 충분히
+        # 비슷한 것도 없을 때만 오타를 더 허용한 후보까지 봄 (긴 이름은 한두 글자 틀려도 절반 이상 맞으므로
+        # 주로 짧은 검색어에서 일어남, 세는 것은 한 번이고 기준만 바꿈)
+        loose = self._jamo.match(query_jamo, FUZZY_COVERAGE)
+        strict = loose[2] >= MIN_COVERAGE
+        text_match = self._text.match(plain(query), MIN_COVERAGE)
+        merged = _merge(tuple(a[strict] for a in loose), text_match)
+        ranked, close = self._rank(*merged, compact, self._names, MIN_SIMILARITY, limit)
+        if not close and merged[0].size < limit and not strict.all():
+            ranked, _ = self._rank(*_merge(loose, text_match), compact, self._names, MIN_SIMILARITY, limit)
+        return ranked
+
+    # 점수가 높은 후보 몇 개만 이름 유사도로 다시 매김 -> ([(번호, 점수)], 이름이 충분히 비슷한 결과가 있는지)
+    def _rank(self, docs, scores, coverage, compact, names, min_similarity, limit):
+        if docs.size == 0:
+            return [], False
+        top = min(docs.size, max(RERANK, limit * 2))
+        best = np.argpartition(-scores, top - 1)[:top] if top < docs.size else np.arange(docs.size)
+        ranked, close = [], False
+        for j in best:
+            i = int(docs[j])
+            name = names[i]
+            match = similarity(compact, name)
+            if match < min_similarity:
+                if coverage[j] < MIN_COVERAGE:
+                    continue
+                match = 0.0
+            else:
+                close = True
+            score = match + float(scores[j]) + 0.5 * name.startswith(compact) + 0.5 * (name == compact)
+            ranked.append((-match, -score, len(name), i))
+        ranked.sort()
+        return [(i, -score) for _, score, _, i in ranked[:limit]], close
+
@@ -0,0 +1,84 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+# 값이 차지하는 메모리 크기 추정 (NumPy 배열, pandas 객체, 그리고 이들의 튜플/리스트/딕셔너리)
+def estimate_nbytes(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if hasattr(value, "memory_usage"):  # pandas DataFrame / Series
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_nbytes(v) for v in value)
+    return 64
+
+
+# 메모리 한도가 있는 LRU 캐시
+# 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 지움
+# Streamlit은 세션마다 스레드를 쓰므로 잠금(lock)으로 보호함
+class ByteLRUCache:
+    def __init__(self, max_bytes, max_entries=None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    # 현재 들어 있는 키 목록 (사본, 오래 사용하지 않은 것부터)
+    def keys(self):
+        with self._lock:
+            return list(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+
+    def put(self, key, value, nbytes=None):
+        nbytes = estimate_nbytes(value) if nbytes is None else nbytes
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            # 한 항목이 한도보다 크면 저장하지 않음
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes or (
+                self.max_entries is not None and len(self._entries) > self.max_entries
+            ):
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+
+    # 캐시에 있으면 꺼내고, 없으면 compute()로 계산해서 저장
+    def get_or_compute(self, key, compute):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+_MISSING = object()
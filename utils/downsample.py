@@ -0,0 +1,29 @@
+import numpy as np
+
+
+# 최소/최대 다운샘플링: n개의 점을 n_out // 2개 구간으로 나누고 구간마다 최솟값과 최댓값 위치를 남김
+# (값의 범위가 그대로 유지되므로 화면 폭만큼만 보내도 선의 위아래 끝이 잘리지 않음)
+# values가 (점 수, 열 수) 배열이면 열마다 따로 고른 인덱스를 (남길 점 수, 열 수) 배열로 반환 (열마다 오름차순)
+# 반복문 없이 배열 모양만 바꿔 한꺼번에 계산하고 NaN은 건너뜀
+def minmax_indices(values, n_out):
+    values = np.asarray(values, dtype=float)
+    squeeze = values.ndim == 1
+    if squeeze:
+        values = values[:, None]
+    n, n_cols = values.shape
+    if n <= n_out or n_out < 2:
+        indices = np.repeat(np.arange(n)[:, None], n_cols, axis=1)
+        return indices[:, 0] if squeeze else indices
+
+    size = -(-n // (n_out // 2))  # 구간 하나의 점 수 (올림)
+    n_buckets = -(-n // size)
+    padded = np.full((n_buckets * size, n_cols), np.nan)
+    padded[:n] = values
+    blocks = padded.reshape(n_buckets, size, n_cols)
+    missing = np.isnan(blocks)
+    low = np.where(missing, np.inf, blocks).argmin(axis=1)
+    high = np.where(missing, -np.inf, blocks).argmax(axis=1)
+    offsets = (np.arange(n_buckets) * size)[:, None]
+    # 마지막 구간이 전부 채움값이면 argmin이 0을 주므로 범위를 넘지 않음
+    indices = np.sort(np.concatenate([low + offsets, high + offsets]), axis=0)
+    return indices[:, 0] if squeeze else indices
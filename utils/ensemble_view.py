@@ -0,0 +1,49 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+from physics.ensemble import PERCENTILES
+
+# 분포 종류 (화면 표시 이름 -> 내부 이름)
+DISTRIBUTION_NAMES = {
+    "고정값": "fixed",
+    "균등 분포": "uniform",
+    "정규 분포": "normal",
+    "로그정규 분포": "lognormal",
+}
+
+
+# 분포 종류와 그 분포의 모수를 입력받는 위젯 묶음 -> (분포 이름, 모수 딕셔너리)
+def distribution_input(label, min_value, max_value, value, step, key, container=st, default="고정값"):
+    kind_name = container.selectbox(f"{label} 분포", list(DISTRIBUTION_NAMES.keys()),
+                                    index=list(DISTRIBUTION_NAMES.keys()).index(default), key=f"{key}_dist")
+    kind = DISTRIBUTION_NAMES[kind_name]
+    spread_max = float(max_value - min_value) / 2
+    if kind == "fixed":
+        params = {"value": container.slider(label, min_value, max_value, value, step, key=f"{key}_value")}
+    elif kind == "uniform":
+        low, high = container.slider(f"{label} 범위", min_value, max_value, (min_value, value), step, key=f"{key}_range")
+        params = {"low": low, "high": high}
+    elif kind == "normal":
+        params = {
+            "mean": container.slider(f"{label} 평균", min_value, max_value, value, step, key=f"{key}_mean"),
+            "std": container.slider(f"{label} 표준편차", 0.0, spread_max, spread_max / 5, step, key=f"{key}_std"),
+        }
+    else:
+        params = {
+            "median": container.slider(f"{label} 중앙값", min_value, max_value, value, step, key=f"{key}_median"),
+            "sigma": container.slider(f"{label} 로그 표준편차", 0.0, 1.0, 0.2, 0.01, key=f"{key}_sigma"),
+        }
+    return kind, params
+
+
+# 백분위수 띠 그래프: 5~95% 바깥 띠, 25~75% 안쪽 띠, 중앙값 선
+def percentile_band_figure(times, bands, title, y_label, color="31, 119, 180", height=400):
+    low, q1, median, q3, high = (bands[p] for p in PERCENTILES)
+    fig = go.Figure()
+    for lower, upper, name, alpha in ((low, high, "5~95%", 0.15), (q1, q3, "25~75%", 0.35)):
+        fig.add_trace(go.Scatter(x=times, y=upper, mode="lines", line=dict(width=0), showlegend=False, hoverinfo="skip"))
+        fig.add_trace(go.Scatter(x=times, y=lower, mode="lines", line=dict(width=0), fill="tonexty",
+                                 fillcolor=f"rgba({color}, {alpha})", name=name))
+    fig.add_trace(go.Scatter(x=times, y=median, mode="lines", line=dict(color=f"rgb({color})", width=2), name="중앙값"))
+    fig.update_layout(title=title, xaxis_title="시간 (s)", yaxis_title=y_label, height=height, hovermode="x unified")
+    return fig
@@ -0,0 +1,24 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from utils.downsample import minmax_indices
+
+
+# WebGL(Scattergl) 선 그래프: 열마다 최소/최대 다운샘플링으로 max_points개 이하의 점만 보냄
+# frame은 날짜 인덱스, 계열별 열의 DataFrame -> (그림, 계열마다 보낸 점 수)
+def downsampled_line_figure(frame, max_points, y_label=None, height=450):
+    values = frame.to_numpy(dtype=float)
+    dates = frame.index.to_numpy()
+    indices = minmax_indices(values, max_points)
+    fig = go.Figure()
+    for j, name in enumerate(frame.columns):
+        rows = indices[:, j]
+        fig.add_trace(go.Scattergl(x=dates[rows], y=values[rows, j], mode="lines", name=str(name)))
+    fig.update_layout(
+        height=height,
+        yaxis_title=y_label,
+        hovermode="x unified",
+        margin=dict(l=10, r=10, t=30, b=10),
+        legend=dict(orientation="h", y=-0.15),
+    )
+    return fig, int(indices.shape[0]) if values.size else 0
@@ -0,0 +1,31 @@
+import threading
+
+
+# 같은 키로 동시에 들어온 호출은 첫 호출만 fn을 실행하고 나머지는 그 결과(또는 예외)를 함께 받음
+# do()는 (결과, 다른 호출의 결과를 받았는지)를 반환
+# 시세 요청 계층(stocks.fetch)과 관광지 이미지 캐시(travel.images)가 함께 씀
+class SingleFlight:
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {"done": threading.Event(), "result": None, "error": None}
+        if leader:
+            try:
+                call["result"] = fn()
+            except BaseException as e:
+                call["error"] = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call["done"].set()
+        else:
+            call["done"].wait()
+        if call["error"] is not None:
+            raise call["error"]
+        return call["result"], not leader